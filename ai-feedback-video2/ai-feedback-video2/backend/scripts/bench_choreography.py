@@ -0,0 +1,273 @@
+#!/usr/bin/env python
+"""
+bench_choreography.py
+---------------------
+Micro-benchmark of phrase matching in calculate_choreography on a synthetic
+narration, comparing the linear scans with the per-file TokenIndex:
+  python backend/scripts/bench_choreography.py
+  python backend/scripts/bench_choreography.py --words 20000 --phrases 500
+
+Both paths must return identical windows and start frames; the script exits
+non-zero if they ever disagree. The linear scans live here as the reference
+baseline; calculate_choreography only uses the index. The final rows time
+the single-pass alignment of an ordered slide's phrases
+(phrase_alignment.align_phrases) against the per-phrase greedy search it
+replaced in build_block_highlights, once on the normal narration and once
+on one made only of common words, where no rare bigram anchors the band
+and align_phrases falls back to the greedy search.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.scripts.calculate_choreography import (  # noqa: E402
+    TokenIndex,
+    normalize_token,
+    tokenize_phrase,
+)
+from backend.scripts.phrase_alignment import align_phrases, greedy_alignments  # noqa: E402
+
+VOCABULARY = (
+    "the a you your we to of and in on for with that this it was is be not but "
+    "inventory update service layer stale query mismatch customers transaction "
+    "boundary stock levels reasoning structured business rules validation price "
+    "difference tracing database cache request response latency index order "
+    "payment refund report dashboard schema migration deadlock retry queue "
+    "worker batch session feedback summary thinking advice step approach ideal"
+).split()
+
+
+def synthetic_words(
+    count: int,
+    rng: random.Random,
+    vocabulary: Tuple[str, ...] | List[str] = VOCABULARY,
+) -> List[Dict[str, Any]]:
+    """Frame-domain word timings shaped like convert_word_timings_to_frames output."""
+    words = []
+    frame = 0
+    for _ in range(count):
+        word = rng.choice(vocabulary)
+        duration = rng.randint(4, 12)
+        if rng.random() < 0.08:
+            word += rng.choice([",", ".", "?"])
+        words.append(
+            {"word": word, "startFrame": frame, "endFrame": frame + duration, "durationFrames": duration}
+        )
+        frame += duration + rng.randint(0, 3)
+    return words
+
+
+def synthetic_phrases(words: List[Dict[str, Any]], count: int, rng: random.Random) -> List[str]:
+    """Slices of the narration, some with an extra word dropped in, plus a few that never match."""
+    phrases = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.1:
+            phrases.append("completely unrelated bullet text")
+            continue
+        length = rng.randint(3, 14)
+        start = rng.randrange(0, len(words) - length)
+        chunk = [w["word"] for w in words[start:start + length]]
+        if roll < 0.4:
+            chunk.pop(rng.randrange(1, len(chunk)))
+        phrases.append(" ".join(chunk))
+    return phrases
+
+
+def ordered_phrases(words: List[Dict[str, Any]], count: int, rng: random.Random) -> List[str]:
+    """Bullets in narration order, each paraphrased a little (one word dropped, one swapped)."""
+    stride = max(len(words) // max(count, 1), 1)
+    phrases = []
+    for k in range(count):
+        length = min(rng.randint(6, 14), stride)
+        start = k * stride + rng.randrange(0, max(stride - length, 1))
+        chunk = [w["word"] for w in words[start:start + length]]
+        if len(chunk) > 3 and rng.random() < 0.5:
+            chunk.pop(rng.randrange(1, len(chunk)))
+            chunk[rng.randrange(0, len(chunk))] = "paraphrased"
+        phrases.append(" ".join(chunk))
+    return phrases
+
+
+def linear_phrase_window(
+    tokens: List[str],
+    phrase_tokens: List[str],
+    start_token_idx: int = 0,
+    max_gap: int = 4,
+) -> Optional[Tuple[int, int]]:
+    """Linear reference scan (the pre-index matcher); TokenIndex.find_window must return the same windows."""
+    if not phrase_tokens:
+        return None
+    n = len(tokens)
+    m = len(phrase_tokens)
+    i = start_token_idx
+    while i < n:
+        if tokens[i] != phrase_tokens[0]:
+            i += 1
+            continue
+        j = 0
+        k = i
+        last_match = i
+        start_match = None
+        while k < n and j < m:
+            if tokens[k] == phrase_tokens[j]:
+                if start_match is None:
+                    start_match = k
+                last_match = k
+                j += 1
+            elif start_match is not None and (k - last_match) > max_gap:
+                break
+            k += 1
+        if j == m and start_match is not None:
+            return start_match, last_match
+        i += 1
+    return None
+
+
+def linear_phrase_windows(
+    tokens: List[str],
+    phrase_tokens: List[str],
+    start_token_idx: int = 0,
+    max_gap: int = 4,
+    max_matches: int = 3,
+) -> List[Tuple[int, int]]:
+    matches: List[Tuple[int, int]] = []
+    search_idx = start_token_idx
+    while len(matches) < max_matches and search_idx < len(tokens):
+        window = linear_phrase_window(tokens, phrase_tokens, search_idx, max_gap)
+        if not window:
+            break
+        matches.append(window)
+        search_idx = window[1] + 1
+    return matches
+
+
+def linear_phrase_start(word_timings: List[Dict[str, Any]], phrase: str, start_frame: int) -> Optional[int]:
+    """find_phrase_in_words as it was before TokenIndex: re-normalize, then scan."""
+    phrase_tokens = tokenize_phrase(phrase)
+    if not phrase_tokens:
+        return None
+    tokens = []
+    for entry in word_timings:
+        if entry["startFrame"] >= start_frame:
+            token = normalize_token(entry.get("word", ""))
+            if token:
+                tokens.append((token, entry["startFrame"]))
+    for i in range(len(tokens) - len(phrase_tokens) + 1):
+        if all(tokens[i + j][0] == tok for j, tok in enumerate(phrase_tokens)):
+            return tokens[i][1]
+    return None
+
+
+def timed(fn: Callable[[], Any]) -> tuple:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark choreography phrase matching")
+    parser.add_argument("--words", type=int, default=10_000)
+    parser.add_argument("--phrases", type=int, default=300)
+    parser.add_argument("--anchors", type=int, default=50, help="Short find_phrase_in_words lookups")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    words = synthetic_words(args.words, rng)
+    phrases = synthetic_phrases(words, args.phrases, rng)
+    anchors = [
+        (" ".join(w["word"] for w in words[i:i + 2]), rng.randint(0, words[-1]["startFrame"]))
+        for i in (rng.randrange(0, len(words) - 2) for _ in range(args.anchors))
+    ]
+    phrase_tokens = [tokenize_phrase(p) for p in phrases]
+
+    def linear_windows() -> List:
+        tokens = [t for t in (normalize_token(w["word"]) for w in words) if t]
+        return [linear_phrase_windows(tokens, pt) for pt in phrase_tokens]
+
+    def indexed_windows() -> List:
+        index = TokenIndex(words)
+        return [index.find_windows(pt) for pt in phrase_tokens]
+
+    def linear_anchors() -> List:
+        return [linear_phrase_start(words, phrase, frame) for phrase, frame in anchors]
+
+    def indexed_anchors() -> List:
+        index = TokenIndex(words)
+        return [index.find_phrase_start(phrase, frame) for phrase, frame in anchors]
+
+    slide_phrases = [tokenize_phrase(p) for p in ordered_phrases(words, args.phrases, rng)]
+
+    def greedy_slide() -> int:
+        index = TokenIndex(words)
+        found, search_idx = 0, 0
+        for pt in slide_phrases:
+            windows = index.find_windows(pt, start_token_idx=search_idx)
+            if windows:
+                found += 1
+                search_idx = windows[0][1] + 1
+        return found
+
+    def aligned_slide() -> int:
+        index = TokenIndex(words)
+        return sum(1 for a in align_phrases(index.tokens, slide_phrases, index.positions) if a.confident)
+
+    build_sec, _ = timed(lambda: TokenIndex(words))
+    rows = [
+        ("block phrase windows", len(phrases), linear_windows, indexed_windows),
+        ("phrase start anchors", len(anchors), linear_anchors, indexed_anchors),
+    ]
+
+    print("\n" + "=" * 64)
+    print(f"CHOREOGRAPHY MATCHING — {len(words)} words, index build {build_sec * 1000:.1f} ms")
+    print("=" * 64)
+    ok = True
+    for label, count, linear, indexed in rows:
+        linear_sec, expected = timed(linear)
+        indexed_sec, actual = timed(indexed)
+        same = expected == actual
+        ok = ok and same
+        print(
+            f"  {label:<22} {count:>5} lookups  linear {linear_sec * 1000:9.1f} ms  "
+            f"indexed {indexed_sec * 1000:8.1f} ms  {linear_sec / max(indexed_sec, 1e-9):6.1f}x"
+            f"{'' if same else '  MISMATCH'}"
+        )
+    matched = sum(1 for windows in indexed_windows() if windows)
+    print(f"  {matched}/{len(phrases)} block phrases matched")
+    greedy_sec, greedy_found = timed(greedy_slide)
+    aligned_sec, aligned_found = timed(aligned_slide)
+    print(
+        f"  ordered slide, {len(slide_phrases)} paraphrased phrases: greedy {greedy_sec * 1000:.1f} ms "
+        f"({greedy_found} placed), single-pass alignment {aligned_sec * 1000:.1f} ms ({aligned_found} placed)"
+    )
+
+    # Ten filler words: every bigram is frequent, so the alignment has no anchors.
+    common = synthetic_words(min(args.words, 3000), rng, VOCABULARY[:10])
+    common_index = TokenIndex(common)
+    common_phrases = [tokenize_phrase(p) for p in ordered_phrases(common, min(args.phrases, 40), rng)]
+    greedy_sec, greedy = timed(lambda: greedy_alignments(common_index.positions, common_phrases))
+    aligned_sec, aligned = timed(lambda: align_phrases(common_index.tokens, common_phrases, common_index.positions))
+    same = aligned == greedy
+    ok = ok and same
+    print(
+        f"  anchorless slide, {len(common_phrases)} phrases: greedy {greedy_sec * 1000:.1f} ms, "
+        f"alignment {aligned_sec * 1000:.1f} ms ({sum(1 for a in aligned if a.confident)} placed)"
+        f"{'' if same else '  MISMATCH'}"
+    )
+    print("=" * 64)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
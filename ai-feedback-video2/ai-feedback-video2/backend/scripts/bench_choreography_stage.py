@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+"""
+bench_choreography_stage.py
+---------------------------
+Wall-clock benchmark of the whole choreography stage on a synthetic session,
+serial versus the process pool:
+  python backend/scripts/bench_choreography_stage.py --questions 40
+  python backend/scripts/bench_choreography_stage.py --questions 100 --workers 1,2,4,8
+
+The sample session's first question is cloned --questions times and its
+narration is timed with the fake TTS backend's synthetic word boundaries, so
+no audio or service access is needed. Every worker count must produce output
+identical to the serial run; the script exits non-zero otherwise.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.scripts.calculate_choreography import (  # noqa: E402
+    compute_choreographies,
+    index_manifest,
+)
+from backend.scripts.workspace import SessionWorkspace  # noqa: E402
+from backend.tts.fake_tts import synthetic_word_timings  # noqa: E402
+
+SAMPLE_MANIFEST = PROJECT_ROOT / "video-app" / "src" / "data" / "narration_manifest.json"
+
+
+def synthetic_session(questions: int, timings_dir: Path) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Manifest and session with the sample question repeated, plus a timing file per event."""
+    session = json.loads(SessionWorkspace.default().session_path.read_text(encoding="utf-8"))
+    sample = json.loads(SAMPLE_MANIFEST.read_text(encoding="utf-8"))
+    template = session["questions"][0]
+    session["questions"] = []
+    manifest: List[Dict[str, Any]] = []
+    for entry in sample:
+        if not entry.get("question_id"):
+            manifest.append(entry)
+    for q in range(1, questions + 1):
+        question = copy.deepcopy(template)
+        question["question_id"] = f"q{q}"
+        session["questions"].append(question)
+        for entry in sample:
+            if not entry.get("question_id"):
+                continue
+            clone = copy.deepcopy(entry)
+            clone["question_id"] = f"q{q}"
+            stem = Path(entry["narration"]["audio_file"]).stem.replace("q1_", f"q{q}_", 1)
+            clone["narration"]["audio_file"] = f"audio/{stem}.mp3"
+            manifest.append(clone)
+
+    timings_dir.mkdir(parents=True, exist_ok=True)
+    for entry in manifest:
+        narration = entry["narration"]
+        words = synthetic_word_timings(narration["text"], narration.get("voice_style"))
+        stem = Path(narration["audio_file"]).stem
+        (timings_dir / f"{stem}.json").write_text(
+            json.dumps(
+                {
+                    "audio_file": narration["audio_file"],
+                    "duration_sec": words[-1]["end_sec"] if words else 0.0,
+                    "words": words,
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+    return manifest, session
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the choreography stage, serial vs process pool")
+    parser.add_argument("--questions", type=int, default=40)
+    parser.add_argument("--workers", default="1,2,4,8", help="Comma-separated worker counts")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        timings_dir = Path(tmp) / "timings"
+        manifest, session = synthetic_session(args.questions, timings_dir)
+        timing_files = sorted(timings_dir.glob("*.json"))
+        manifest_index = index_manifest(manifest)
+
+        results: Dict[int, float] = {}
+        reference = None
+        ok = True
+        for workers in [int(w) for w in args.workers.split(",") if w.strip()]:
+            start = time.perf_counter()
+            output = compute_choreographies(timing_files, manifest_index, session, workers=workers)
+            results[workers] = time.perf_counter() - start
+            rendered = [json.dumps(choreography, sort_keys=True) for _, choreography, _ in output]
+            if reference is None:
+                reference = rendered
+            elif rendered != reference:
+                ok = False
+                print(f"  ❌ output with {workers} workers differs from the first run")
+
+    baseline = results.get(1) or next(iter(results.values()))
+    print("\n" + "=" * 60)
+    print(f"CHOREOGRAPHY STAGE — {len(timing_files)} slides, {args.questions} questions")
+    print("=" * 60)
+    for workers, elapsed in results.items():
+        print(f"  {workers:>2} worker(s)  {elapsed:8.2f}s   {baseline / elapsed:5.1f}x")
+    print(f"  deterministic: {'yes' if ok else 'NO'}")
+    print("=" * 60)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
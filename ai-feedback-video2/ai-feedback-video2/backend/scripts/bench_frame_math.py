@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+"""
+bench_frame_math.py
+-------------------
+Benchmark of the choreography stage's seconds→frames conversion and highlight
+window math on a large synthetic batch of sessions:
+  python backend/scripts/bench_frame_math.py
+  python backend/scripts/bench_frame_math.py --sessions 200 --slides 20 --words 400
+
+"per-word" is the dict-per-word conversion convert_word_timings_to_frames
+used before frame_math.WordFrames; "columns" is WordFrames, vectorized with
+NumPy when it is installed and plain lists otherwise. Both must produce the
+same frames and windows; the script exits non-zero if they differ.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.scripts.calculate_choreography import (  # noqa: E402
+    FPS,
+    HIGHLIGHT_LEAD_FRAMES,
+    HIGHLIGHT_TRAIL_FRAMES,
+)
+from backend.scripts.frame_math import HAS_NUMPY, WordFrames  # noqa: E402
+
+
+def synthetic_clip(words: int, rng: random.Random) -> List[Dict[str, Any]]:
+    """Legacy timing words with millisecond boundaries, like the Azure output."""
+    clip = []
+    cursor = 0.05
+    for _ in range(words):
+        duration = rng.randint(60, 600) / 1000
+        clip.append(
+            {
+                "text": "word",
+                "start_sec": round(cursor, 3),
+                "end_sec": round(cursor + duration, 3),
+                "duration_sec": duration,
+            }
+        )
+        cursor += duration + rng.randint(0, 120) / 1000
+    return clip
+
+
+def per_word_frames(words: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "word": w["text"],
+            "startFrame": round(w["start_sec"] * FPS),
+            "endFrame": round(w["end_sec"] * FPS),
+            "durationFrames": round(w["duration_sec"] * FPS),
+        }
+        for w in words
+    ]
+
+
+def per_word_windows(word_timings: List[Dict[str, Any]], spans: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    return [
+        (
+            max(word_timings[first]["startFrame"] - HIGHLIGHT_LEAD_FRAMES, 0),
+            word_timings[last]["endFrame"] + HIGHLIGHT_TRAIL_FRAMES,
+        )
+        for first, last in spans
+    ]
+
+
+def timed(fn: Callable[[], Any]) -> Tuple[float, Any]:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark vectorized frame conversion")
+    parser.add_argument("--sessions", type=int, default=100)
+    parser.add_argument("--slides", type=int, default=13, help="Timing files per session")
+    parser.add_argument("--words", type=int, default=300, help="Words per timing file")
+    parser.add_argument("--windows", type=int, default=40, help="Highlight windows per timing file")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    clips = [synthetic_clip(args.words, rng) for _ in range(args.sessions * args.slides)]
+    spans = []
+    for clip in clips:
+        clip_spans = []
+        for _ in range(args.windows):
+            first = rng.randrange(len(clip))
+            clip_spans.append((first, min(first + rng.randint(0, 12), len(clip) - 1)))
+        spans.append(clip_spans)
+
+    def per_word() -> List:
+        out = []
+        for clip, clip_spans in zip(clips, spans):
+            word_timings = per_word_frames(clip)
+            out.append((word_timings, per_word_windows(word_timings, clip_spans)))
+        return out
+
+    def columns() -> List:
+        out = []
+        for clip, clip_spans in zip(clips, spans):
+            frames = WordFrames.from_seconds(clip, FPS)
+            windows = frames.windows(
+                [first for first, _ in clip_spans],
+                [last for _, last in clip_spans],
+                lead=HIGHLIGHT_LEAD_FRAMES,
+                trail=HIGHLIGHT_TRAIL_FRAMES,
+            )
+            out.append((frames.to_word_timings(), windows))
+        return out
+
+    def columns_only() -> int:
+        # Conversion + window math without materializing the per-word dicts.
+        total = 0
+        for clip, clip_spans in zip(clips, spans):
+            frames = WordFrames.from_seconds(clip, FPS)
+            total += len(
+                frames.windows(
+                    [first for first, _ in clip_spans],
+                    [last for _, last in clip_spans],
+                    lead=HIGHLIGHT_LEAD_FRAMES,
+                    trail=HIGHLIGHT_TRAIL_FRAMES,
+                )
+            )
+        return total
+
+    per_word_sec, expected = timed(per_word)
+    columns_sec, actual = timed(columns)
+    columns_only_sec, _ = timed(columns_only)
+    same = expected == actual
+    words = len(clips) * args.words
+
+    print("\n" + "=" * 68)
+    print(
+        f"FRAME MATH — {args.sessions} sessions x {args.slides} slides, {words} words, "
+        f"{'numpy' if HAS_NUMPY else 'pure Python (numpy not installed)'}"
+    )
+    print("=" * 68)
+    print(f"  per-word dicts             {per_word_sec * 1000:9.1f} ms")
+    print(f"  columns + wordTimings      {columns_sec * 1000:9.1f} ms  {per_word_sec / columns_sec:5.1f}x")
+    print(f"  columns only               {columns_only_sec * 1000:9.1f} ms  {per_word_sec / columns_only_sec:5.1f}x")
+    print(f"  identical output: {'yes' if same else 'NO'}")
+    print("=" * 68)
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+"""
+bench_timing_format.py
+----------------------
+Size and parse-time comparison of the timing file layouts in timing_format.py:
+  python backend/scripts/bench_timing_format.py
+  python backend/scripts/bench_timing_format.py --timings backend/output/timings --repeat 200
+
+The corpus is every legacy timing file in --timings (default: the published
+sample timings). Each layout is encoded once, then decoded --repeat times;
+"load" also builds the frame columns the choreography engine reads
+(WordFrames), straight from the compact columns with no per-word dicts. Every
+layout must round-trip to the same word boundaries, and reading the columns
+must give the same frames as expanding them with to_legacy() first; the
+script exits non-zero otherwise. msgpack rows are skipped when the package is
+not installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.scripts import timing_format  # noqa: E402
+from backend.scripts.timing_format import (  # noqa: E402
+    FORMAT_COMPACT,
+    FORMAT_LEGACY,
+    FORMAT_MSGPACK,
+    encode_timing,
+    is_compact,
+    to_legacy,
+)
+from backend.scripts.calculate_choreography import FPS  # noqa: E402
+from backend.scripts.frame_math import WordFrames  # noqa: E402
+
+SAMPLE_TIMINGS = PROJECT_ROOT / "video-app" / "src" / "data" / "timings"
+
+
+def load_corpus(directory: Path) -> List[Dict[str, Any]]:
+    corpus = []
+    for path in sorted(directory.glob("*.json")):
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(payload, dict) and "duration_sec" in payload and "words" in payload:
+            corpus.append(payload)
+    return corpus
+
+
+def decoder(timing_fmt: str) -> Callable[[bytes], Dict[str, Any]]:
+    if timing_fmt == FORMAT_MSGPACK:
+        return lambda blob: timing_format.msgpack.unpackb(blob, raw=False)
+    return lambda blob: json.loads(blob.decode("utf-8"))
+
+
+def word_frames(timing: Dict[str, Any]) -> WordFrames:
+    """The engine's view of a payload: ChoreographyEngine builds exactly this."""
+    if is_compact(timing):
+        return WordFrames.from_columns(timing["text"], timing["start"], timing["end"], timing["rate"], FPS)
+    return WordFrames.from_seconds(timing["words"], FPS)
+
+
+def boundaries(timing: Dict[str, Any]) -> List[tuple]:
+    return [(w["text"], round(w["start_sec"], 7), round(w["end_sec"], 7)) for w in to_legacy(timing)["words"]]
+
+
+def frame_columns(frames: WordFrames) -> List[tuple]:
+    return [(w["word"], w["startFrame"], w["endFrame"], w["durationFrames"]) for w in frames.to_word_timings()]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark timing file layouts")
+    parser.add_argument("--timings", type=Path, default=SAMPLE_TIMINGS)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.timings)
+    if not corpus:
+        print(f"No legacy timing files in {args.timings}")
+        return 1
+    word_count = sum(len(t["words"]) for t in corpus)
+    formats = [FORMAT_LEGACY, FORMAT_COMPACT]
+    if timing_format.msgpack is not None:
+        formats.append(FORMAT_MSGPACK)
+
+    print("\n" + "=" * 72)
+    print(f"TIMING FORMATS — {len(corpus)} files, {word_count} words, {args.repeat} passes")
+    print("=" * 72)
+    ok = True
+    baseline_size = baseline_load = None
+    for timing_fmt in formats:
+        blobs = [encode_timing(timing, timing_fmt) for timing in corpus]
+        decode = decoder(timing_fmt)
+        size = sum(len(blob) for blob in blobs)
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for blob in blobs:
+                decode(blob)
+        parse_sec = (time.perf_counter() - start) / args.repeat
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            loaded = [word_frames(decode(blob)) for blob in blobs]
+        load_sec = (time.perf_counter() - start) / args.repeat
+
+        decoded = [decode(blob) for blob in blobs]
+        same = all(boundaries(a) == boundaries(b) for a, b in zip(corpus, decoded)) and all(
+            frame_columns(frames) == frame_columns(word_frames(to_legacy(timing)))
+            for frames, timing in zip(loaded, decoded)
+        )
+        ok = ok and same
+        baseline_size = baseline_size or size
+        baseline_load = baseline_load or load_sec
+        print(
+            f"  {timing_fmt:<8} {size / 1024:8.1f} KB ({size / baseline_size:5.1%})  "
+            f"parse {parse_sec * 1000:7.2f} ms  load {load_sec * 1000:7.2f} ms "
+            f"({baseline_load / load_sec:4.1f}x){'' if same else '  ROUND-TRIP MISMATCH'}"
+        )
+    if timing_format.msgpack is None:
+        print("  msgpack  (not installed; pip install msgpack to compare)")
+    print("=" * 72)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+"""
+bench_tts.py
+------------
+Wall-clock benchmark of the TTS stage on a synthetic session, offline by default:
+  python backend/scripts/bench_tts.py --questions 5 --latency-ms 300
+  python backend/scripts/bench_tts.py --backend azure --questions 1   # real service
+
+Each mode runs synthesize_manifest() into a fresh temp session workspace:
+ - serial:      one clip at a time (the historical path)
+ - concurrent:  --workers clips in flight
+ - batch:       all clips in one bookmark-delimited request
+ - chunked:     concurrent, with long clips split into parallel sentences
+
+All modes go through a TTSScheduler, so --rps, --error-rate and
+--throttle-rate show what rate limits and retries cost each mode.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.scripts import generate_tts_and_timings as tts_stage  # noqa: E402
+from backend.scripts.workspace import SessionWorkspace  # noqa: E402
+from backend.tts.backends import get_backend  # noqa: E402
+from backend.tts.base import TTSBackend  # noqa: E402
+from backend.tts.chunking import ChunkedSynthesizer  # noqa: E402
+from backend.tts.fake_tts import FakeTTSBackend  # noqa: E402
+from backend.tts.scheduler import TTSScheduler  # noqa: E402
+
+SENTENCES = [
+    "You traced the inventory update through the service layer.",
+    "The stale query in the JSP explains the mismatch customers saw.",
+    "Next time, confirm the transaction boundary before reading stock levels.",
+    "Your reasoning was structured, but you skipped validating the business rules.",
+    "Overall this was a solid attempt that meets industry standards.",
+]
+
+
+def synthetic_manifest(questions: int) -> List[Dict]:
+    """Intro + case + (summary, feedback, thinking) per question, with realistic text lengths."""
+    def event(name: str, sentences: int, seed: int) -> Dict:
+        text = " ".join(SENTENCES[(seed + i) % len(SENTENCES)] for i in range(sentences))
+        return {"narration": {"text": text, "audio_file": f"audio/{name}.mp3", "voice_style": {}}}
+
+    manifest = [event("intro_welcome", 1, 0), event("case_overview", 6, 1)]
+    for q in range(1, questions + 1):
+        manifest += [
+            event(f"q{q}_summary", 4, q),
+            event(f"q{q}_feedback", 5, q + 1),
+            event(f"q{q}_thinking", 10, q + 2),
+        ]
+    return manifest
+
+
+def run_mode(fn: Callable[[SessionWorkspace], None]) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        workspace = SessionWorkspace.for_session("bench", root=Path(tmp))
+        start = time.perf_counter()
+        fn(workspace)
+        return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark TTS stage modes on a synthetic session")
+    parser.add_argument("--questions", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--backend", default="fake", help="fake (default) or azure")
+    parser.add_argument("--latency-ms", type=float, default=300, help="Fake round-trip latency")
+    parser.add_argument("--per-char-ms", type=float, default=0.5, help="Fake generation time per character")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fake transient error probability")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fake 429 probability")
+    parser.add_argument("--rps", type=float, default=0.0, help="Scheduler requests/sec cap (0: unlimited)")
+    parser.add_argument("--modes", default="serial,concurrent,batch,chunked")
+    args = parser.parse_args()
+
+    backend: TTSBackend
+    if args.backend == "fake":
+        backend = FakeTTSBackend(
+            latency_sec=args.latency_ms / 1000,
+            per_char_sec=args.per_char_ms / 1000,
+            error_rate=args.error_rate,
+            throttle_rate=args.throttle_rate,
+        )
+    else:
+        backend = get_backend(args.backend)
+
+    manifest = synthetic_manifest(args.questions)
+
+    def scheduled() -> TTSScheduler:
+        return TTSScheduler(
+            backend,
+            requests_per_sec=args.rps,
+            max_connections=max(args.workers, 1) ** 2,  # manifest workers x chunk workers
+            base_delay_sec=0.1,
+        )
+
+    modes = {
+        "serial": lambda s, ws: tts_stage.synthesize_manifest(
+            manifest, workers=1, synthesize=s.synthesize, workspace=ws
+        ),
+        "concurrent": lambda s, ws: tts_stage.synthesize_manifest(
+            manifest, workers=args.workers, synthesize=s.synthesize, workspace=ws
+        ),
+        "batch": lambda s, ws: tts_stage.synthesize_manifest(
+            manifest, synthesize=s.synthesize, synthesize_batch=s.synthesize_batch, workspace=ws
+        ),
+        "chunked": lambda s, ws: run_chunked(s, ws),
+    }
+
+    def run_chunked(s: TTSScheduler, ws: SessionWorkspace) -> None:
+        chunker = ChunkedSynthesizer(s.synthesize, workers=args.workers, threshold_chars=300)
+        try:
+            tts_stage.synthesize_manifest(
+                manifest, workers=args.workers, synthesize=chunker.synthesize, workspace=ws
+            )
+        finally:
+            chunker.close()
+
+    results: Dict[str, float] = {}
+    scheduler_stats: Dict[str, str] = {}
+    for name in [m.strip() for m in args.modes.split(",") if m.strip()]:
+        if name not in modes:
+            parser.error(f"unknown mode '{name}' (expected one of: {', '.join(modes)})")
+        scheduler = scheduled()
+        results[name] = run_mode(lambda ws: modes[name](scheduler, ws))
+        scheduler_stats[name] = scheduler.stats.summary()
+
+    baseline = results.get("serial")
+    print("\n" + "=" * 60)
+    print(f"TTS BENCHMARK — {len(manifest)} clips, backend={backend.name}, workers={args.workers}")
+    print("=" * 60)
+    for name, elapsed in results.items():
+        speedup = f"{baseline / elapsed:5.1f}x" if baseline else "  n/a"
+        print(f"  {name:<12} {elapsed:8.2f}s   {speedup}")
+        print(f"  {'':<12} {scheduler_stats[name]}")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
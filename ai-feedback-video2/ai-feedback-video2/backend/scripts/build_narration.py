@@ -9,52 +9,30 @@ session fields when narration text is missing.
 
 from __future__ import annotations
 
+import argparse
 import copy
 import json
 import os
 import sys
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Any, Dict, List, Callable
+from typing import Any, Callable, Dict, List, Tuple
 
 from dotenv import load_dotenv
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
-BACKEND_DIR = PROJECT_ROOT / "backend"
-DATA_DIR = BACKEND_DIR / "data"
-OUTPUT_DIR = BACKEND_DIR / "output"
-FRONTEND_DATA_DIR = PROJECT_ROOT / "video-app" / "src" / "data"
-DEFAULT_SLIDES_PATHS = [
-    PROJECT_ROOT / "input.txt",
-    PROJECT_ROOT / "input.json",
-    DATA_DIR / "slides_payload.json",
-    DATA_DIR / "slides_payload.txt",
-]
-
-SESSION_PATH = os.environ.get(
-    "SESSION_JSON_PATH",
-    str((DATA_DIR / "session_questions.json") if (DATA_DIR / "session_questions.json").exists()
-        else (FRONTEND_DATA_DIR / "session_questions.json"))
-)
-MANIFEST_PATH = Path(os.environ.get("NARRATION_MANIFEST_PATH", OUTPUT_DIR / "narration_manifest.json"))
-
-
-def resolve_slides_payload_path() -> str | None:
-    env_value = os.environ.get("SLIDES_PAYLOAD_PATH")
-    if env_value:
-        return env_value
-    for candidate in DEFAULT_SLIDES_PATHS:
-        if candidate.exists():
-            return str(candidate)
-    return None
-
-
-SLIDES_PAYLOAD_PATH = resolve_slides_payload_path()
 
 load_dotenv(PROJECT_ROOT / ".env", override=True)
 
+from backend.scripts import build_state  # noqa: E402
+from backend.scripts.workspace import (  # noqa: E402
+    SessionWorkspace,
+    add_workspace_arguments,
+    atomic_write_text,
+    workspace_from_args,
+)
 from backend.scripts.slides_payload_adapter import (  # noqa: E402
     convert_slides_to_session,
     extract_preauthored_narrations,
@@ -339,32 +317,71 @@ def build_question_events(
 # Entry point
 # ---------------------------------------------------------------------------
 
-def main() -> None:
-    session_path = Path(SESSION_PATH)
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+def session_path_for(workspace: SessionWorkspace) -> Path:
+    """
+    Where the session JSON is read from and refreshed. The shared workspace
+    falls back to the frontend copy when the backend one was never written
+    (and SESSION_JSON_PATH is unset); an isolated workspace always uses its own.
+    """
+    if workspace.isolated or workspace.session_path.exists() or os.environ.get("SESSION_JSON_PATH"):
+        return workspace.session_path
+    return workspace.frontend_data_dir / "session_questions.json"
+
+
+def slides_payload_path_for(workspace: SessionWorkspace) -> Path | None:
+    """The workspace's authored slides payload, if it has one on disk."""
+    path = workspace.input_path
+    if path is None or (workspace.isolated and not path.exists()):
+        return None
+    return path
+
+
+def load_session_and_overrides(
+    slides: Dict[str, Any] | None = None,
+    existing_session: Dict[str, Any] | None = None,
+    workspace: SessionWorkspace | None = None,
+) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """
+    Session data (refreshed from the slides payload when there is one) and
+    pre-authored narrations. An in-process caller that already holds the
+    parsed slides payload and session passes them instead of having them
+    re-read from disk.
+    """
+    workspace = workspace or SessionWorkspace.default()
+    session_path = session_path_for(workspace)
+    slides_path = slides_payload_path_for(workspace)
 
-    existing_session: Dict[str, Any] = {}
-    if session_path.exists():
-        existing_session = json.loads(session_path.read_text(encoding="utf-8"))
-    elif not SLIDES_PAYLOAD_PATH:
-        raise FileNotFoundError(f"session_questions.json not found at {session_path}")
+    if existing_session is None:
+        existing_session = {}
+        if session_path.exists():
+            existing_session = json.loads(session_path.read_text(encoding="utf-8"))
+        elif not slides_path and slides is None:
+            raise FileNotFoundError(f"session_questions.json not found at {session_path}")
 
     overrides: Dict[str, Dict[str, Any]] = {}
-    if SLIDES_PAYLOAD_PATH:
-        if not os.environ.get("SLIDES_PAYLOAD_PATH"):
-            print(f"ℹ️  Auto-detected slides payload at {SLIDES_PAYLOAD_PATH}")
+    if slides is None and slides_path:
+        if not os.environ.get("SLIDES_PAYLOAD_PATH") and not workspace.isolated:
+            print(f"ℹ️  Auto-detected slides payload at {slides_path}")
         try:
-            slides = load_slides_payload(SLIDES_PAYLOAD_PATH)
+            slides = load_slides_payload(str(slides_path))
         except SlidesPayloadError as exc:
             raise RuntimeError(f"Failed to load slides payload: {exc}") from exc
+    if slides is not None:
         session = convert_slides_to_session(slides, existing_session)
         overrides = extract_preauthored_narrations(slides, session)
-        session_path.parent.mkdir(parents=True, exist_ok=True)
-        session_path.write_text(json.dumps(session, indent=2, ensure_ascii=False), encoding="utf-8")
-        print(f"📄 Session data refreshed from slides payload ({SLIDES_PAYLOAD_PATH})")
+        atomic_write_text(session_path, json.dumps(session, indent=2, ensure_ascii=False))
+        print(f"📄 Session data refreshed from slides payload ({slides_path or 'in memory'})")
     else:
         session = existing_session
+    return session, overrides
+
 
+def build_manifest(
+    session: Dict[str, Any],
+    overrides: Dict[str, Dict[str, Any]] | None = None,
+) -> List[Dict[str, Any]]:
+    """Narration manifest entries for the session, in slide order."""
+    overrides = overrides or {}
     events: List[ManifestEvent] = []
     slide_index = 1
 
@@ -378,9 +395,79 @@ def main() -> None:
         question_events, slide_index = build_question_events(question, slide_index, overrides)
         events.extend(question_events)
 
-    manifest_dicts = [event.to_dict() for event in events]
-    MANIFEST_PATH.write_text(json.dumps(manifest_dicts, indent=2, ensure_ascii=False), encoding="utf-8")
-    print(f"✅ Narration manifest written to {MANIFEST_PATH}")
+    return [event.to_dict() for event in events]
+
+
+EVENT_REASONS = {
+    "text": "narration text changed",
+    "voice": "voice style changed",
+    "narration": "narration metadata changed",
+    "animation": "animation changed",
+    "slide": "slide placement changed",
+}
+
+
+def event_key(event: Dict[str, Any]) -> str:
+    """Stable id of a manifest event: its audio file stem (what TTS and choreography key on)."""
+    audio_file = (event.get("narration") or {}).get("audio_file")
+    if audio_file:
+        return Path(audio_file).stem
+    return f"{event.get('slide_type', '')}:{event.get('question_id', '')}"
+
+
+def event_fingerprint(event: Dict[str, Any]) -> Dict[str, str]:
+    narration = dict(event.get("narration") or {})
+    text = narration.pop("text", "")
+    voice_style = narration.pop("voice_style", {})
+    placement = {key: value for key, value in event.items() if key not in ("narration", "animation")}
+    return {
+        "text": build_state.digest(text),
+        "voice": build_state.digest(voice_style),
+        "narration": build_state.digest(narration),
+        "animation": build_state.digest(event.get("animation", {})),
+        "slide": build_state.digest(placement),
+    }
+
+
+def manifest_changes(
+    previous: List[Dict[str, Any]],
+    manifest_dicts: List[Dict[str, Any]],
+) -> Dict[str, str]:
+    """{event key: why it differs} between two manifests; unchanged events are left out."""
+    recorded = {event_key(event): event_fingerprint(event) for event in previous}
+    changes: Dict[str, str] = {}
+    for event in manifest_dicts:
+        key = event_key(event)
+        reason = build_state.rebuild_reason(key, event_fingerprint(event), recorded, EVENT_REASONS)
+        if reason:
+            changes[key] = "new event" if reason == "no previous build" else reason
+    current = {event_key(event) for event in manifest_dicts}
+    changes.update({key: "removed" for key in recorded if key not in current})
+    return changes
+
+
+def write_manifest(manifest_dicts: List[Dict[str, Any]], workspace: SessionWorkspace | None = None) -> None:
+    manifest_path = (workspace or SessionWorkspace.default()).manifest_path
+    if manifest_path.exists():
+        try:
+            previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            previous = []
+        changes = manifest_changes(previous, manifest_dicts)
+        for key, reason in changes.items():
+            print(f"  🔄 {key}: {reason}")
+        changed = sum(1 for reason in changes.values() if reason != "removed")
+        print(f"  {len(manifest_dicts) - changed} event(s) unchanged, {len(changes)} changed")
+    atomic_write_text(manifest_path, json.dumps(manifest_dicts, indent=2, ensure_ascii=False))
+    print(f"✅ Narration manifest written to {manifest_path}")
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Build the narration manifest from the session / slides payload")
+    add_workspace_arguments(parser)
+    workspace = workspace_from_args(parser.parse_args(argv))
+    session, overrides = load_session_and_overrides(workspace=workspace)
+    write_manifest(build_manifest(session, overrides), workspace)
 
 
 if __name__ == "__main__":
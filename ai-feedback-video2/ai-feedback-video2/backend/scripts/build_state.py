@@ -0,0 +1,77 @@
+"""
+build_state.py
+--------------
+Content fingerprints for incremental builds.
+
+Each stage records, per item it produces (a pipeline stage, a TTS clip, a
+slide's choreography), a digest of every input that item depends on, split
+into named components:
+
+    {"q1_summary": {"text": "3f2a...", "voice": "9c01...", "synthesis": "..."}}
+
+On the next run rebuild_reason() compares the fresh fingerprint with the
+recorded one and names the components that changed, so a build can say why
+each item was redone instead of redoing everything. Records live in the
+session workspace's .build/ directory (backend/output/.build/ by default),
+which publish_assets never ships.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from backend.scripts.workspace import atomic_write_text
+
+Fingerprint = Dict[str, str]
+
+
+def digest(payload: Any) -> str:
+    """Short sha256 of bytes, or of the canonical JSON of any other payload."""
+    if not isinstance(payload, bytes):
+        payload = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def file_digest(path: Path) -> str:
+    """digest() of a file's bytes; "missing" when it does not exist."""
+    try:
+        return digest(path.read_bytes())
+    except FileNotFoundError:
+        return "missing"
+
+
+def load_fingerprints(path: Path) -> Dict[str, Fingerprint]:
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return {}
+
+
+def save_fingerprints(path: Path, fingerprints: Dict[str, Fingerprint]) -> None:
+    atomic_write_text(path, json.dumps(fingerprints, indent=2, sort_keys=True))
+
+
+def rebuild_reason(
+    name: str,
+    fingerprint: Fingerprint,
+    previous: Dict[str, Fingerprint],
+    labels: Dict[str, str],
+    outputs: Iterable[Path] = (),
+) -> Optional[str]:
+    """
+    Why item name must be rebuilt, or None if every output exists and its
+    recorded fingerprint still matches. labels maps fingerprint components to
+    the explanation used when that component changed.
+    """
+    if not all(path.exists() for path in outputs):
+        return "output missing"
+    recorded = previous.get(name)
+    if recorded is None:
+        return "no previous build"
+    changed = [labels.get(key, f"{key} changed") for key in fingerprint if recorded.get(key) != fingerprint[key]]
+    return ", ".join(changed) or None
@@ -10,34 +10,73 @@ Fixes for thinking steps timing:
 
 from __future__ import annotations
 
+import argparse
+import contextlib
+import io
 import json
+import os
 import re
+import sys
+import time
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
-BACKEND_OUTPUT = PROJECT_ROOT / "backend" / "output"
-TIMINGS_DIR = BACKEND_OUTPUT / "timings"
-CHOREOGRAPHY_DIR = BACKEND_OUTPUT / "choreography"
-MANIFEST_PATH = BACKEND_OUTPUT / "narration_manifest.json"
-SESSION_PATH = PROJECT_ROOT / "backend" / "data" / "session_questions.json"
-
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.scripts import build_state  # noqa: E402
+from backend.scripts.build_state import digest as _digest  # noqa: E402
+from backend.scripts.choreography_timeline import compile_timeline  # noqa: E402
+from backend.scripts.frame_math import WordFrames  # noqa: E402
+from backend.scripts.phrase_alignment import MIN_CONFIDENCE, PhraseAlignment, align_phrases, find_window  # noqa: E402
+from backend.scripts.timing_format import decode_timing, is_compact, timing_paths, timing_summary  # noqa: E402
+from backend.scripts.word_tables import dumps_word_table, split_word_table  # noqa: E402
+from backend.scripts.workspace import (  # noqa: E402
+    SessionWorkspace,
+    add_workspace_arguments,
+    atomic_write_text,
+    workspace_from_args,
+)
+
+# Kept in the workspace's .build/, outside the choreography dir, so
+# publish_assets does not ship it to the frontend.
+FINGERPRINTS_NAME = "choreography_fingerprints.json"
+
+# Base frame rate: always emitted to the workspace's choreography dir, and the
+# rate every frame offset in this module is written for. Extra output rates
+# (--fps / CHOREO_FPS) go to choreography/<fps>fps/ and reuse the same
+# phrase alignments, with offsets scaled to keep their duration in seconds.
 FPS = 30
+DEFAULT_OUTPUT_FPS = os.environ.get("CHOREO_FPS", str(FPS))
+# Bump whenever a change to this module alters generated choreography, so
+# incremental runs rebuild every slide instead of trusting stale outputs.
+ENGINE_VERSION = "8"
 HIGHLIGHT_COLOR = "#E6A100"
+# A matched phrase's highlight opens this many frames before its first word
+# and closes this many after its last.
+HIGHLIGHT_LEAD_FRAMES = 8
+HIGHLIGHT_TRAIL_FRAMES = 2
+DEFAULT_WORKERS = int(os.environ.get("CHOREO_WORKERS", "1"))
 
-SESSION_DATA: Dict[str, Any] = {}
+# Block phrase matching: "ordered" aligns every block of a slide as one
+# narrated sequence; "per_block" aligns each block on its own (thinking-steps
+# columns are narrated row by row, interleaved).
+MATCH_ORDERED = "ordered"
+MATCH_PER_BLOCK = "per_block"
 
 
-def load_session_data() -> None:
-    global SESSION_DATA
-    if SESSION_PATH.exists():
-        SESSION_DATA = json.loads(SESSION_PATH.read_text(encoding="utf-8"))
-    else:
-        SESSION_DATA = {}
+def load_session_data(workspace: SessionWorkspace | None = None) -> Dict[str, Any]:
+    session_path = (workspace or SessionWorkspace.default()).session_path
+    if session_path.exists():
+        return json.loads(session_path.read_text(encoding="utf-8"))
+    return {}
 
 
-def get_question_data(question_id: str) -> Dict[str, Any]:
-    questions = SESSION_DATA.get("questions", [])
+def get_question_data(session: Dict[str, Any], question_id: str) -> Dict[str, Any]:
+    questions = session.get("questions", [])
     if not questions:
         return {}
     if question_id:
@@ -47,20 +86,32 @@ def get_question_data(question_id: str) -> Dict[str, Any]:
     return questions[0]
 
 
-def seconds_to_frames(seconds: float) -> int:
-    return round(seconds * FPS)
+def seconds_to_frames(seconds: float, fps: int = FPS) -> int:
+    return round(seconds * fps)
 
 
-def convert_word_timings_to_frames(words: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    return [
-        {
-            "word": w["text"],
-            "startFrame": seconds_to_frames(w["start_sec"]),
-            "endFrame": seconds_to_frames(w["end_sec"]),
-            "durationFrames": seconds_to_frames(w["duration_sec"])
-        }
-        for w in words
-    ]
+def scale_frames(frames: int, fps: int) -> int:
+    """A frame count written for FPS, at another rate (same duration in seconds)."""
+    return frames if fps == FPS else round(frames * fps / FPS)
+
+
+def parse_fps_list(value: str) -> List[int]:
+    """Output rates from "24,30,60"; the base FPS is always included and comes first."""
+    rates = [FPS]
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        fps = int(item)
+        if fps <= 0:
+            raise ValueError(f"Frame rate must be positive, got {fps}")
+        if fps not in rates:
+            rates.append(fps)
+    return rates
+
+
+def convert_word_timings_to_frames(words: List[Dict[str, Any]], fps: int = FPS) -> List[Dict[str, Any]]:
+    return WordFrames.from_seconds(words, fps).to_word_timings()
 
 
 def normalize_token(token: str) -> str:
@@ -73,179 +124,210 @@ def tokenize_phrase(phrase: str) -> List[str]:
     return [normalize_token(tok) for tok in phrase.split() if normalize_token(tok)]
 
 
+class TokenIndex:
+    """
+    Normalized token view of one narration, built once per timing file.
+
+    Holds the token array, the token -> word-index mapping and a
+    token -> positions map, so phrase lookups jump straight to candidate
+    starts instead of re-normalizing and rescanning the whole word list.
+    """
+
+    def __init__(self, word_timings: List[Dict[str, Any]]):
+        self.word_timings = word_timings
+        self.tokens: List[str] = []
+        self.token_to_word_idx: List[int] = []
+        self.start_frames: List[int] = []
+        self.positions: Dict[str, List[int]] = {}
+        for idx, entry in enumerate(word_timings):
+            token = normalize_token(entry.get("word", ""))
+            if not token:
+                continue
+            self.positions.setdefault(token, []).append(len(self.tokens))
+            self.tokens.append(token)
+            self.token_to_word_idx.append(idx)
+            self.start_frames.append(entry["startFrame"])
+        self.monotonic = all(a <= b for a, b in zip(self.start_frames, self.start_frames[1:]))
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def find_window(
+        self,
+        phrase_tokens: List[str],
+        start_token_idx: int = 0,
+        max_gap: int = 4,
+    ) -> Optional[Tuple[int, int]]:
+        """First greedy, gap-tolerant match at or after start_token_idx (see phrase_alignment.find_window)."""
+        return find_window(self.positions, phrase_tokens, start_token_idx, max_gap)
+
+    def find_windows(
+        self,
+        phrase_tokens: List[str],
+        start_token_idx: int = 0,
+        max_gap: int = 4,
+        max_matches: int = 3,
+    ) -> List[Tuple[int, int]]:
+        matches: List[Tuple[int, int]] = []
+        search_idx = start_token_idx
+        while len(matches) < max_matches and search_idx < len(self.tokens):
+            window = self.find_window(phrase_tokens, search_idx, max_gap)
+            if not window:
+                break
+            matches.append(window)
+            search_idx = window[1] + 1
+        return matches
+
+    def find_phrase_start(self, search_phrase: str, start_frame: int = 0) -> Optional[int]:
+        """Start frame of the first exact, contiguous occurrence at or after start_frame."""
+        phrase_tokens = tokenize_phrase(search_phrase)
+        if not phrase_tokens:
+            return None
+        m = len(phrase_tokens)
+        if self.monotonic:
+            # Tokens at or after start_frame form a suffix of the token array.
+            first = bisect_left(self.start_frames, start_frame)
+            first_positions = self.positions.get(phrase_tokens[0], [])
+            for i in first_positions[bisect_left(first_positions, first):]:
+                if self.tokens[i:i + m] == phrase_tokens:
+                    return self.start_frames[i]
+            return None
+        tokens = [
+            (token, frame)
+            for token, frame in zip(self.tokens, self.start_frames)
+            if frame >= start_frame
+        ]
+        for i in range(len(tokens) - m + 1):
+            if all(tokens[i + j][0] == phrase_tokens[j] for j in range(m)):
+                return tokens[i][1]
+        return None
+
+
 def find_phrase_in_words(
     word_timings: List[Dict[str, Any]],
     search_phrase: str,
-    start_frame: int = 0
+    start_frame: int = 0,
+    index: Optional[TokenIndex] = None,
 ) -> Optional[int]:
     """Find when a specific phrase is spoken and return its start frame."""
-    phrase_tokens = tokenize_phrase(search_phrase)
-    if not phrase_tokens:
-        return None
-    
-    tokens = []
-    for entry in word_timings:
-        if entry["startFrame"] >= start_frame:
-            token = normalize_token(entry.get("word", ""))
-            if token:
-                tokens.append((token, entry["startFrame"]))
-    
-    for i in range(len(tokens) - len(phrase_tokens) + 1):
-        match = True
-        for j, phrase_token in enumerate(phrase_tokens):
-            if tokens[i + j][0] != phrase_token:
-                match = False
-                break
-        if match:
-            return tokens[i][1]
-    
-    return None
+    if index is None:
+        index = TokenIndex(word_timings)
+    return index.find_phrase_start(search_phrase, start_frame)
 
 
-def _find_phrase_window(
-    tokens: List[str],
-    phrase_tokens: List[str],
-    start_token_idx: int = 0,
-    max_gap: int = 4,
-) -> Optional[Tuple[int, int]]:
-    if not phrase_tokens:
-        return None
-    n = len(tokens)
-    m = len(phrase_tokens)
-    i = start_token_idx
-    while i < n:
-        if tokens[i] != phrase_tokens[0]:
-            i += 1
-            continue
-        j = 0
-        k = i
-        last_match = i
-        start_match = None
-        while k < n and j < m:
-            if tokens[k] == phrase_tokens[j]:
-                if start_match is None:
-                    start_match = k
-                last_match = k
-                j += 1
-            elif start_match is not None and (k - last_match) > max_gap:
-                break
-            k += 1
-        if j == m and start_match is not None:
-            return start_match, last_match
-        i += 1
-    return None
-
-
-def find_phrase_windows(
-    tokens: List[str],
-    phrase_tokens: List[str],
-    start_token_idx: int = 0,
-    max_gap: int = 4,
-    max_matches: int = 3,
+def _estimate_gap_frames(
+    placed: List[Optional[Tuple[int, int]]],
+    total_frames: int,
 ) -> List[Tuple[int, int]]:
-    matches: List[Tuple[int, int]] = []
-    search_idx = start_token_idx
-    while len(matches) < max_matches and search_idx < len(tokens):
-        window = _find_phrase_window(tokens, phrase_tokens, search_idx, max_gap)
-        if not window:
-            break
-        matches.append(window)
-        search_idx = window[1] + 1
-    return matches
+    """Fill unplaced entries by splitting the gap between their placed neighbours evenly."""
+    frames: List[Tuple[int, int]] = []
+    k = 0
+    while k < len(placed):
+        if placed[k] is not None:
+            frames.append(placed[k])
+            k += 1
+            continue
+        run_end = k
+        while run_end < len(placed) and placed[run_end] is None:
+            run_end += 1
+        gap_start = placed[k - 1][1] if k > 0 else 0
+        gap_end = placed[run_end][0] if run_end < len(placed) else total_frames
+        gap_end = max(gap_end, gap_start + 1)
+        span = (gap_end - gap_start) / (run_end - k)
+        for offset in range(run_end - k):
+            frames.append((round(gap_start + offset * span), round(gap_start + (offset + 1) * span)))
+        k = run_end
+    return frames
 
 
 def build_block_highlights(
     word_timings: List[Dict[str, Any]],
     block_specs: List[Dict[str, Any]],
     total_frames: int,
+    index: Optional[TokenIndex] = None,
+    match_mode: str = MATCH_ORDERED,
+    word_frames: Optional[WordFrames] = None,
+    fps: int = FPS,
+    alignment_cache: Optional[Dict[Tuple[Tuple[str, ...], ...], List[PhraseAlignment]]] = None,
 ) -> List[Dict[str, Any]]:
+    """
+    Highlight (with one segment per phrase) for every block spec.
+
+    Phrase alignment works on narration tokens and does not depend on fps, so
+    callers producing several frame rates of one narration can share
+    alignment_cache and align each phrase list only once.
+    """
     if not block_specs:
         return []
+    if match_mode not in (MATCH_ORDERED, MATCH_PER_BLOCK):
+        raise ValueError(f"Unknown match mode '{match_mode}'")
+
+    if index is None:
+        index = TokenIndex(word_timings)
+    if word_frames is None:
+        word_frames = WordFrames.from_word_timings(word_timings)
+    token_to_word_idx = index.token_to_word_idx
+
+    block_groups = (
+        [[block_index] for block_index in range(len(block_specs))]
+        if match_mode == MATCH_PER_BLOCK
+        else [list(range(len(block_specs)))]
+    )
 
-    tokens: List[str] = []
-    token_to_word_idx: List[int] = []
-    for idx, entry in enumerate(word_timings):
-        token = normalize_token(entry.get("word", ""))
-        if not token:
-            continue
-        tokens.append(token)
-        token_to_word_idx.append(idx)
-
-    highlights: List[Dict[str, Any]] = []
-    fallback_chunk = max(total_frames // max(len(block_specs), 1), 1)
+    segments_by_block: Dict[int, List[Dict[str, Any]]] = {idx: [] for idx in range(len(block_specs))}
+    for group in block_groups:
+        entries: List[Tuple[int, Optional[str]]] = []
+        for block_index in group:
+            phrases = [p for p in block_specs[block_index].get("phrases", []) if tokenize_phrase(p)]
+            entries.extend((block_index, phrase) for phrase in phrases or [None])
+
+        phrase_tokens = tuple(tuple(tokenize_phrase(phrase)) if phrase else () for _, phrase in entries)
+        alignments = alignment_cache.get(phrase_tokens) if alignment_cache is not None else None
+        fresh = alignments is None
+        if fresh:
+            alignments = align_phrases(index.tokens, phrase_tokens, index.positions)
+            if alignment_cache is not None:
+                alignment_cache[phrase_tokens] = alignments
+        confident = [k for k, alignment in enumerate(alignments) if alignment.confident]
+        # Appear earlier: show 8 frames before narration starts (was 2)
+        windows = word_frames.windows(
+            [token_to_word_idx[alignments[k].token_start] for k in confident],
+            [token_to_word_idx[alignments[k].token_end] for k in confident],
+            lead=scale_frames(HIGHLIGHT_LEAD_FRAMES, fps),
+            trail=scale_frames(HIGHLIGHT_TRAIL_FRAMES, fps),
+        )
+        placed: List[Optional[Tuple[int, int]]] = [None] * len(alignments)
+        for k, window in zip(confident, windows):
+            placed[k] = window
+
+        frames = _estimate_gap_frames(placed, total_frames)
+        for (block_index, phrase), alignment, (start_frame, end_frame) in zip(entries, alignments, frames):
+            segments_by_block[block_index].append(
+                {
+                    "text": phrase,
+                    "startFrame": start_frame,
+                    "endFrame": end_frame,
+                    "confidence": round(alignment.confidence, 2),
+                }
+            )
 
-    import inspect
-    caller = inspect.stack()[1].function if len(inspect.stack()) > 1 else ""
-    is_thinking_steps = caller == "create_thinking_steps_choreography"
-    
-    for block_index, spec in enumerate(block_specs):
-        phrases = [p for p in spec.get("phrases", []) if p]
-        segments: List[Dict[str, Any]] = []
-        search_idx = 0
-        
-        for phrase in phrases:
-            phrase_tokens = tokenize_phrase(phrase)
-            if not phrase_tokens or not tokens:
-                continue
-            if is_thinking_steps:
-                windows = find_phrase_windows(
-                    tokens,
-                    phrase_tokens,
-                    start_token_idx=0,
-                )
-            else:
-                windows = find_phrase_windows(
-                    tokens,
-                    phrase_tokens,
-                    start_token_idx=search_idx,
-                )
-            if windows:
-                token_start, token_end = windows[0]
-                start_word_idx = token_to_word_idx[token_start]
-                end_word_idx = token_to_word_idx[token_end]
-                # Appear earlier: show 8 frames before narration starts (was 2)
-                start_frame = max(word_timings[start_word_idx]["startFrame"] - 8, 0)
-                end_frame = word_timings[end_word_idx]["endFrame"] + 2
-                segments.append(
-                    {
-                        "text": phrase,
-                        "startFrame": start_frame,
-                        "endFrame": end_frame,
-                    }
+        # Warn once per alignment, not once per output frame rate.
+        for block_index in group if fresh else ():
+            estimated = sum(1 for seg in segments_by_block[block_index] if seg["confidence"] < MIN_CONFIDENCE)
+            if estimated:
+                print(
+                    f"[WARN] {estimated} phrase(s) in block '{block_specs[block_index]['block_id']}' "
+                    f"not confidently matched; timing estimated from neighbours"
                 )
-                if not is_thinking_steps:
-                    search_idx = token_end + 1
-
-        if not segments:
-            print(f"[WARN] No match for one or more phrases in block '{spec['block_id']}'")
-            # Fallback: stagger each row by 10 frames after the column intro
-            fallback_start = block_index * fallback_chunk
-            fallback_end = min(fallback_start + fallback_chunk, total_frames)
-            phrase_count = max(len(phrases), 1)
-            phrase_span = max((fallback_end - fallback_start) // phrase_count, 1)
-            for idx in range(phrase_count):
-                seg_start = fallback_start + idx * phrase_span + idx * 10  # Stagger by 10 frames
-                seg_end = (
-                    fallback_end
-                    if idx == phrase_count - 1
-                    else min(seg_start + phrase_span, fallback_end)
-                )
-                segments.append(
-                    {
-                        "text": phrases[idx] if idx < len(phrases) else None,
-                        "startFrame": seg_start,
-                        "endFrame": seg_end,
-                    }
-                )
-
-        block_start = min(seg["startFrame"] for seg in segments)
-        block_end = max(seg["endFrame"] for seg in segments)
 
+    highlights: List[Dict[str, Any]] = []
+    for block_index, spec in enumerate(block_specs):
+        segments = segments_by_block[block_index]
         highlights.append(
             {
                 "blockId": spec["block_id"],
-                "startFrame": block_start,
-                "endFrame": block_end,
+                "startFrame": min(seg["startFrame"] for seg in segments),
+                "endFrame": max(seg["endFrame"] for seg in segments),
                 "color": spec.get("color", HIGHLIGHT_COLOR),
                 "segments": segments,
             }
@@ -368,347 +450,527 @@ def get_thinking_specs(question: Dict[str, Any]) -> List[Dict[str, Any]]:
         ]
 
 
-def create_intro_choreography(timing_data: Dict[str, Any]) -> Dict[str, Any]:
-    duration_sec = timing_data.get("duration_sec", 6.0)
-    total_frames = seconds_to_frames(duration_sec)
-    
-    return {
-        "slideType": "intro_welcome",
-        "totalDurationFrames": total_frames,
-        "actualDurationSec": duration_sec,
-        "animations": [
-            {
-                "blockId": "intro_caption",
-                "type": "fadeIn",
-                "startFrame": 0,
-                "durationFrames": 60,
-                "easing": "easeOut"
-            }
-        ],
-        "narration": {
-            "audioFile": timing_data["audio_file"],
-            "startFrame": 0,
-            "endFrame": total_frames,
-            "durationSec": duration_sec,
-            "wordTimings": convert_word_timings_to_frames(timing_data.get("words", []))
-        }
-    }
-
+class ChoreographyEngine:
+    """
+    Slide choreography for one timing file.
 
-def create_case_overview_choreography(timing_data: Dict[str, Any], question: Dict[str, Any]) -> Dict[str, Any]:
-    duration_sec = timing_data.get("duration_sec", 15.0)
-    total_frames = seconds_to_frames(duration_sec)
-    word_timings = convert_word_timings_to_frames(timing_data.get("words", []))
-    block_specs = get_case_overview_specs(question)
-    highlights = build_block_highlights(word_timings, block_specs, total_frames)
-    animation_map = {
-        "problem_scenario": "slideInLeft",
-        "data_simplified": "slideInRight",
-        "business_rules": "slideInLeft",
-        "performance_constraints": "slideInRight",
-    }
-    animations = [
-        animation_from_highlight(
-            h["blockId"],
-            h,
-            animation_map.get(h["blockId"], "fadeIn"),
-            duration=40,
-            lead=18,
-        )
-        for h in highlights
-    ]
-    
-    return {
-        "slideType": "case_overview",
-        "totalDurationFrames": total_frames,
-        "actualDurationSec": duration_sec,
-        "animations": animations,
-        "highlights": highlights,
-        "narration": {
-            "audioFile": timing_data["audio_file"],
-            "startFrame": 0,
-            "endFrame": total_frames,
-            "durationSec": duration_sec,
-            "wordTimings": word_timings
-        }
-    }
+    Frame-domain word timings and the TokenIndex are computed once in the
+    constructor, from either timing layout (compact columns are read as
+    is); the slide builders below only read them, so one engine (or many,
+    one per file) can be used from several workers at once. Session data is
+    passed in explicitly instead of living in a module global.
 
+    Frame offsets in the builders are written for FPS and scaled to the
+    engine's fps. Engines for other rates of the same narration can share
+    one alignment_cache (see at_fps), so phrases are aligned only once.
+    """
 
-def create_question_summary_choreography(timing_data: Dict[str, Any], question_id: str) -> Dict[str, Any]:
-    duration_sec = timing_data.get("duration_sec", 8.0)
-    total_frames = seconds_to_frames(duration_sec)
-    question = get_question_data(question_id)
-    word_timings = convert_word_timings_to_frames(timing_data.get("words", []))
-    feedback_intro_frame = find_phrase_in_words(word_timings, "feedback summary")
-    # The feedback highlight should fade when this sentence finishes.
-    feedback_end_phrase = "So you started in the right direction, but did not complete the full tracing"
-
-    # Build token index to locate the end of the feedback summary sentence
-    tokens: List[str] = []
-    token_to_word_idx: List[int] = []
-    for idx, entry in enumerate(word_timings):
-        token = normalize_token(entry.get("word", ""))
-        if not token:
-            continue
-        tokens.append(token)
-        token_to_word_idx.append(idx)
-
-    phrase_tokens = tokenize_phrase(feedback_end_phrase)
-    phrase_start_frame: Optional[int] = None
-    if tokens and phrase_tokens:
-        window = find_phrase_windows(tokens, phrase_tokens, start_token_idx=0, max_gap=4, max_matches=1)
-        if window:
-            token_start, _ = window[0]
-            start_word_idx = token_to_word_idx[token_start]
-            phrase_start_frame = word_timings[start_word_idx]["startFrame"]
-
-
-    highlights = build_block_highlights(word_timings, get_question_summary_specs(question), total_frames)
-
-    feedback_highlight = next((h for h in highlights if h["blockId"] == "feedback_block"), None)
-    score_highlight = next((h for h in highlights if h["blockId"] == "score_badge"), None)
-    question_highlight = next((h for h in highlights if h["blockId"] == "question_block"), None)
-
-    # Extend question block highlight until the phrase is finished (robust match)
-    question_end_phrase = "You had to find where the price difference is coming from."
-    question_phrase_tokens = tokenize_phrase(question_end_phrase)
-    question_phrase_start_frame = None
-    if tokens and question_phrase_tokens:
-        window = find_phrase_windows(tokens, question_phrase_tokens, start_token_idx=0, max_gap=6, max_matches=1)
-        if window:
-            token_start, token_end = window[0]
-            # Use the END of the phrase for highlight end
-            end_word_idx = token_to_word_idx[token_end]
-            question_phrase_start_frame = word_timings[end_word_idx]["endFrame"]
+    def __init__(
+        self,
+        timing_data: Dict[str, Any],
+        session: Optional[Dict[str, Any]] = None,
+        fps: int = FPS,
+        alignment_cache: Optional[Dict[Tuple[Tuple[str, ...], ...], List[PhraseAlignment]]] = None,
+    ):
+        self.timing_data = timing_data
+        self.session = session or {}
+        self.fps = fps
+        # Engines made by at_fps share the cache and stay quiet about lookups the first one already reported.
+        self.primary = alignment_cache is None
+        self.alignment_cache = {} if alignment_cache is None else alignment_cache
+        if is_compact(timing_data):
+            self.frames = WordFrames.from_columns(
+                timing_data["text"], timing_data["start"], timing_data["end"], timing_data["rate"], fps
+            )
         else:
-            print(f"[WARN] Could not find phrase for question block highlight: '{question_end_phrase}'")
-    if question_highlight:
-        if question_phrase_start_frame is not None:
-            question_highlight["endFrame"] = question_phrase_start_frame
-            for seg in question_highlight.get("segments", []):
-                seg["endFrame"] = question_phrase_start_frame
+            self.frames = WordFrames.from_seconds(timing_data.get("words", []), fps)
+        self.word_timings = self.frames.to_word_timings()
+        self.index = TokenIndex(self.word_timings)
+
+    def at_fps(self, fps: int) -> "ChoreographyEngine":
+        """Engine for the same narration at another frame rate, sharing phrase alignments."""
+        if fps == self.fps:
+            return self
+        return ChoreographyEngine(self.timing_data, self.session, fps, self.alignment_cache)
+
+    def f(self, frames: int) -> int:
+        """Frame count written for FPS, at this engine's rate."""
+        return scale_frames(frames, self.fps)
+
+    def duration(self, default_sec: float) -> Tuple[float, int]:
+        if is_compact(self.timing_data):
+            duration_sec = timing_summary(self.timing_data)["duration_sec"]
         else:
-            # Fallback: keep highlight until end of narration
-            question_highlight["endFrame"] = total_frames
-            for seg in question_highlight.get("segments", []):
-                seg["endFrame"] = total_frames
-
-    if feedback_highlight:
-        if feedback_intro_frame is not None:
-            feedback_highlight["startFrame"] = feedback_intro_frame
-            for seg in feedback_highlight.get("segments", []):
-                seg["startFrame"] = feedback_intro_frame
-        if phrase_start_frame is not None:
-            cut_frame = max(phrase_start_frame, feedback_highlight["startFrame"])
-            feedback_highlight["endFrame"] = cut_frame
-            for seg in feedback_highlight.get("segments", []):
-                seg["endFrame"] = cut_frame
-
-    animation_map = {
-        "problem_scenario": "fadeIn",
-        "data_simplified": "fadeIn",
-        "business_rules": "fadeIn",
-        "performance_constraints": "fadeIn",
-        "question_block": "slideInRight",
-        "feedback_block": "slideInRight",
-        "score_badge": "scaleIn",
-    }
-    animations = [
-        animation_from_highlight(
-            h["blockId"],
-            h,
-            animation_map.get(h["blockId"], "fadeIn"),
-            duration=35 if h["blockId"] != "score_badge" else 30,
-            lead=0 if h["blockId"] == "feedback_block" else 15,
+            duration_sec = self.timing_data.get("duration_sec", default_sec)
+        return duration_sec, seconds_to_frames(duration_sec, self.fps)
+
+    def question(self, question_id: str) -> Dict[str, Any]:
+        return get_question_data(self.session, question_id)
+
+    def find_phrase(self, search_phrase: str, start_frame: int = 0) -> Optional[int]:
+        return self.index.find_phrase_start(search_phrase, start_frame)
+
+    def block_highlights(
+        self,
+        block_specs: List[Dict[str, Any]],
+        total_frames: int,
+        match_mode: str = MATCH_ORDERED,
+    ) -> List[Dict[str, Any]]:
+        return build_block_highlights(
+            self.word_timings,
+            block_specs,
+            total_frames,
+            self.index,
+            match_mode,
+            self.frames,
+            self.fps,
+            self.alignment_cache,
         )
-        for h in highlights
-    ]
-    if score_highlight:
-        animations.append(
-            {
-                "blockId": "score_number",
-                "type": "counterAnimation",
-                "startFrame": max(score_highlight["startFrame"] - 5, 0),
-                "durationFrames": 40,
-                "easing": "linear",
+
+    def animation(
+        self,
+        block_id: str,
+        highlight: Dict[str, Any],
+        animation_type: str,
+        duration: int = 30,
+        lead: int = 12,
+    ) -> Dict[str, Any]:
+        """animation_from_highlight with duration and lead given in FPS frames."""
+        return animation_from_highlight(block_id, highlight, animation_type, self.f(duration), self.f(lead))
+
+    def intro(self) -> Dict[str, Any]:
+        duration_sec, total_frames = self.duration(6.0)
+
+        return {
+            "slideType": "intro_welcome",
+            "fps": self.fps,
+            "totalDurationFrames": total_frames,
+            "actualDurationSec": duration_sec,
+            "animations": [
+                {
+                    "blockId": "intro_caption",
+                    "type": "fadeIn",
+                    "startFrame": 0,
+                    "durationFrames": self.f(60),
+                    "easing": "easeOut"
+                }
+            ],
+            "narration": {
+                "audioFile": self.timing_data["audio_file"],
+                "startFrame": 0,
+                "endFrame": total_frames,
+                "durationSec": duration_sec,
+                "wordTimings": self.word_timings
             }
-        )
-    
-    return {
-        "slideType": f"{question_id}_summary",
-        "totalDurationFrames": total_frames,
-        "actualDurationSec": duration_sec,
-        "animations": animations,
-        "highlights": highlights,
-        "narration": {
-            "audioFile": timing_data["audio_file"],
-            "startFrame": 0,
-            "endFrame": total_frames,
-            "durationSec": duration_sec,
-            "wordTimings": word_timings
         }
-    }
 
+    def case_overview(self, question: Dict[str, Any]) -> Dict[str, Any]:
+        duration_sec, total_frames = self.duration(15.0)
+        word_timings = self.word_timings
+        block_specs = get_case_overview_specs(question)
+        highlights = self.block_highlights(block_specs, total_frames)
+        animation_map = {
+            "problem_scenario": "slideInLeft",
+            "data_simplified": "slideInRight",
+            "business_rules": "slideInLeft",
+            "performance_constraints": "slideInRight",
+        }
+        animations = [
+            self.animation(
+                h["blockId"],
+                h,
+                animation_map.get(h["blockId"], "fadeIn"),
+                duration=40,
+                lead=18,
+            )
+            for h in highlights
+        ]
 
-def create_feedback_blocks_choreography(timing_data: Dict[str, Any], question_id: str) -> Dict[str, Any]:
-    duration_sec = timing_data.get("duration_sec", 9.0)
-    total_frames = seconds_to_frames(duration_sec)
-    question = get_question_data(question_id)
-    word_timings = convert_word_timings_to_frames(timing_data.get("words", []))
-    right_intro_frame = (
-        find_phrase_in_words(word_timings, "let's start") or find_phrase_in_words(word_timings, "lets start")
-    )
-    wrong_intro_frame = (
-        find_phrase_in_words(word_timings, "now let's see what went wrong")
-        or find_phrase_in_words(word_timings, "what went wrong")
-    )
-    highlights = build_block_highlights(word_timings, get_feedback_specs(question), total_frames)
-    right_highlight = next((h for h in highlights if h["blockId"] == "right_box"), None)
-    wrong_highlight = next((h for h in highlights if h["blockId"] == "wrong_box"), None)
-
-    if right_highlight and right_intro_frame is not None:
-        right_highlight["startFrame"] = right_intro_frame
-        for seg in right_highlight.get("segments", []):
-            seg["startFrame"] = right_intro_frame
-
-    # Nudge the wrong block to light up as soon as the narration pivots
-    if wrong_highlight and wrong_intro_frame is not None:
-        wrong_highlight["startFrame"] = max(
-            min(wrong_highlight["startFrame"], wrong_intro_frame - 2),
-            0,
-        )
+        return {
+            "slideType": "case_overview",
+            "fps": self.fps,
+            "totalDurationFrames": total_frames,
+            "actualDurationSec": duration_sec,
+            "animations": animations,
+            "highlights": highlights,
+            "narration": {
+                "audioFile": self.timing_data["audio_file"],
+                "startFrame": 0,
+                "endFrame": total_frames,
+                "durationSec": duration_sec,
+                "wordTimings": word_timings
+            }
+        }
 
-    animations = [
-        animation_from_highlight(
-            h["blockId"],
-            h,
-            "slideInLeft" if h["blockId"] == "right_box" else "slideInRight",
-            duration=45,
-            lead=0 if h["blockId"] == "right_box" else 20,
-        )
-        for h in highlights
-    ]
+    def question_summary(self, question_id: str) -> Dict[str, Any]:
+        duration_sec, total_frames = self.duration(8.0)
+        question = self.question(question_id)
+        word_timings = self.word_timings
+        feedback_intro_frame = self.find_phrase("feedback summary")
+        # The feedback highlight should fade when this sentence finishes.
+        feedback_end_phrase = "So you started in the right direction, but did not complete the full tracing"
+
+        # Locate the end of the feedback summary sentence
+        tokens = self.index.tokens
+        token_to_word_idx = self.index.token_to_word_idx
+
+        phrase_tokens = tokenize_phrase(feedback_end_phrase)
+        phrase_start_frame: Optional[int] = None
+        if tokens and phrase_tokens:
+            window = self.index.find_windows(phrase_tokens, start_token_idx=0, max_gap=4, max_matches=1)
+            if window:
+                token_start, _ = window[0]
+                start_word_idx = token_to_word_idx[token_start]
+                phrase_start_frame = word_timings[start_word_idx]["startFrame"]
 
-    wrong_bullet_anchor = find_phrase_in_words(
-        word_timings,
-        "one",
-        start_frame=wrong_intro_frame or 0,
-    )
 
-    if right_highlight:
-        animations.append(
-            {
-                "blockId": "right_bullets",
-                "type": "fadeIn",
-                "startFrame": max(right_highlight["startFrame"] - 5, 0),
-                "durationFrames": 30,
-                "easing": "easeOut",
-                "stagger": 10,
+        highlights = self.block_highlights(get_question_summary_specs(question), total_frames)
+
+        feedback_highlight = next((h for h in highlights if h["blockId"] == "feedback_block"), None)
+        score_highlight = next((h for h in highlights if h["blockId"] == "score_badge"), None)
+        question_highlight = next((h for h in highlights if h["blockId"] == "question_block"), None)
+
+        # Extend question block highlight until the phrase is finished (robust match)
+        question_end_phrase = "You had to find where the price difference is coming from."
+        question_phrase_tokens = tokenize_phrase(question_end_phrase)
+        question_phrase_start_frame = None
+        if tokens and question_phrase_tokens:
+            window = self.index.find_windows(question_phrase_tokens, start_token_idx=0, max_gap=6, max_matches=1)
+            if window:
+                token_start, token_end = window[0]
+                # Use the END of the phrase for highlight end
+                end_word_idx = token_to_word_idx[token_end]
+                question_phrase_start_frame = word_timings[end_word_idx]["endFrame"]
+            elif self.primary:
+                print(f"[WARN] Could not find phrase for question block highlight: '{question_end_phrase}'")
+        if question_highlight:
+            if question_phrase_start_frame is not None:
+                question_highlight["endFrame"] = question_phrase_start_frame
+                for seg in question_highlight.get("segments", []):
+                    seg["endFrame"] = question_phrase_start_frame
+            else:
+                # Fallback: keep highlight until end of narration
+                question_highlight["endFrame"] = total_frames
+                for seg in question_highlight.get("segments", []):
+                    seg["endFrame"] = total_frames
+
+        if feedback_highlight:
+            if feedback_intro_frame is not None:
+                feedback_highlight["startFrame"] = feedback_intro_frame
+                for seg in feedback_highlight.get("segments", []):
+                    seg["startFrame"] = feedback_intro_frame
+            if phrase_start_frame is not None:
+                cut_frame = max(phrase_start_frame, feedback_highlight["startFrame"])
+                feedback_highlight["endFrame"] = cut_frame
+                for seg in feedback_highlight.get("segments", []):
+                    seg["endFrame"] = cut_frame
+
+        animation_map = {
+            "problem_scenario": "fadeIn",
+            "data_simplified": "fadeIn",
+            "business_rules": "fadeIn",
+            "performance_constraints": "fadeIn",
+            "question_block": "slideInRight",
+            "feedback_block": "slideInRight",
+            "score_badge": "scaleIn",
+        }
+        animations = [
+            self.animation(
+                h["blockId"],
+                h,
+                animation_map.get(h["blockId"], "fadeIn"),
+                duration=35 if h["blockId"] != "score_badge" else 30,
+                lead=0 if h["blockId"] == "feedback_block" else 15,
+            )
+            for h in highlights
+        ]
+        if score_highlight:
+            animations.append(
+                {
+                    "blockId": "score_number",
+                    "type": "counterAnimation",
+                    "startFrame": max(score_highlight["startFrame"] - self.f(5), 0),
+                    "durationFrames": self.f(40),
+                    "easing": "linear",
+                }
+            )
+
+        return {
+            "slideType": f"{question_id}_summary",
+            "fps": self.fps,
+            "totalDurationFrames": total_frames,
+            "actualDurationSec": duration_sec,
+            "animations": animations,
+            "highlights": highlights,
+            "narration": {
+                "audioFile": self.timing_data["audio_file"],
+                "startFrame": 0,
+                "endFrame": total_frames,
+                "durationSec": duration_sec,
+                "wordTimings": word_timings
             }
+        }
+
+    def feedback_blocks(self, question_id: str) -> Dict[str, Any]:
+        duration_sec, total_frames = self.duration(9.0)
+        question = self.question(question_id)
+        word_timings = self.word_timings
+        right_intro_frame = (
+            self.find_phrase("let's start")
+            or self.find_phrase("lets start")
         )
-    if wrong_highlight:
-        wrong_bullet_start = (
-            max(wrong_bullet_anchor - 2, 0)
-            if wrong_bullet_anchor is not None
-            else max(wrong_highlight["startFrame"] - 5, 0)
+        wrong_intro_frame = (
+            self.find_phrase("now let's see what went wrong")
+            or self.find_phrase("what went wrong")
         )
-        animations.append(
-            {
-                "blockId": "wrong_bullets",
-                "type": "fadeIn",
-                "startFrame": wrong_bullet_start,
-                "durationFrames": 30,
-                "easing": "easeOut",
-                "stagger": 10,
+        highlights = self.block_highlights(get_feedback_specs(question), total_frames)
+        right_highlight = next((h for h in highlights if h["blockId"] == "right_box"), None)
+        wrong_highlight = next((h for h in highlights if h["blockId"] == "wrong_box"), None)
+
+        if right_highlight and right_intro_frame is not None:
+            right_highlight["startFrame"] = right_intro_frame
+            for seg in right_highlight.get("segments", []):
+                seg["startFrame"] = right_intro_frame
+
+        # Nudge the wrong block to light up as soon as the narration pivots
+        if wrong_highlight and wrong_intro_frame is not None:
+            wrong_highlight["startFrame"] = max(
+                min(wrong_highlight["startFrame"], wrong_intro_frame - self.f(2)),
+                0,
+            )
+
+        animations = [
+            self.animation(
+                h["blockId"],
+                h,
+                "slideInLeft" if h["blockId"] == "right_box" else "slideInRight",
+                duration=45,
+                lead=0 if h["blockId"] == "right_box" else 20,
+            )
+            for h in highlights
+        ]
+
+        wrong_bullet_anchor = self.find_phrase("one", start_frame=wrong_intro_frame or 0)
+
+        if right_highlight:
+            animations.append(
+                {
+                    "blockId": "right_bullets",
+                    "type": "fadeIn",
+                    "startFrame": max(right_highlight["startFrame"] - self.f(5), 0),
+                    "durationFrames": self.f(30),
+                    "easing": "easeOut",
+                    "stagger": self.f(10),
+                }
+            )
+        if wrong_highlight:
+            wrong_bullet_start = (
+                max(wrong_bullet_anchor - self.f(2), 0)
+                if wrong_bullet_anchor is not None
+                else max(wrong_highlight["startFrame"] - self.f(5), 0)
+            )
+            animations.append(
+                {
+                    "blockId": "wrong_bullets",
+                    "type": "fadeIn",
+                    "startFrame": wrong_bullet_start,
+                    "durationFrames": self.f(30),
+                    "easing": "easeOut",
+                    "stagger": self.f(10),
+                }
+            )
+
+        return {
+            "slideType": f"{question_id}_feedback",
+            "fps": self.fps,
+            "totalDurationFrames": total_frames,
+            "actualDurationSec": duration_sec,
+            "animations": animations,
+            "highlights": highlights,
+            "narration": {
+                "audioFile": self.timing_data["audio_file"],
+                "startFrame": 0,
+                "endFrame": total_frames,
+                "durationSec": duration_sec,
+                "wordTimings": word_timings
             }
-        )
-    
-    return {
-        "slideType": f"{question_id}_feedback",
-        "totalDurationFrames": total_frames,
-        "actualDurationSec": duration_sec,
-        "animations": animations,
-        "highlights": highlights,
-        "narration": {
-            "audioFile": timing_data["audio_file"],
-            "startFrame": 0,
-            "endFrame": total_frames,
-            "durationSec": duration_sec,
-            "wordTimings": word_timings
         }
-    }
 
+    def thinking_steps(self, question_id: str) -> Dict[str, Any]:
+        """
+        FIXED v2: Segments remain individual, but column startFrame marks when
+        the column becomes available for row-by-row reveal.
+        """
+        duration_sec, total_frames = self.duration(10.0)
+        question = self.question(question_id)
+        word_timings = self.word_timings
+
+
+        # Find when column introductions are spoken
+        thought_intro_frame = self.find_phrase("How You Thought")
+        advice_intro_frame = self.find_phrase("Thinking Advice")
+        # Show advice column at the very start (frame 0)
+        my_advice_frame = 0
+
+        # Build highlights - segments stay as they are (individual row timings)
+        highlights = self.block_highlights(get_thinking_specs(question), total_frames, MATCH_PER_BLOCK)
+
+        # Update ONLY the column-level startFrame (not individual segments)
+        # This tells the frontend when the column is "unlocked" for display
+        for highlight in highlights:
+            if highlight["blockId"] == "col_thought" and thought_intro_frame:
+                highlight["startFrame"] = thought_intro_frame
+            elif highlight["blockId"] == "col_advice":
+                # Use the frame for 'my advice' (not 'my advice is to')
+                if my_advice_frame is not None:
+                    highlight["startFrame"] = my_advice_frame
+                    for seg in highlight.get("segments", []):
+                        seg["startFrame"] = max(seg.get("startFrame", my_advice_frame), my_advice_frame)
+                elif advice_intro_frame:
+                    highlight["startFrame"] = advice_intro_frame
+
+        animations = [
+            self.animation(
+                h["blockId"],
+                h,
+                "slideInLeft" if h["blockId"] == "col_steps" else "slideInUp",
+                duration=40,
+                lead=0 if h["blockId"] == "col_advice" else 18,
+            )
+            for h in highlights
+        ]
 
-def create_thinking_steps_choreography(timing_data: Dict[str, Any], question_id: str) -> Dict[str, Any]:
-    """
-    FIXED v2: Segments remain individual, but column startFrame marks when
-    the column becomes available for row-by-row reveal.
-    """
-    duration_sec = timing_data.get("duration_sec", 10.0)
-    total_frames = seconds_to_frames(duration_sec)
-    question = get_question_data(question_id)
-    word_timings = convert_word_timings_to_frames(timing_data.get("words", []))
-    
-    # Find when column introductions are spoken
-    thought_intro_frame = find_phrase_in_words(word_timings, "How You Thought")
-    advice_intro_frame = find_phrase_in_words(word_timings, "Thinking Advice")
-    # Show advice column at the very start (frame 0)
-    my_advice_frame = 0
-    
-    # Build highlights - segments stay as they are (individual row timings)
-    highlights = build_block_highlights(word_timings, get_thinking_specs(question), total_frames)
-    
-    # Update ONLY the column-level startFrame (not individual segments)
-    # This tells the frontend when the column is "unlocked" for display
-    for highlight in highlights:
-        if highlight["blockId"] == "col_thought" and thought_intro_frame:
-            highlight["startFrame"] = thought_intro_frame
-        elif highlight["blockId"] == "col_advice":
-            # Use the frame for 'my advice' (not 'my advice is to')
-            if my_advice_frame is not None:
-                highlight["startFrame"] = my_advice_frame
-                for seg in highlight.get("segments", []):
-                    seg["startFrame"] = max(seg.get("startFrame", my_advice_frame), my_advice_frame)
-            elif advice_intro_frame:
-                highlight["startFrame"] = advice_intro_frame
-    
-    animations = [
-        animation_from_highlight(
-            h["blockId"],
-            h,
-            "slideInLeft" if h["blockId"] == "col_steps" else "slideInUp",
-            duration=40,
-            lead=0 if h["blockId"] == "col_advice" else 18,
-        )
-        for h in highlights
-    ]
-    
-    return {
-        "slideType": f"{question_id}_thinking",
-        "totalDurationFrames": total_frames,
-        "actualDurationSec": duration_sec,
-        "animations": animations,
-        "highlights": highlights,
-        "narration": {
-            "audioFile": timing_data["audio_file"],
-            "startFrame": 0,
-            "endFrame": total_frames,
-            "durationSec": duration_sec,
-            "wordTimings": word_timings
+        return {
+            "slideType": f"{question_id}_thinking",
+            "fps": self.fps,
+            "totalDurationFrames": total_frames,
+            "actualDurationSec": duration_sec,
+            "animations": animations,
+            "highlights": highlights,
+            "narration": {
+                "audioFile": self.timing_data["audio_file"],
+                "startFrame": 0,
+                "endFrame": total_frames,
+                "durationSec": duration_sec,
+                "wordTimings": word_timings
+            }
         }
+
+
+# Audio stem ("q1_summary") -> manifest entry. Built once per run, so looking
+# up a timing file is a dict hit instead of a scan of the whole manifest.
+ManifestIndex = Dict[str, Dict[str, Any]]
+
+
+def index_manifest(manifest: List[Dict[str, Any]]) -> ManifestIndex:
+    """Manifest entries keyed by the stem of their narration audio file (first entry wins)."""
+    index: ManifestIndex = {}
+    for entry in manifest:
+        audio_file = (entry.get("narration") or {}).get("audio_file", "")
+        if audio_file:
+            index.setdefault(Path(audio_file).stem, entry)
+    return index
+
+
+def find_manifest_entry(filename: str, manifest_index: ManifestIndex) -> Dict[str, Any] | None:
+    """Exact stem match, so q1_summary never picks up q11_summary's entry."""
+    return manifest_index.get(filename)
+
+
+def slide_fingerprint(
+    timing_file: Path,
+    manifest_entry: Dict[str, Any],
+    session: Dict[str, Any],
+    rates: Sequence[int] = (FPS,),
+) -> Dict[str, str]:
+    """Digest of every input one slide's choreography depends on, per component."""
+    question_id = manifest_entry.get("question_id", "")
+    return {
+        "timing": _digest(timing_file.read_bytes()),
+        "question": _digest(get_question_data(session, question_id)),
+        "slide": _digest({"slide_type": manifest_entry.get("slide_type", ""), "question_id": question_id}),
+        "engine": f"{ENGINE_VERSION}@{','.join(str(fps) for fps in rates)}fps",
     }
 
 
-def process_timing_file(timing_file: Path, manifest: List[Dict[str, Any]]) -> Dict[str, Any] | None:
-    timing_data = json.loads(timing_file.read_text(encoding="utf-8"))
+FINGERPRINT_REASONS = {
+    "timing": "timing changed",
+    "question": "question data changed",
+    "slide": "manifest entry changed",
+    "engine": "engine version changed",
+}
+
+
+def output_name(timing_file: Path) -> str:
+    """Choreography/word-table file name for a timing file; outputs are JSON whatever the timing encoding."""
+    return f"{timing_file.stem}.json"
+
+
+def output_dirs(fps: int, workspace: SessionWorkspace | None = None) -> Tuple[Path, Path]:
+    """(choreography dir, word tables dir) for one output rate; the base FPS writes to the top level."""
+    workspace = workspace or SessionWorkspace.default()
+    if fps == FPS:
+        return workspace.choreography_dir, workspace.word_tables_dir
+    return workspace.choreography_dir / f"{fps}fps", workspace.word_tables_dir / f"{fps}fps"
+
+
+def word_table_id(stem: str, fps: int) -> str:
+    """Table id, relative to the word tables dir, that a choreography at this rate references."""
+    return stem if fps == FPS else f"{fps}fps/{stem}"
+
+
+def rebuild_reason(
+    name: str,
+    fingerprint: Dict[str, str] | None,
+    previous: Dict[str, Dict[str, str]],
+    rates: Sequence[int] = (FPS,),
+    workspace: SessionWorkspace | None = None,
+) -> str | None:
+    """Why a slide must be rebuilt, or None if its stored fingerprint still matches."""
+    if fingerprint is None:
+        return "no manifest entry"
+    outputs = [directory / name for fps in rates for directory in output_dirs(fps, workspace)]
+    return build_state.rebuild_reason(name, fingerprint, previous, FINGERPRINT_REASONS, outputs)
+
+
+def load_fingerprints(workspace: SessionWorkspace | None = None) -> Dict[str, Dict[str, str]]:
+    return build_state.load_fingerprints((workspace or SessionWorkspace.default()).build_dir / FINGERPRINTS_NAME)
+
+
+def save_fingerprints(fingerprints: Dict[str, Dict[str, str]], workspace: SessionWorkspace | None = None) -> None:
+    build_state.save_fingerprints((workspace or SessionWorkspace.default()).build_dir / FINGERPRINTS_NAME, fingerprints)
+
+
+SlideBuilder = Callable[["ChoreographyEngine", str], Dict[str, Any]]
+
+# slide_type (as written by build_narration) -> slide builder.
+SLIDE_BUILDERS: Dict[str, SlideBuilder] = {
+    "intro": lambda engine, question_id: engine.intro(),
+    "case": lambda engine, question_id: engine.case_overview(engine.question(question_id)),
+    "q_summary": lambda engine, question_id: engine.question_summary(question_id),
+    "feedback_blocks": lambda engine, question_id: engine.feedback_blocks(question_id),
+    "thinking_steps": lambda engine, question_id: engine.thinking_steps(question_id),
+}
+
+
+def process_timing_file(
+    timing_file: Path,
+    manifest_index: ManifestIndex,
+    session: Optional[Dict[str, Any]] = None,
+    rates: Sequence[int] = (FPS,),
+    timing: Optional[Dict[str, Any]] = None,
+) -> Dict[int, Dict[str, Any]] | None:
+    """
+    Choreography for one timing file at every rate in rates, keyed by fps.
+    Phrases are aligned once, by the first rate's engine; the others reuse
+    its alignments and only re-quantize to their own frames. timing is the
+    file's payload when the caller already holds it in memory.
+    """
+    if session is None:
+        session = load_session_data()
     filename = timing_file.stem
     
-    manifest_entry = None
-    for entry in manifest:
-        audio_file = entry.get("narration", {}).get("audio_file", "")
-        if filename in audio_file or audio_file.replace("audio/", "").replace(".mp3", "") == filename:
-            manifest_entry = entry
-            break
+    manifest_entry = find_manifest_entry(filename, manifest_index)
     
     if not manifest_entry:
         print(f"  ⚠️  No manifest entry found for {filename}, skipping")
@@ -716,56 +978,202 @@ def process_timing_file(timing_file: Path, manifest: List[Dict[str, Any]]) -> Di
     
     slide_type = manifest_entry.get("slide_type", "")
     question_id = manifest_entry.get("question_id", "")
-    question_data = get_question_data(question_id)
-    
-    if "intro" in filename or slide_type == "intro":
-        return create_intro_choreography(timing_data)
-    elif "case" in filename or slide_type == "case":
-        return create_case_overview_choreography(timing_data, question_data)
-    elif "summary" in filename or slide_type == "q_summary":
-        return create_question_summary_choreography(timing_data, question_id)
-    elif "feedback" in filename or slide_type == "feedback_blocks":
-        return create_feedback_blocks_choreography(timing_data, question_id)
-    elif "thinking" in filename or slide_type == "thinking_steps":
-        return create_thinking_steps_choreography(timing_data, question_id)
-    else:
+    builder = SLIDE_BUILDERS.get(slide_type)
+    if builder is None:
         print(f"  ⚠️  Unknown slide type '{slide_type}' for {filename}")
         return None
+    
+    if timing is None:
+        timing = decode_timing(timing_file)
+    engine = ChoreographyEngine(timing, session, rates[0])
+    return {fps: builder(engine.at_fps(fps), question_id) for fps in rates}
+
+
+def _compute_one(
+    timing_file: Path,
+    manifest_index: ManifestIndex,
+    session: Dict[str, Any],
+    rates: Sequence[int] = (FPS,),
+    timing: Optional[Dict[str, Any]] = None,
+) -> Tuple[Optional[Dict[int, Dict[str, Any]]], str]:
+    """Choreography per rate for one timing file plus everything it printed, so logs can be replayed in order."""
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        print(f"Processing {timing_file.name}...")
+        choreographies = process_timing_file(timing_file, manifest_index, session, rates, timing)
+    for choreography in (choreographies or {}).values():
+        choreography["timeline"] = compile_timeline(choreography)
+    return choreographies, log.getvalue()
+
+
+# Per-process copy of the manifest index, session and in-memory timings, installed
+# once by the pool initializer instead of being pickled with every task.
+_WORKER_CONTEXT: Dict[str, Any] = {}
+
+
+def _init_worker(
+    manifest_index: ManifestIndex,
+    session: Dict[str, Any],
+    rates: Sequence[int],
+    timings: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> None:
+    _WORKER_CONTEXT["manifest_index"] = manifest_index
+    _WORKER_CONTEXT["session"] = session
+    _WORKER_CONTEXT["rates"] = rates
+    _WORKER_CONTEXT["timings"] = timings or {}
+
+
+def _compute_in_worker(timing_file: Path) -> Tuple[Optional[Dict[int, Dict[str, Any]]], str]:
+    return _compute_one(
+        timing_file,
+        _WORKER_CONTEXT["manifest_index"],
+        _WORKER_CONTEXT["session"],
+        _WORKER_CONTEXT["rates"],
+        _WORKER_CONTEXT["timings"].get(timing_file.stem),
+    )
 
 
-def main() -> None:
-    if not TIMINGS_DIR.exists():
-        raise FileNotFoundError(f"Timings directory not found: {TIMINGS_DIR}")
-    
-    if not MANIFEST_PATH.exists():
-        raise FileNotFoundError(f"Narration manifest not found: {MANIFEST_PATH}")
+def compute_choreographies(
+    timing_files: List[Path],
+    manifest_index: ManifestIndex,
+    session: Dict[str, Any],
+    workers: int = DEFAULT_WORKERS,
+    rates: Sequence[int] = (FPS,),
+    timings: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> List[Tuple[Path, Optional[Dict[int, Dict[str, Any]]], str]]:
+    """
+    (timing_file, {fps: choreography} or None, log) for every file, in input order.
+    With workers > 1 each slide is computed in its own process; results are
+    collected in submission order, so the output does not depend on which
+    worker finishes first. timings ({stem: payload}) supplies payloads the
+    caller already holds; other files are read from disk.
+    """
+    timings = timings or {}
+    if workers <= 1 or len(timing_files) <= 1:
+        results = [
+            _compute_one(timing_file, manifest_index, session, rates, timings.get(timing_file.stem))
+            for timing_file in timing_files
+        ]
+    else:
+        workers = min(workers, len(timing_files))
+        worker_timings = {f.stem: timings[f.stem] for f in timing_files if f.stem in timings}
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(manifest_index, session, tuple(rates), worker_timings),
+        ) as pool:
+            # A few tasks per worker amortizes IPC without hurting load balance.
+            chunksize = max(len(timing_files) // (workers * 4), 1)
+            results = list(pool.map(_compute_in_worker, timing_files, chunksize=chunksize))
+    return [(timing_file, choreography, log) for timing_file, (choreography, log) in zip(timing_files, results)]
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Derive frame-accurate choreography from word timings")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Worker processes, one slide each (default from CHOREO_WORKERS, 1 = in-process)",
+    )
+    parser.add_argument("--force", action="store_true", help="Rebuild every slide, ignoring stored fingerprints")
+    parser.add_argument(
+        "--fps",
+        default=DEFAULT_OUTPUT_FPS,
+        help=f"Comma-separated output frame rates, e.g. 24,30,60 (default from CHOREO_FPS; {FPS} is always written)",
+    )
+    add_workspace_arguments(parser)
+    args = parser.parse_args(argv)
+    rates = parse_fps_list(args.fps)
+    workspace = workspace_from_args(args)
+
+    if not workspace.timings_dir.exists():
+        raise FileNotFoundError(f"Timings directory not found: {workspace.timings_dir}")
     
-    load_session_data()
+    if not workspace.manifest_path.exists():
+        raise FileNotFoundError(f"Narration manifest not found: {workspace.manifest_path}")
     
-    manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    build_choreographies(
+        load_session_data(workspace),
+        json.loads(workspace.manifest_path.read_text(encoding="utf-8")),
+        rates=rates,
+        workers=args.workers,
+        force=args.force,
+        workspace=workspace,
+    )
+
+
+def build_choreographies(
+    session: Dict[str, Any],
+    manifest: List[Dict[str, Any]],
+    rates: Sequence[int] = (FPS,),
+    workers: int = DEFAULT_WORKERS,
+    force: bool = False,
+    timings: Optional[Dict[str, Dict[str, Any]]] = None,
+    workspace: SessionWorkspace | None = None,
+) -> Dict[str, Dict[int, Dict[str, Any]]]:
+    """
+    Rebuild every stale slide's choreography and word tables in the workspace
+    and return the fresh choreographies as {output name: {fps: choreography}}.
+    timings ({stem: payload}) are the timing payloads already in memory, e.g.
+    handed over by the TTS stage; the timing files are still what gets
+    fingerprinted.
+    """
+    workspace = workspace or SessionWorkspace.default()
+    manifest_index = index_manifest(manifest)
     
-    CHOREOGRAPHY_DIR.mkdir(parents=True, exist_ok=True)
+    for fps in rates:
+        for directory in output_dirs(fps, workspace):
+            directory.mkdir(parents=True, exist_ok=True)
     
-    timing_files = list(TIMINGS_DIR.glob("*.json"))
-    generated_count = 0
+    timing_files = timing_paths(workspace.timings_dir)
+    generated: Dict[str, Dict[int, Dict[str, Any]]] = {}
     
     print("🎭 Calculating choreography from word timings...\n")
     
+    start = time.perf_counter()
+    previous = {} if force else load_fingerprints(workspace)
+    fingerprints: Dict[str, Dict[str, str]] = {}
+    reasons: Dict[str, str] = {}
     for timing_file in timing_files:
-        print(f"Processing {timing_file.name}...")
-        choreography = process_timing_file(timing_file, manifest)
+        name = output_name(timing_file)
+        entry = find_manifest_entry(timing_file.stem, manifest_index)
+        fingerprint = slide_fingerprint(timing_file, entry, session, rates) if entry else None
+        reason = "forced" if force else rebuild_reason(name, fingerprint, previous, rates, workspace)
+        if reason is None:
+            fingerprints[name] = fingerprint
+        else:
+            reasons[name] = reason
+            if fingerprint:
+                fingerprints[name] = fingerprint
+    stale = [timing_file for timing_file in timing_files if output_name(timing_file) in reasons]
+    
+    results = compute_choreographies(stale, manifest_index, session, workers=workers, rates=rates, timings=timings)
+    for timing_file, choreographies, log in results:
+        print(log, end="")
         
-        if choreography:
-            output_file = CHOREOGRAPHY_DIR / timing_file.name
-            output_file.write_text(
-                json.dumps(choreography, indent=2, ensure_ascii=False),
-                encoding="utf-8"
-            )
-            print(f"  ✅ Generated {output_file.name}")
-            generated_count += 1
+        name = output_name(timing_file)
+        if choreographies:
+            for fps, choreography in choreographies.items():
+                choreography_dir, tables_dir = output_dirs(fps, workspace)
+                # Words are written once, as a columnar table the choreography references by id.
+                choreography, word_table = split_word_table(choreography, word_table_id(timing_file.stem, fps), fps)
+                atomic_write_text(tables_dir / name, dumps_word_table(word_table))
+                atomic_write_text(choreography_dir / name, json.dumps(choreography, indent=2, ensure_ascii=False))
+                choreographies[fps] = choreography
+            print(f"  ✅ Generated {name} at {', '.join(f'{fps}fps' for fps in choreographies)} ({reasons[name]})")
+            generated[name] = choreographies
+        else:
+            fingerprints.pop(name, None)
+    save_fingerprints(fingerprints, workspace)
     
+    unchanged = len(timing_files) - len(stale)
     print(f"\n✅ Choreography calculation complete!")
-    print(f"   Generated {generated_count} choreography files in {CHOREOGRAPHY_DIR}")
+    print(f"   Generated {len(generated)} choreography files in {workspace.choreography_dir}")
+    if unchanged:
+        print(f"   ⏭️  {unchanged} slide(s) unchanged since the last build")
+    print(f"   ⏱️  {time.perf_counter() - start:.2f}s with {max(workers, 1)} worker(s)")
+    return generated
 
 
 if __name__ == "__main__":
@@ -0,0 +1,77 @@
+"""
+choreography_timeline.py
+------------------------
+Compiles the parts of a slide's choreography the Remotion hooks look up on
+every frame:
+
+ - word: a run-length encoded table of the active word, so "which word is
+   spoken at frame f" is a binary search over the runs instead of a scan of
+   every word timing (useActiveWordIndex, WordHighlight, useKeywordHighlight)
+ - blocks / animations: block id → index into highlights / animations, so
+   getBlockHighlight and getBlockAnimation do not search the lists
+
+A run table is {"frames": [...], "values": [...]}: values[k] holds from
+frames[k] until frames[k + 1]; -1 means nothing is active. Windows are
+inclusive on both ends, matching useKeywordHighlight, and when windows
+overlap the one that starts later wins. Highlight windows and segments are
+not compiled: a block window is one comparison per frame, and the slides
+re-derive segments from the narration before use.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Tuple
+
+TIMELINE_VERSION = 3
+NONE = -1
+
+
+def encode_runs(values: List[int]) -> Dict[str, List[int]]:
+    frames: List[int] = []
+    run_values: List[int] = []
+    for frame, value in enumerate(values):
+        if not run_values or run_values[-1] != value:
+            frames.append(frame)
+            run_values.append(value)
+    return {"frames": frames, "values": run_values}
+
+
+def lookup_run(runs: Dict[str, List[int]], frame: int) -> int:
+    """Value active at frame (the Python twin of lookupRun in hooks/useTimeline.ts)."""
+    k = bisect_right(runs["frames"], frame) - 1
+    return runs["values"][k] if k >= 0 else NONE
+
+
+def _paint(length: int, windows: Iterable[Tuple[int, int, int]]) -> List[int]:
+    """Dense per-frame values from (start, end_inclusive, value) windows, later starts winning."""
+    values = [NONE] * length
+    for start, end, value in sorted(windows, key=lambda w: w[0]):
+        for frame in range(max(start, 0), min(end, length - 1) + 1):
+            values[frame] = value
+    return values
+
+
+def compile_timeline(choreography: Dict[str, Any]) -> Dict[str, Any]:
+    words = (choreography.get("narration") or {}).get("wordTimings", [])
+    highlights = choreography.get("highlights", [])
+    animations = choreography.get("animations", [])
+
+    last_frame = choreography.get("totalDurationFrames", 0)
+    for word in words:
+        last_frame = max(last_frame, word["endFrame"])
+    # One frame past the last window so the word table ends on an inactive run.
+    length = last_frame + 2
+
+    blocks = {highlight["blockId"]: {"highlight": idx} for idx, highlight in enumerate(highlights)}
+    entrances: Dict[str, Any] = {}
+    for idx, animation in enumerate(animations):
+        entrances.setdefault(animation["blockId"], {"index": idx})
+
+    return {
+        "version": TIMELINE_VERSION,
+        "frames": length,
+        "word": encode_runs(_paint(length, [(w["startFrame"], w["endFrame"], k) for k, w in enumerate(words)])),
+        "blocks": blocks,
+        "animations": entrances,
+    }
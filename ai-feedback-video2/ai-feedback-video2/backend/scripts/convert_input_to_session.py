@@ -1,34 +1,61 @@
 # Wrapper script to convert input.txt (slides JSON) to session_questions.json using slides_payload_adapter.py
 from pathlib import Path
+import argparse
 import json
 import sys
 
-sys.path.insert(0, str(Path(__file__).parent))
-from slides_payload_adapter import load_slides_payload, convert_slides_to_session
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
-# Paths
-input_path = Path('../../input.txt').resolve()
-if not input_path.exists():
-    # Try workspace root
-    input_path = Path(__file__).parent.parent.parent / 'input.txt'
-    input_path = input_path.resolve()
+from backend.scripts.slides_payload_adapter import load_slides_payload, convert_slides_to_session  # noqa: E402
+from backend.scripts.workspace import (  # noqa: E402
+    SessionWorkspace,
+    add_workspace_arguments,
+    atomic_write_text,
+    workspace_from_args,
+)
+
+
+def find_input_path():
+    input_path = Path('../../input.txt').resolve()
     if not input_path.exists():
+        # Try workspace root
+        input_path = Path(__file__).parent.parent.parent / 'input.txt'
+        input_path = input_path.resolve()
+        if not input_path.exists():
+            raise FileNotFoundError(f"input.txt not found at {input_path}")
+    return input_path
+
+
+def convert(input_path=None, workspace=None):
+    """
+    Convert the authored slides JSON and write session_questions.json (backend
+    + frontend copy) into the workspace (the shared paths by default). Returns
+    (slides, session) so an in-process caller can hand both to the next stage
+    without re-reading them.
+    """
+    workspace = workspace or SessionWorkspace.default()
+    input_path = input_path or workspace.input_path or find_input_path()
+    if not Path(input_path).exists():
         raise FileNotFoundError(f"input.txt not found at {input_path}")
-output_path = Path(__file__).parent.parent / 'data' / 'session_questions.json'
-output_path.parent.mkdir(parents=True, exist_ok=True)
 
-slides = load_slides_payload(input_path)
-session = convert_slides_to_session(slides)
+    slides = load_slides_payload(input_path)
+    session = convert_slides_to_session(slides)
+    payload = json.dumps(session, ensure_ascii=False, indent=2)
+
+    # Write backend session_questions.json
+    atomic_write_text(workspace.session_path, payload)
+    print(f"session_questions.json written to {workspace.session_path}")
 
+    # Also copy to frontend for video-app
+    frontend_path = workspace.frontend_data_dir / 'session_questions.json'
+    atomic_write_text(frontend_path, payload)
+    print(f"session_questions.json also copied to {frontend_path}")
+    return slides, session
 
-# Write backend session_questions.json
-with open(output_path, 'w', encoding='utf-8') as f:
-    json.dump(session, f, ensure_ascii=False, indent=2)
-print(f"session_questions.json written to {output_path}")
 
-# Also copy to frontend for video-app
-frontend_path = Path(__file__).parent.parent.parent / 'video-app' / 'src' / 'data' / 'session_questions.json'
-frontend_path.parent.mkdir(parents=True, exist_ok=True)
-with open(frontend_path, 'w', encoding='utf-8') as f:
-    json.dump(session, f, ensure_ascii=False, indent=2)
-print(f"session_questions.json also copied to {frontend_path}")
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert authored slides JSON to session_questions.json")
+    add_workspace_arguments(parser)
+    convert(workspace=workspace_from_args(parser.parse_args()))
@@ -3,12 +3,19 @@ import sys
 import re
 from pathlib import Path
 
-# Usage: python extract_step_timings.py timings_json_path [fps]
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.scripts.frame_math import seconds_to_frames  # noqa: E402
+from backend.scripts.timing_format import load_timing  # noqa: E402
+
+# Usage: python extract_step_timings.py timings_path choreography_json_path [fps]
 # Example: python extract_step_timings.py ../output/timings/q1_thinking.json 30
+# The timing file may be legacy JSON, compact JSON or .msgpack.
 
 def extract_step_timings(timings_json, fps=30):
-    with open(timings_json, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_timing(Path(timings_json))
     words = data['words']
     steps = []
     i = 0
@@ -26,10 +33,12 @@ def extract_step_timings(timings_json, fps=30):
             steps.append({
                 'step_phrase': step_phrase,
                 'start_sec': words[i]['start_sec'],
-                'start_frame': int(round(words[i]['start_sec'] * fps)),
                 'word_index': i
             })
         i += 1
+    # Frames for every step in one conversion
+    for step, frame in zip(steps, seconds_to_frames([s['start_sec'] for s in steps], fps)):
+        step['start_frame'] = frame
     return steps
 
 def main():
@@ -38,13 +47,18 @@ def main():
         sys.exit(1)
     timings_json = sys.argv[1]
     choreo_json = sys.argv[2]
-    fps = int(sys.argv[3]) if len(sys.argv) > 3 else 30
+    # Default to the rate the choreography file was quantized at (24fps/, 60fps/ outputs differ)
+    fps = int(sys.argv[3]) if len(sys.argv) > 3 else choreography_fps(choreo_json)
     steps = extract_step_timings(timings_json, fps)
     print(f"Step phrase timings in {timings_json} (fps={fps}):\n")
     for step in steps:
         print(f"{step['step_phrase']}: start_sec={step['start_sec']:.3f}, start_frame={step['start_frame']}")
     update_choreography_json(choreo_json, steps, fps)
 
+def choreography_fps(choreo_json_path, default=30):
+    with open(choreo_json_path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('fps', default)
+
 def update_choreography_json(choreo_json_path, steps, fps=30):
     with open(choreo_json_path, 'r', encoding='utf-8') as f:
         choreo = json.load(f)
@@ -0,0 +1,165 @@
+"""
+frame_math.py
+-------------
+Vectorized seconds→frames conversion and highlight window arithmetic for the
+choreography stage.
+
+WordFrames holds one narration's word boundaries as frame columns, converted
+in a single array operation instead of a dict per word; compact timing
+payloads are read column by column, without expanding them to word dicts. offset_windows()
+applies the lead/trail frame offsets and clamping to many windows at once.
+
+NumPy is used when it is installed; otherwise the same functions fall back to
+plain lists. Both paths round half to even, exactly like round(), so the
+output is identical either way.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:  # optional: vectorized path
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+def _frames_column(seconds: Sequence[float], fps: int):
+    if HAS_NUMPY:
+        return np.rint(np.asarray(seconds, dtype=np.float64) * fps).astype(np.int64)
+    return [round(s * fps) for s in seconds]
+
+
+def _scaled_frames_column(values: Sequence[int], rate: int, fps: int):
+    """round(v / rate * fps) for integer values counted at rate per second."""
+    if HAS_NUMPY:
+        return np.rint(np.asarray(values, dtype=np.int64) / rate * fps).astype(np.int64)
+    return [round(v / rate * fps) for v in values]
+
+
+def _int_column(values: Sequence[int]):
+    return np.asarray(values, dtype=np.int64) if HAS_NUMPY else list(values)
+
+
+def _to_list(column) -> List[int]:
+    return column.tolist() if HAS_NUMPY else list(column)
+
+
+def seconds_to_frames(seconds: Sequence[float], fps: int) -> List[int]:
+    """round(s * fps) for every value."""
+    return _to_list(_frames_column(seconds, fps))
+
+
+def offset_windows(
+    starts: Sequence[int],
+    ends: Sequence[int],
+    lead: int = 0,
+    trail: int = 0,
+    lo: int = 0,
+    hi: Optional[int] = None,
+) -> List[Tuple[int, int]]:
+    """(start - lead, end + trail) per window, clamped to [lo, hi] (hi=None: no upper bound)."""
+    if HAS_NUMPY:
+        start_arr = np.maximum(np.asarray(starts, dtype=np.int64) - lead, lo)
+        end_arr = np.asarray(ends, dtype=np.int64) + trail
+        if hi is not None:
+            start_arr = np.minimum(start_arr, hi)
+            end_arr = np.minimum(end_arr, hi)
+        return list(zip(start_arr.tolist(), end_arr.tolist()))
+    windows = []
+    for start, end in zip(starts, ends):
+        start, end = max(start - lead, lo), end + trail
+        if hi is not None:
+            start, end = min(start, hi), min(end, hi)
+        windows.append((start, end))
+    return windows
+
+
+class WordFrames:
+    """
+    Frame-domain word boundaries of one narration, as parallel columns
+    (int64 arrays with NumPy, lists without).
+    """
+
+    def __init__(self, words: List[str], start, end, duration):
+        self.words = words
+        self.start = start
+        self.end = end
+        self.duration = duration
+
+    @classmethod
+    def from_seconds(cls, words: List[Dict[str, Any]], fps: int) -> "WordFrames":
+        """From legacy timing words ({"text", "start_sec", "end_sec", "duration_sec"})."""
+        count = len(words)
+        # One conversion for all three columns, split afterwards.
+        seconds = [w["start_sec"] for w in words]
+        seconds += [w["end_sec"] for w in words]
+        seconds += [w["duration_sec"] for w in words]
+        frames = _frames_column(seconds, fps)
+        return cls(
+            [w["text"] for w in words],
+            frames[:count],
+            frames[count:2 * count],
+            frames[2 * count:],
+        )
+
+    @classmethod
+    def from_columns(
+        cls,
+        text: List[str],
+        start: Sequence[int],
+        end: Sequence[int],
+        rate: int,
+        fps: int,
+    ) -> "WordFrames":
+        """From the integer columns of a compact timing payload (unit ticks or frames at rate)."""
+        # Durations come from the integer difference: for ticks that is the
+        # tick-rounded duration_sec to_legacy() produces, so frames match it exactly.
+        return cls(
+            list(text),
+            _scaled_frames_column(start, rate, fps),
+            _scaled_frames_column(end, rate, fps),
+            _scaled_frames_column([e - s for s, e in zip(start, end)], rate, fps),
+        )
+
+    @classmethod
+    def from_word_timings(cls, word_timings: List[Dict[str, Any]]) -> "WordFrames":
+        """From frame-domain wordTimings dicts (as stored in choreography)."""
+        return cls(
+            [w["word"] for w in word_timings],
+            _int_column([w["startFrame"] for w in word_timings]),
+            _int_column([w["endFrame"] for w in word_timings]),
+            _int_column([w["durationFrames"] for w in word_timings]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def windows(
+        self,
+        first: Sequence[int],
+        last: Sequence[int],
+        lead: int = 0,
+        trail: int = 0,
+        lo: int = 0,
+        hi: Optional[int] = None,
+    ) -> List[Tuple[int, int]]:
+        """Frame window from word first[k]'s start to word last[k]'s end, offset and clamped."""
+        if HAS_NUMPY:
+            starts = self.start[np.asarray(first, dtype=np.int64)]
+            ends = self.end[np.asarray(last, dtype=np.int64)]
+        else:
+            starts = [self.start[i] for i in first]
+            ends = [self.end[i] for i in last]
+        return offset_windows(starts, ends, lead, trail, lo, hi)
+
+    def to_word_timings(self) -> List[Dict[str, Any]]:
+        """Per-word dicts (plain ints) in the wordTimings shape the choreography JSON uses."""
+        return [
+            {"word": word, "startFrame": start, "endFrame": end, "durationFrames": duration}
+            for word, start, end, duration in zip(
+                self.words, _to_list(self.start), _to_list(self.end), _to_list(self.duration)
+            )
+        ]
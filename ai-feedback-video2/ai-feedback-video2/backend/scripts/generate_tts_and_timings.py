@@ -2,17 +2,51 @@
 """
 generate_tts_and_timings.py
 ---------------------------
-Reads backend/output/narration_manifest.json and synthesizes:
- - Audio files via Azure TTS
+Reads the session workspace's narration_manifest.json (backend/output/ by
+default, backend/workspaces/<id>/output/ with --session) and synthesizes:
+ - Audio files via Azure TTS (or the offline fake: --backend fake / TTS_BACKEND=fake)
  - Word-level timing JSON alongside each audio file
+
+Events are independent, so they can be synthesized concurrently:
+  python backend/scripts/generate_tts_and_timings.py --workers 4
+(or set TTS_WORKERS). Logs and timing files are still emitted in manifest order.
+
+--batch sends every clip in one bookmark-delimited request and splits the
+result back into per-clip files (fewer round trips for short clips).
+
+AZURE_TTS_STREAM=1 writes each clip's audio to disk chunk-by-chunk while it is
+being synthesized; the timing JSON still only appears once the clip is complete.
+
+--chunk-sentences splits long narrations (over TTS_CHUNK_THRESHOLD_CHARS) at
+sentence boundaries, synthesizes the sentences in parallel and stitches audio +
+word timings back together; unchanged sentences then hit the cache on re-runs.
+
+Every request goes through a scheduler that enforces --rps / --max-connections
+(TTS_MAX_RPS / TTS_MAX_CONNECTIONS) and retries throttling (429) and transient
+failures with jittered exponential backoff instead of failing the run.
+
+Clips are served from a content-addressed cache (backend/output/tts_cache, or
+TTS_CACHE_DIR) when text + voice + prosody are unchanged; --no-cache bypasses it.
+Before that, clips whose text, voice style and synthesis settings match the
+last build (and whose audio + timing files are still on disk) are not touched
+at all; every other clip is logged with the reason it was redone. --force
+re-synthesizes everything.
+
+--timing-format (TIMING_FORMAT) picks the timing file layout: legacy
+pretty-printed JSON (default), compact columnar JSON in 100-ns ticks, or the
+same columns as msgpack. See timing_format.py.
 """
 
 from __future__ import annotations
 
+import argparse
 import json
+import os
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
 
 from dotenv import load_dotenv
 
@@ -21,53 +55,350 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 BACKEND_DIR = PROJECT_ROOT / "backend"
-OUTPUT_DIR = BACKEND_DIR / "output"
-MANIFEST_PATH = OUTPUT_DIR / "narration_manifest.json"
-AUDIO_DIR = OUTPUT_DIR / "audio"
-TIMINGS_DIR = OUTPUT_DIR / "timings"
 
 load_dotenv(PROJECT_ROOT / ".env", override=True)
 
-from backend.tts.azure_tts import synthesize_with_timings  # noqa: E402
+DEFAULT_WORKERS = int(os.environ.get("TTS_WORKERS", "1"))
+# Shared by every session workspace: clips are content-addressed, so sessions
+# reuse each other's audio and concurrent writers store identical bytes.
+CACHE_DIR = Path(os.environ.get("TTS_CACHE_DIR", BACKEND_DIR / "output" / "tts_cache"))
+CACHE_MAX_MB = int(os.environ.get("TTS_CACHE_MAX_MB", "512"))
+DEFAULT_TIMING_FORMAT = os.environ.get("TIMING_FORMAT", "legacy")
+
+from backend.scripts import build_state  # noqa: E402
+from backend.scripts.timing_format import TIMING_FORMATS, decode_timing, timing_path_for, write_timing  # noqa: E402
+from backend.scripts.workspace import SessionWorkspace, add_workspace_arguments, workspace_from_args  # noqa: E402
+from backend.tts.backends import BACKEND_FACTORIES, get_backend  # noqa: E402
+from backend.tts.chunking import DEFAULT_CHUNK_WORKERS, ChunkedSynthesizer  # noqa: E402
+from backend.tts.scheduler import (  # noqa: E402
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RPS,
+    TTSScheduler,
+)
+from backend.tts.tts_cache import TTSCache  # noqa: E402
+
+TTS_FINGERPRINTS_NAME = "tts_fingerprints.json"
 
+CLIP_REASONS = {
+    "text": "narration text changed",
+    "voice": "voice style changed",
+    "synthesis": "TTS backend settings changed",
+    "format": "timing format changed",
+}
 
-def synthesize_manifest(manifest: list[Dict]) -> None:
-    AUDIO_DIR.mkdir(parents=True, exist_ok=True)
-    TIMINGS_DIR.mkdir(parents=True, exist_ok=True)
+# (text, output_path, voice_style) -> {"audio_file", "duration_sec", "words"}
+SynthesizeFn = Callable[[str, Path, Dict[str, str]], Dict]
+# [(text, output_path, voice_style), ...] -> [payload, ...] in the same order
+BatchSynthesizeFn = Callable[[Sequence[Tuple[str, Path, Dict[str, str]]]], List[Dict]]
 
+
+@dataclass
+class TTSJob:
+    index: int
+    audio_rel: str
+    audio_path: Path
+    timing_path: Path
+    text: str
+    voice_style: Dict[str, str]
+
+
+def collect_jobs(manifest: List[Dict], workspace: SessionWorkspace | None = None) -> List[TTSJob]:
+    workspace = workspace or SessionWorkspace.default()
+    jobs: List[TTSJob] = []
     for idx, event in enumerate(manifest, start=1):
         narration = event.get("narration")
         if not narration or not narration.get("text"):
             continue
 
-        text = narration["text"]
-        voice_style = narration.get("voice_style", {})
         audio_rel = narration["audio_file"]  # e.g. "audio/q1_summary.mp3"
-        audio_path = OUTPUT_DIR / audio_rel
+        jobs.append(
+            TTSJob(
+                index=idx,
+                audio_rel=audio_rel,
+                audio_path=workspace.output_dir / audio_rel,
+                timing_path=workspace.timings_dir / Path(audio_rel).with_suffix(".json").name,
+                text=narration["text"],
+                voice_style=narration.get("voice_style", {}),
+            )
+        )
+    return jobs
+
+
+def clip_fingerprint(job: TTSJob, synthesis_id: str, timing_format: str) -> Dict[str, str]:
+    """Digest of everything one clip's audio + timing file depend on, per component."""
+    return {
+        "text": build_state.digest(job.text),
+        "voice": build_state.digest(job.voice_style),
+        "synthesis": synthesis_id,
+        "format": timing_format,
+    }
+
+
+def _finalize(job: TTSJob, timing: Dict) -> Dict:
+    timing["audio_file"] = job.audio_rel.replace("\\", "/")
+    return timing
+
 
-        print(f"[{idx}/{len(manifest)}] Synthesizing {audio_rel}")
-        timing = synthesize_with_timings(text, audio_path, voice_style)
-        timing["audio_file"] = audio_rel.replace("\\", "/")
+def _run_job(job: TTSJob, synthesize: SynthesizeFn) -> Dict:
+    return _finalize(job, synthesize(job.text, job.audio_path, job.voice_style))
 
-        timing_filename = Path(audio_rel).with_suffix(".json").name
-        timing_path = TIMINGS_DIR / timing_filename
-        timing_path.write_text(json.dumps(timing, indent=2), encoding="utf-8")
-        print(f"  → saved audio to {audio_path}")
+
+def _iter_results(
+    jobs: List[TTSJob],
+    synthesize: SynthesizeFn,
+    workers: int,
+    synthesize_batch: BatchSynthesizeFn | None = None,
+) -> Iterator[Tuple[TTSJob, Callable[[], Dict]]]:
+    """Yield (job, get_result) pairs in manifest order, however many workers run."""
+    if not jobs:
+        return
+    if synthesize_batch is not None:
+        payloads = synthesize_batch([(job.text, job.audio_path, job.voice_style) for job in jobs])
+        for job, payload in zip(jobs, payloads):
+            yield job, lambda job=job, payload=payload: _finalize(job, payload)
+        return
+
+    if workers <= 1:
+        for job in jobs:
+            yield job, lambda job=job: _run_job(job, synthesize)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tts") as pool:
+        futures: List[Future] = [pool.submit(_run_job, job, synthesize) for job in jobs]
+        try:
+            for job, future in zip(jobs, futures):
+                yield job, future.result
+        finally:
+            # Stop queued clips from starting if an earlier one failed
+            for future in futures:
+                future.cancel()
+
+
+def _print_metrics_summary(clip_metrics: List[Dict[str, float]]) -> None:
+    """Average/max of every per-clip metric the backend reported (cache hits report none)."""
+    keys = sorted({key for metrics in clip_metrics for key in metrics})
+    for key in keys:
+        values = [metrics[key] for metrics in clip_metrics if key in metrics]
+        label = key[:-4] if key.endswith("_sec") else key
+        print(
+            f"  ⏱️  {label}: avg {sum(values) / len(values) * 1000:.1f} ms, "
+            f"max {max(values) * 1000:.1f} ms over {len(values)} clips"
+        )
+
+
+def synthesize_manifest(
+    manifest: list[Dict],
+    workers: int = DEFAULT_WORKERS,
+    synthesize: SynthesizeFn | None = None,
+    synthesize_batch: BatchSynthesizeFn | None = None,
+    timing_format: str = DEFAULT_TIMING_FORMAT,
+    synthesis_id: str | None = None,
+    force: bool = False,
+    workspace: SessionWorkspace | None = None,
+) -> Dict[str, Dict]:
+    """
+    Synthesize every narration event in the manifest and write its audio and
+    timing file into the workspace (the shared backend/output by default).
+
+    `synthesize` defaults to the configured backend (TTS_BACKEND); pass any
+    callable with the same signature to wrap or replace it. When
+    `synthesize_batch` is given, all clips go through it in one call instead.
+    Timing files are written in `timing_format`. The returned payloads are
+    keyed by timing-file stem, in manifest order: fresh clips in the legacy
+    shape, reused ones as stored (the choreography engine reads both).
+
+    With a `synthesis_id` (a digest of the backend settings) the run is
+    incremental: clips whose fingerprint matches the last build are read
+    back from their timing files instead of being synthesized.
+    """
+    workspace = workspace or SessionWorkspace.default()
+    workspace.audio_dir.mkdir(parents=True, exist_ok=True)
+    workspace.timings_dir.mkdir(parents=True, exist_ok=True)
+    fingerprints_path = workspace.build_dir / TTS_FINGERPRINTS_NAME
+    synthesize = synthesize or get_backend().synthesize
+
+    all_jobs = collect_jobs(manifest, workspace)
+    jobs = all_jobs
+    reused: Dict[str, Dict] = {}
+    reasons: Dict[str, str] = {}
+    fingerprints: Dict[str, Dict[str, str]] = {}
+    if synthesis_id is not None:
+        previous = {} if force else build_state.load_fingerprints(fingerprints_path)
+        jobs = []
+        for job in all_jobs:
+            stem = job.timing_path.stem
+            timing_path = timing_path_for(job.timing_path, timing_format)
+            fingerprints[stem] = clip_fingerprint(job, synthesis_id, timing_format)
+            reason = "forced" if force else build_state.rebuild_reason(
+                stem, fingerprints[stem], previous, CLIP_REASONS, [job.audio_path, timing_path]
+            )
+            if reason is None:
+                reused[stem] = decode_timing(timing_path)
+            else:
+                reasons[stem] = reason
+                jobs.append(job)
+    workers = max(1, min(workers, len(jobs) or 1))
+    if synthesize_batch is not None and jobs:
+        print(f"📦 Synthesizing {len(jobs)} clips as one batch")
+    elif workers > 1:
+        print(f"⚡ Synthesizing {len(jobs)} clips with {workers} workers")
+
+    timings: Dict[str, Dict] = {}
+    clip_metrics: List[Dict[str, float]] = []
+    for job, get_result in _iter_results(jobs, synthesize, workers, synthesize_batch):
+        reason = reasons.get(job.timing_path.stem)
+        print(f"[{job.index}/{len(manifest)}] Synthesizing {job.audio_rel}" + (f" ({reason})" if reason else ""))
+        timing = get_result()
+        metrics = timing.pop("metrics", None)
+        timing_path = write_timing(job.timing_path, timing, timing_format)
+        timings[job.timing_path.stem] = timing
+        print(f"  → {len(timing.get('words', []))} words captured")
+        if metrics:
+            clip_metrics.append(metrics)
+            print("  → " + ", ".join(f"{k} {v * 1000:.1f} ms" for k, v in sorted(metrics.items())))
+        print(f"  → saved audio to {job.audio_path}")
         print(f"  → saved timings to {timing_path}")
+    if clip_metrics:
+        print("📈 TTS metrics:")
+        _print_metrics_summary(clip_metrics)
+    if synthesis_id is not None:
+        build_state.save_fingerprints(fingerprints_path, fingerprints)
+    if reused:
+        print(f"⏭️  {len(reused)} clip(s) unchanged since the last build")
+    return {
+        stem: timings[stem] if stem in timings else reused[stem]
+        for stem in (job.timing_path.stem for job in all_jobs)
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Synthesize narration audio + word timings")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Number of clips to synthesize concurrently (default: TTS_WORKERS or 1)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=sorted(BACKEND_FACTORIES),
+        default=None,
+        help="TTS backend (default: TTS_BACKEND or azure)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Always call the TTS service")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-synthesize every clip, even those unchanged since the last build",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Synthesize all clips in one bookmark-delimited request (ignores --workers)",
+    )
+    parser.add_argument(
+        "--chunk-sentences",
+        action="store_true",
+        help="Split long narrations into sentences synthesized in parallel",
+    )
+    parser.add_argument("--chunk-workers", type=int, default=DEFAULT_CHUNK_WORKERS)
+    parser.add_argument("--rps", type=float, default=DEFAULT_RPS, help="Max TTS requests per second (<=0: unlimited)")
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=DEFAULT_MAX_CONNECTIONS,
+        help="Max concurrent TTS requests, across all workers",
+    )
+    parser.add_argument("--max-retries", type=int, default=DEFAULT_MAX_RETRIES)
+    parser.add_argument(
+        "--timing-format",
+        choices=TIMING_FORMATS,
+        default=DEFAULT_TIMING_FORMAT,
+        help="Timing file layout (default: TIMING_FORMAT or legacy)",
+    )
+    parser.add_argument(
+        "--prewarm",
+        action="store_true",
+        help="Pre-connect one pooled synthesizer per worker before synthesis starts",
+    )
+    add_workspace_arguments(parser)
+    return parser
+
+
+def run_tts(
+    manifest: List[Dict],
+    args: argparse.Namespace,
+    workspace: SessionWorkspace | None = None,
+) -> Dict[str, Dict]:
+    """
+    Synthesize the manifest with the backend, scheduler, cache and chunking
+    options in args (see build_parser) and return the timing payloads keyed
+    by timing-file stem. Timing files are written into the workspace as
+    checkpoints.
+    """
+    backend = get_backend(args.backend)
+    scheduler = TTSScheduler(
+        backend,
+        requests_per_sec=args.rps,
+        max_connections=args.max_connections,
+        max_retries=args.max_retries,
+    )
+    cache = (
+        None if args.no_cache
+        else TTSCache(
+            CACHE_DIR,
+            max_bytes=CACHE_MAX_MB * 1024 * 1024,
+            backend=backend,
+            synthesize=scheduler.synthesize,
+            synthesize_batch=scheduler.synthesize_batch,
+        )
+    )
+    if args.prewarm:
+        print(f"🔌 Pre-connected {backend.warm(max(args.workers, 1))} synthesizers")
+    source = cache if cache is not None else scheduler
+    chunker = ChunkedSynthesizer(source.synthesize, workers=args.chunk_workers) if args.chunk_sentences else None
+    try:
+        timings = synthesize_manifest(
+            manifest,
+            workers=args.workers,
+            synthesize=chunker.synthesize if chunker else source.synthesize,
+            synthesize_batch=source.synthesize_batch if args.batch else None,
+            timing_format=args.timing_format,
+            synthesis_id=build_state.digest(
+                [backend.name, backend.voice, backend.output_format, args.chunk_sentences]
+            ),
+            force=args.force,
+            workspace=workspace,
+        )
+    finally:
+        if chunker:
+            chunker.close()
+    if cache is not None:
+        print(f"🗄️  TTS cache: {cache.stats.summary()}")
+    if scheduler.stats.requests:
+        print(f"🚦 TTS scheduler: {scheduler.stats.summary()}")
+    backend_stats = backend.stats_summary()
+    if backend_stats:
+        print(f"🔌 {backend_stats}")
+    return timings
+
 
+def main(argv: List[str] | None = None) -> None:
+    args = build_parser().parse_args(argv)
+    workspace = workspace_from_args(args)
 
-def main() -> None:
-    if not MANIFEST_PATH.exists():
-        raise FileNotFoundError(f"Manifest not found at {MANIFEST_PATH}")
+    if not workspace.manifest_path.exists():
+        raise FileNotFoundError(f"Manifest not found at {workspace.manifest_path}")
 
-    manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
-    synthesize_manifest(manifest)
+    manifest = json.loads(workspace.manifest_path.read_text(encoding="utf-8"))
+    run_tts(manifest, args, workspace)
     try:
         # Regenerate choreography off the fresh timings so highlights/entrances stay frame-accurate
         from backend.scripts.calculate_choreography import main as calc_choreo
 
         print("🎭 Recalculating choreography from updated timings...")
-        calc_choreo()
+        calc_choreo(["--session", args.session] if args.session else [])
     except Exception as exc:  # pragma: no cover - defensive catch to avoid failing the main TTS run
         print(f"⚠️  Skipping choreography regeneration: {exc}")
 
@@ -0,0 +1,239 @@
+"""
+job_queue.py
+------------
+Durable local queue of pipeline jobs, stored in one SQLite file
+(backend/workspaces/queue.sqlite3, or PIPELINE_QUEUE_PATH).
+
+A job is a session id plus the slides payload to build it from. Jobs move
+queued → running → done/failed; claim() hands the oldest queued job to one
+worker inside a write transaction, so any number of worker processes can
+share the file. Jobs for a session that is already running wait, since two
+builds of one session would share its workspace.
+
+recover() puts a job left "running" by a dead worker back in the queue. A
+worker on this host is dead when its process is gone; one on another host
+(a queue on a shared volume) cannot be checked, so its job is presumed dead
+once it has run for stale_after_sec (PIPELINE_STALE_AFTER_SEC, default 6 h;
+0 disables it). Keep that above the longest job, or the job is built twice.
+After max_attempts (PIPELINE_MAX_ATTEMPTS, default 3) a job is marked failed
+instead, so a job that kills its worker cannot loop forever. Timestamps
+(enqueued/started/finished) are kept for the depth, latency and throughput
+figures in stats().
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from backend.scripts.workspace import WORKSPACES_DIR
+
+DEFAULT_QUEUE_PATH = Path(os.environ.get("PIPELINE_QUEUE_PATH", WORKSPACES_DIR / "queue.sqlite3"))
+DEFAULT_MAX_ATTEMPTS = int(os.environ.get("PIPELINE_MAX_ATTEMPTS", "3"))
+DEFAULT_STALE_AFTER_SEC = float(os.environ.get("PIPELINE_STALE_AFTER_SEC", str(6 * 3600)))
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT NOT NULL,
+    input_path TEXT NOT NULL,
+    force INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'queued',
+    worker TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT NOT NULL DEFAULT '',
+    enqueued_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, id);
+"""
+
+
+@dataclass(frozen=True)
+class Job:
+    id: int
+    session_id: str
+    input_path: Path
+    force: bool
+    attempts: int
+    enqueued_at: float
+    started_at: Optional[float] = None
+
+
+def worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+class JobQueue:
+    def __init__(
+        self,
+        path: Path = DEFAULT_QUEUE_PATH,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        stale_after_sec: float = DEFAULT_STALE_AFTER_SEC,
+    ):
+        self.path = Path(path)
+        self.max_attempts = max(max_attempts, 1)
+        self.stale_after_sec = stale_after_sec
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # IMMEDIATE takes the write lock up front, so two workers never claim the same job.
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def enqueue(self, session_id: str, input_path: Path, force: bool = False) -> int:
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "INSERT INTO jobs (session_id, input_path, force, enqueued_at) VALUES (?, ?, ?, ?)",
+                (session_id, str(Path(input_path).resolve()), int(force), time.time()),
+            )
+        return cursor.lastrowid
+
+    def claim(self, worker: Optional[str] = None) -> Optional[Job]:
+        """
+        The oldest queued job whose session is not already running, marked
+        running for this worker; None if there is no such job.
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = ? "
+                "AND session_id NOT IN (SELECT session_id FROM jobs WHERE status = ?) "
+                "ORDER BY id LIMIT 1",
+                (STATUS_QUEUED, STATUS_RUNNING),
+            ).fetchone()
+            if row is None:
+                return None
+            started_at = time.time()
+            conn.execute(
+                "UPDATE jobs SET status = ?, worker = ?, attempts = attempts + 1, started_at = ? WHERE id = ?",
+                (STATUS_RUNNING, worker or worker_id(), started_at, row["id"]),
+            )
+        return Job(
+            id=row["id"],
+            session_id=row["session_id"],
+            input_path=Path(row["input_path"]),
+            force=bool(row["force"]),
+            attempts=row["attempts"] + 1,
+            enqueued_at=row["enqueued_at"],
+            started_at=started_at,
+        )
+
+    def finish(self, job_id: int, ok: bool, error: str = "") -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                (STATUS_DONE if ok else STATUS_FAILED, error, time.time(), job_id),
+            )
+
+    def _dead_reason(self, row: sqlite3.Row, host: str, now: float) -> Optional[str]:
+        """Why a running job's worker is presumed dead, or None if it may still be working."""
+        worker_host, _, pid = (row["worker"] or "").rpartition(":")
+        if worker_host == host and pid.isdigit():
+            return None if _pid_alive(int(pid)) else "worker died"
+        if self.stale_after_sec > 0 and now - (row["started_at"] or 0.0) > self.stale_after_sec:
+            return f"no result after {self.stale_after_sec:g}s"
+        return None
+
+    def recover(self) -> Tuple[int, int]:
+        """
+        Requeue running jobs whose worker is dead (see the module docstring),
+        or fail them once they have used max_attempts; returns (requeued, failed).
+        """
+        host = socket.gethostname()
+        now = time.time()
+        requeued = failed = 0
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT id, worker, attempts, started_at FROM jobs WHERE status = ?", (STATUS_RUNNING,)
+            ).fetchall()
+            for row in rows:
+                reason = self._dead_reason(row, host, now)
+                if reason is None:
+                    continue
+                if row["attempts"] >= self.max_attempts:
+                    conn.execute(
+                        "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                        (STATUS_FAILED, f"{reason} on all {row['attempts']} attempts", now, row["id"]),
+                    )
+                    failed += 1
+                else:
+                    conn.execute(
+                        "UPDATE jobs SET status = ?, worker = NULL, started_at = NULL WHERE id = ?",
+                        (STATUS_QUEUED, row["id"]),
+                    )
+                    requeued += 1
+        return requeued, failed
+
+    def depth(self) -> Dict[str, int]:
+        """Job count per status."""
+        counts = {status: 0 for status in (STATUS_QUEUED, STATUS_RUNNING, STATUS_DONE, STATUS_FAILED)}
+        for row in self._conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status"):
+            counts[row["status"]] = row["n"]
+        return counts
+
+    def stats(self, window_sec: float = 3600.0) -> Dict[str, float]:
+        """
+        Depth per status, plus for jobs finished in the last window_sec:
+        throughput (jobs/min), queue wait and end-to-end latency (p50/p95, s).
+        """
+        since = time.time() - window_sec
+        rows = self._conn.execute(
+            "SELECT enqueued_at, started_at, finished_at FROM jobs WHERE status IN (?, ?) AND finished_at >= ?",
+            (STATUS_DONE, STATUS_FAILED, since),
+        ).fetchall()
+        stats: Dict[str, float] = dict(self.depth())
+        stats["finished_in_window"] = len(rows)
+        if rows:
+            waits = [row["started_at"] - row["enqueued_at"] for row in rows]
+            latencies = [row["finished_at"] - row["enqueued_at"] for row in rows]
+            span = max(row["finished_at"] for row in rows) - min(row["started_at"] for row in rows)
+            stats["throughput_per_min"] = len(rows) / span * 60 if span > 0 else 0.0
+            stats["wait_p50_sec"] = _percentile(waits, 0.5)
+            stats["wait_p95_sec"] = _percentile(waits, 0.95)
+            stats["latency_p50_sec"] = _percentile(latencies, 0.5)
+            stats["latency_p95_sec"] = _percentile(latencies, 0.95)
+        return stats
+
+    def jobs(self, limit: int = 20) -> List[sqlite3.Row]:
+        """Most recent jobs, newest first."""
+        return self._conn.execute("SELECT * FROM jobs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
@@ -9,6 +9,13 @@ Single-click pipeline runner:
 4) calculate_choreography.py    (derive animations/highlights from timings)
 5) publish_assets.py            (copy everything into video-app)
 
+The steps run in this process (see pipeline.py) and pass their results to
+each other in memory; per-step wall times are printed at the end.
+
+Steps, clips and slides whose inputs are unchanged since the last run are
+not rebuilt; each rebuilt item is logged with the reason. --force rebuilds
+everything.
+
 Flags let you skip steps if you already ran them:
   --skip-convert
   --skip-tts
@@ -18,38 +25,28 @@ Flags let you skip steps if you already ran them:
 Usage:
   python backend/scripts/orchestrate.py
   python backend/scripts/orchestrate.py --skip-tts  # reuse existing audio
+  python backend/scripts/orchestrate.py --measure-startup  # also report subprocess startup saved
+  python backend/scripts/orchestrate.py --session cand-42 --input cand-42.json  # isolated workspace
 """
 
 from __future__ import annotations
 
 import argparse
-import subprocess
 import sys
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
-SCRIPTS_DIR = PROJECT_ROOT / "backend" / "scripts"
-
-STEPS = [
-    ("Convert authored JSON → session", SCRIPTS_DIR / "convert_input_to_session.py", "convert"),
-    ("Build narration manifest", SCRIPTS_DIR / "build_narration.py", "narration"),
-    ("Synthesize TTS + timings", SCRIPTS_DIR / "generate_tts_and_timings.py", "tts"),
-    ("Calculate choreography", SCRIPTS_DIR / "calculate_choreography.py", "choreo"),
-    ("Publish to frontend", SCRIPTS_DIR / "publish_assets.py", "publish"),
-]
-
-
-def run_script(path: Path, label: str) -> bool:
-    print("\n" + "=" * 70)
-    print(f"STEP: {label}")
-    print("=" * 70 + "\n")
-    try:
-        subprocess.run([sys.executable, str(path)], check=True, cwd=PROJECT_ROOT)
-        print(f"\n✅ {label} completed")
-        return True
-    except subprocess.CalledProcessError as exc:
-        print(f"\n❌ {label} failed with exit code {exc.returncode}")
-        return False
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.scripts.pipeline import (  # noqa: E402
+    STATUS_FAILED,
+    add_pipeline_arguments,
+    build_stages,
+    options_from_args,
+    print_report,
+    run_stages,
+)
 
 
 def main() -> int:
@@ -58,32 +55,35 @@ def main() -> int:
     parser.add_argument("--skip-tts", action="store_true", help="Skip TTS synthesis (reuse existing audio/timings)")
     parser.add_argument("--skip-choreo", action="store_true", help="Skip choreography calculation")
     parser.add_argument("--skip-publish", action="store_true", help="Skip publishing assets to video-app")
+    add_pipeline_arguments(parser)
     args = parser.parse_args()
 
     skip_tags = {
         "convert": args.skip_convert,
-        "narration": False,  # always rebuild to stay in sync with session
+        "narration": False,  # never skipped by flag; rebuilt whenever input.txt or the session changes
         "tts": args.skip_tts,
         "choreo": args.skip_choreo,
         "publish": args.skip_publish,
     }
 
-    failures = 0
-    for label, script_path, tag in STEPS:
-        if skip_tags.get(tag, False):
-            print(f"⏭️  Skipping: {label}")
-            continue
-        ok = run_script(script_path, label)
-        if not ok:
-            failures += 1
-            # Stop immediately to avoid cascading bad outputs
-            break
-
-    if failures == 0:
+    options = options_from_args(args)
+    results = run_stages(
+        build_stages(options),
+        skip=[tag for tag, skipped in skip_tags.items() if skipped],
+        measure_startup_cost=args.measure_startup,
+        force=args.force,
+        workspace=options.workspace,
+    )
+    print_report(results)
+
+    if not any(result.status == STATUS_FAILED for result in results):
         print("\n" + "🎉" * 20)
         print("PIPELINE COMPLETE")
         print("🎉" * 20 + "\n")
-        print("Next: cd video-app && npm run dev (enable narration in slides if needed)")
+        if options.workspace.isolated:
+            print(f"Next: python video-app/render_video_multi_quality.py --session {options.workspace.name}")
+        else:
+            print("Next: cd video-app && npm run dev (enable narration in slides if needed)")
         return 0
 
     print("\n⚠️  Pipeline halted. Fix the error above and rerun.")
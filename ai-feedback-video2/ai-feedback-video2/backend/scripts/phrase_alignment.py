@@ -0,0 +1,296 @@
+"""
+phrase_alignment.py
+-------------------
+Global alignment of an ordered list of on-screen phrases against the
+normalized narration token stream, in one banded dynamic-programming pass.
+
+The phrases are concatenated into a single query. Narration between two
+phrases is skipped for free, narration inside a phrase and phrase tokens the
+voice never said cost a small penalty, so paraphrased or partially spoken
+bullets still land where they were narrated instead of missing outright.
+
+To keep the pass close to linear, the DP only fills a band of cells around a
+chain of anchors: query bigrams that occur rarely in the narration, chained
+so they are in order on both axes. Without any anchor the band would be the
+whole matrix, so the phrases are then placed one after another with the
+greedy gap-tolerant search (find_window) instead.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+MATCH_SCORE = 2.0
+MISMATCH_PENALTY = 1.0
+SKIP_PHRASE_TOKEN_PENALTY = 1.0
+SKIP_NARRATION_PENALTY = 0.5
+DEFAULT_BAND = 24
+ANCHOR_MAX_OCCURRENCES = 4
+CHAIN_LOOKBACK = 64
+CHAIN_DRIFT_PENALTY = 0.05
+MIN_CONFIDENCE = 0.5
+GREEDY_MAX_GAP = 4
+
+_DIAG, _UP, _LEFT = 0, 1, 2
+_NEG_INF = float("-inf")
+
+
+@dataclass
+class PhraseAlignment:
+    """Where one phrase landed: an inclusive narration token span, or None if nothing matched."""
+    token_start: Optional[int]
+    token_end: Optional[int]
+    matched: int
+    confidence: float
+
+    @property
+    def confident(self) -> bool:
+        return self.token_start is not None and self.confidence >= MIN_CONFIDENCE
+
+
+def _positions_of(tokens: Sequence[str]) -> Dict[str, List[int]]:
+    positions: Dict[str, List[int]] = {}
+    for idx, token in enumerate(tokens):
+        positions.setdefault(token, []).append(idx)
+    return positions
+
+
+def _next_position(positions: Dict[str, List[int]], token: str, after: int) -> Optional[int]:
+    occurrences = positions.get(token)
+    if not occurrences:
+        return None
+    i = bisect_left(occurrences, after)
+    return occurrences[i] if i < len(occurrences) else None
+
+
+def find_window(
+    positions: Dict[str, List[int]],
+    phrase: Sequence[str],
+    start: int = 0,
+    max_gap: int = GREEDY_MAX_GAP,
+) -> Optional[Tuple[int, int]]:
+    """
+    First (start, end) token span at or after start holding every phrase token
+    in order, each within max_gap tokens of the previous match.
+    """
+    if not phrase:
+        return None
+    first_positions = positions.get(phrase[0], [])
+    for first in first_positions[bisect_left(first_positions, start):]:
+        last_match = first
+        for token in phrase[1:]:
+            # Take the first later occurrence; give up once it is more than max_gap past the last match.
+            position = _next_position(positions, token, last_match + 1)
+            if position is None or position > last_match + max_gap + 1:
+                break
+            last_match = position
+        else:
+            return first, last_match
+    return None
+
+
+def greedy_alignments(
+    positions: Dict[str, List[int]],
+    phrases: Sequence[Sequence[str]],
+    max_gap: int = GREEDY_MAX_GAP,
+) -> List[PhraseAlignment]:
+    """Each phrase at its first find_window match after the previous one; unmatched phrases stay None."""
+    results: List[PhraseAlignment] = []
+    cursor = 0
+    for phrase in phrases:
+        window = find_window(positions, phrase, cursor, max_gap)
+        if window is None:
+            results.append(PhraseAlignment(None, None, 0, 0.0))
+            continue
+        start, end = window
+        span = end - start + 1
+        results.append(PhraseAlignment(start, end, len(phrase), len(phrase) / max(len(phrase), span)))
+        cursor = end + 1
+    return results
+
+
+def find_anchors(
+    tokens: Sequence[str],
+    positions: Dict[str, List[int]],
+    query: Sequence[str],
+    phrase_end: Sequence[int],
+) -> List[Tuple[int, int]]:
+    """(query_idx, token_idx) pairs where a phrase bigram (or a one-word phrase) is rare in the narration."""
+    anchors: List[Tuple[int, int]] = []
+    for i, token in enumerate(query):
+        end = phrase_end[i]
+        if i + 1 < end:
+            following = query[i + 1]
+            candidates = []
+            for j in positions.get(token, []):
+                if j + 1 < len(tokens) and tokens[j + 1] == following:
+                    candidates.append(j)
+                    if len(candidates) > ANCHOR_MAX_OCCURRENCES:
+                        break  # too common to anchor on; no need to count the rest
+        elif i == 0 or phrase_end[i - 1] != end:
+            candidates = positions.get(token, [])
+        else:
+            continue  # last token of a longer phrase, covered by the bigram before it
+        if 0 < len(candidates) <= ANCHOR_MAX_OCCURRENCES:
+            anchors.extend((i, j) for j in candidates)
+    return anchors
+
+
+def chain_anchors(
+    anchors: List[Tuple[int, int]],
+    phrase_end: Sequence[int],
+    lookback: int = CHAIN_LOOKBACK,
+) -> List[Tuple[int, int]]:
+    """
+    Best-scoring chain of anchors strictly increasing in both query and
+    narration position. Each anchor scores 1; consecutive anchors in the same
+    phrase pay for drifting off the diagonal, so a phrase is anchored where it
+    is said contiguously rather than on a stray early bigram.
+    """
+    if not anchors:
+        return []
+    ordered = sorted(anchors)
+    score = [1.0] * len(ordered)
+    parent = [-1] * len(ordered)
+    for k, (i, j) in enumerate(ordered):
+        for prev in range(k - 1, max(-1, k - 1 - lookback), -1):
+            pi, pj = ordered[prev]
+            if pi >= i or pj >= j:
+                continue
+            drift = abs((j - pj) - (i - pi)) if phrase_end[pi] == phrase_end[i] else 0
+            candidate = score[prev] + 1.0 - CHAIN_DRIFT_PENALTY * drift
+            if candidate > score[k]:
+                score[k] = candidate
+                parent[k] = prev
+    chain: List[Tuple[int, int]] = []
+    k = max(range(len(ordered)), key=score.__getitem__)
+    while k != -1:
+        chain.append(ordered[k])
+        k = parent[k]
+    return chain[::-1]
+
+
+def band_limits(rows: int, cols: int, chain: List[Tuple[int, int]], band: int) -> Tuple[List[int], List[int]]:
+    """
+    Column range [lo, hi] for every DP row (rows = query tokens consumed,
+    cols = narration tokens consumed). Each row may use everything between
+    the anchors around it, plus band cells of slack on either side.
+    """
+    cells = [(i + 1, j + 1) for i, j in chain]
+    lo = [0] * (rows + 1)
+    hi = [cols] * (rows + 1)
+    k = -1
+    for r in range(rows + 1):
+        while k + 1 < len(cells) and cells[k + 1][0] <= r:
+            k += 1
+        if k >= 0:
+            lo[r] = max(0, cells[k][1] - band)
+    k = len(cells)
+    for r in range(rows, -1, -1):
+        while k - 1 >= 0 and cells[k - 1][0] >= r:
+            k -= 1
+        if k < len(cells):
+            hi[r] = min(cols, cells[k][1] + band)
+    for r in range(1, rows + 1):
+        # Consecutive rows must overlap or the path could not continue.
+        lo[r] = min(max(lo[r], lo[r - 1]), hi[r - 1])
+        hi[r] = max(hi[r], lo[r])
+    return lo, hi
+
+
+def align_phrases(
+    tokens: Sequence[str],
+    phrases: Sequence[Sequence[str]],
+    positions: Optional[Dict[str, List[int]]] = None,
+    band: int = DEFAULT_BAND,
+) -> List[PhraseAlignment]:
+    """
+    Align the phrases, in order, against the narration tokens and return one
+    PhraseAlignment per phrase. Confidence is matched tokens over the larger
+    of the phrase length and the narration span it covers, so an exact
+    contiguous match scores 1.0 and paraphrases or stretched matches score less.
+    """
+    if positions is None:
+        positions = _positions_of(tokens)
+    query: List[str] = []
+    phrase_of: List[int] = []
+    phrase_end: List[int] = []
+    for p, phrase in enumerate(phrases):
+        end = len(query) + len(phrase)
+        query.extend(phrase)
+        phrase_of.extend([p] * len(phrase))
+        phrase_end.extend([end] * len(phrase))
+    rows, cols = len(query), len(tokens)
+    results = [PhraseAlignment(None, None, 0, 0.0) for _ in phrases]
+    if not rows or not cols:
+        return results
+
+    # A row is a phrase boundary once every token of the phrases before it is consumed.
+    boundary = [False] * (rows + 1)
+    boundary[0] = True
+    for end in phrase_end:
+        boundary[end] = True
+
+    chain = chain_anchors(find_anchors(tokens, positions, query, phrase_end), phrase_end)
+    if not chain:
+        # No anchor to centre a band on: the DP would fill all rows x cols cells.
+        return greedy_alignments(positions, phrases)
+    lo, hi = band_limits(rows, cols, chain, band)
+
+    prev = [0.0] * (hi[0] - lo[0] + 1)
+    moves: List[bytearray] = [bytearray(len(prev))]
+    for i in range(1, rows + 1):
+        q = query[i - 1]
+        skip_narration = 0.0 if boundary[i] else SKIP_NARRATION_PENALTY
+        plo, phi = lo[i - 1], hi[i - 1]
+        rlo, rhi = lo[i], hi[i]
+        row = [_NEG_INF] * (rhi - rlo + 1)
+        move = bytearray(len(row))
+        left = _NEG_INF
+        for j in range(rlo, rhi + 1):
+            best = _NEG_INF
+            step = _UP
+            if plo <= j - 1 <= phi:
+                diag = prev[j - 1 - plo]
+                if diag != _NEG_INF:
+                    best = diag + (MATCH_SCORE if tokens[j - 1] == q else -MISMATCH_PENALTY)
+                    step = _DIAG
+            if plo <= j <= phi:
+                up = prev[j - plo] - SKIP_PHRASE_TOKEN_PENALTY
+                if up > best:
+                    best, step = up, _UP
+            if left != _NEG_INF and left - skip_narration > best:
+                best, step = left - skip_narration, _LEFT
+            row[j - rlo] = best
+            move[j - rlo] = step
+            left = best
+        prev = row
+        moves.append(move)
+
+    i, j = rows, hi[rows]
+    first = [None] * len(phrases)
+    last = [None] * len(phrases)
+    matched = [0] * len(phrases)
+    while i > 0:
+        step = moves[i][j - lo[i]]
+        if step == _DIAG:
+            if tokens[j - 1] == query[i - 1]:
+                p = phrase_of[i - 1]
+                matched[p] += 1
+                first[p] = j - 1
+                if last[p] is None:
+                    last[p] = j - 1
+            i, j = i - 1, j - 1
+        elif step == _UP:
+            i -= 1
+        else:
+            j -= 1
+
+    for p, phrase in enumerate(phrases):
+        if not matched[p]:
+            continue
+        span = last[p] - first[p] + 1
+        results[p] = PhraseAlignment(first[p], last[p], matched[p], matched[p] / max(len(phrase), span))
+    return results
@@ -0,0 +1,451 @@
+"""
+pipeline.py
+-----------
+In-process executor for the build pipeline, run as a small dependency graph:
+
+    convert → narration → tts → choreo → publish
+                  └──────────────┴────────┘
+
+Every stage runs in this interpreter and hands its result to the stages that
+depend on it as a Python object (slides + session, manifest, timing payloads),
+so nothing is re-imported or re-parsed between steps. Files in the session
+workspace (backend/output by default, see workspace.py) are still written,
+but only as checkpoints: a skipped stage's dependents fall back to them
+through the stage's load() hook. Runs in different workspaces (--session)
+share nothing but the TTS cache and can run side by side.
+
+Stages with a fingerprint() are incremental: when the digests of their
+inputs (input.txt, session_questions.json, the stage code) match the last
+run and their outputs exist, they are reported "up to date" and load()
+stands in for them. Inside a stage, TTS and choreography do the same per
+clip/slide and publish only rewrites files whose content changed, each
+logging why an item was rebuilt. --force ignores every fingerprint.
+
+orchestrate.py and run_pipeline.py are thin CLIs over run_stages().
+--measure-startup times a bare `python -c "import <stage module>"` per stage,
+which is what the old one-subprocess-per-script runners paid on every step.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import shlex
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.scripts import build_state  # noqa: E402
+from backend.scripts.workspace import SessionWorkspace, add_workspace_arguments, workspace_from_args  # noqa: E402
+
+PIPELINE_FINGERPRINTS_NAME = "pipeline_fingerprints.json"
+STAGE_REASONS = {
+    "input": "input.txt changed",
+    "slides": "slides payload changed",
+    "session": "session data changed",
+    "code": "stage code changed",
+}
+
+STATUS_RAN = "ran"
+STATUS_CURRENT = "up to date"
+STATUS_SKIPPED = "skipped"
+STATUS_FAILED = "failed"
+STATUS_BLOCKED = "not run"
+
+
+@dataclass
+class Stage:
+    name: str
+    label: str
+    module: str
+    run: Callable[[Dict[str, Any]], Any]
+    deps: Tuple[str, ...] = ()
+    # Result for dependents when this stage is skipped (None: dependents read disk themselves).
+    load: Optional[Callable[[], Any]] = None
+    # Digests of the stage's inputs, plus the files it must have left behind;
+    # when both check out against the last run the stage is not re-run.
+    fingerprint: Optional[Callable[[], build_state.Fingerprint]] = None
+    outputs: Callable[[], List[Path]] = list
+
+
+@dataclass
+class StageResult:
+    name: str
+    label: str
+    status: str
+    seconds: float = 0.0
+    error: str = ""
+    startup_sec: Optional[float] = None
+    reason: str = ""
+
+
+@dataclass
+class PipelineOptions:
+    """Per-stage settings; the defaults match running each script with no flags."""
+
+    tts_argv: List[str] = field(default_factory=list)
+    choreo_workers: Optional[int] = None
+    choreo_force: bool = False
+    choreo_fps: Optional[str] = None
+    # Rebuild every stage and item regardless of fingerprints.
+    force: bool = False
+    # Where every stage reads and writes; the shared single-session layout by default.
+    workspace: SessionWorkspace = field(default_factory=SessionWorkspace.default)
+
+
+def _input_path(workspace: SessionWorkspace) -> Path:
+    from backend.scripts.convert_input_to_session import find_input_path
+
+    return (workspace.input_path or find_input_path()).resolve()
+
+
+def _convert(workspace: SessionWorkspace, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    from backend.scripts.convert_input_to_session import convert
+
+    input_path = _input_path(workspace)
+    slides, session = convert(input_path, workspace)
+    return {"input_path": input_path, "slides": slides, "session": session}
+
+
+def _load_convert(workspace: SessionWorkspace) -> Dict[str, Any]:
+    from backend.scripts.calculate_choreography import load_session_data
+    from backend.scripts.slides_payload_adapter import load_slides_payload
+
+    input_path = _input_path(workspace)
+    return {
+        "input_path": input_path,
+        "slides": load_slides_payload(input_path),
+        "session": load_session_data(workspace),
+    }
+
+
+def _convert_fingerprint(workspace: SessionWorkspace) -> build_state.Fingerprint:
+    from backend.scripts import convert_input_to_session, slides_payload_adapter
+
+    return {
+        "input": build_state.file_digest(_input_path(workspace)),
+        "code": build_state.digest(
+            [build_state.file_digest(Path(module.__file__)) for module in (convert_input_to_session, slides_payload_adapter)]
+        ),
+    }
+
+
+def _convert_outputs(workspace: SessionWorkspace) -> List[Path]:
+    return [workspace.session_path, workspace.frontend_data_dir / "session_questions.json"]
+
+
+def _narration(workspace: SessionWorkspace, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    from backend.scripts import build_narration
+
+    converted = inputs.get("convert")
+    slides = existing_session = None
+    payload_path = build_narration.slides_payload_path_for(workspace)
+    # Reuse the parsed payload only when narration would have read that same file.
+    if converted and payload_path and payload_path.resolve() == converted["input_path"]:
+        slides, existing_session = converted["slides"], converted["session"]
+    session, overrides = build_narration.load_session_and_overrides(slides, existing_session, workspace)
+    manifest = build_narration.build_manifest(session, overrides)
+    build_narration.write_manifest(manifest, workspace)
+    return {"session": session, "manifest": manifest}
+
+
+def _load_narration(workspace: SessionWorkspace) -> Dict[str, Any]:
+    from backend.scripts.calculate_choreography import load_session_data
+
+    if not workspace.manifest_path.exists():
+        raise FileNotFoundError(f"Narration manifest not found: {workspace.manifest_path}")
+    return {
+        "session": load_session_data(workspace),
+        "manifest": json.loads(workspace.manifest_path.read_text(encoding="utf-8")),
+    }
+
+
+def _narration_fingerprint(workspace: SessionWorkspace) -> build_state.Fingerprint:
+    from backend.scripts import build_narration, slides_payload_adapter
+
+    payload_path = build_narration.slides_payload_path_for(workspace)
+    return {
+        "slides": build_state.file_digest(payload_path) if payload_path else "none",
+        "session": build_state.file_digest(build_narration.session_path_for(workspace)),
+        "code": build_state.digest(
+            [build_state.file_digest(Path(module.__file__)) for module in (build_narration, slides_payload_adapter)]
+        ),
+    }
+
+
+def _narration_outputs(workspace: SessionWorkspace) -> List[Path]:
+    return [workspace.manifest_path]
+
+
+def _tts(options: PipelineOptions) -> Callable[[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    def run(inputs: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        from backend.scripts.generate_tts_and_timings import build_parser, run_tts
+
+        argv = options.tts_argv + (["--force"] if options.force else [])
+        return run_tts(inputs["narration"]["manifest"], build_parser().parse_args(argv), options.workspace)
+
+    return run
+
+
+def _choreo(options: PipelineOptions) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    def run(inputs: Dict[str, Any]) -> Dict[str, Any]:
+        from backend.scripts import calculate_choreography as choreo
+
+        timings_dir = options.workspace.timings_dir
+        if not timings_dir.exists():
+            raise FileNotFoundError(f"Timings directory not found: {timings_dir}")
+        narration = inputs["narration"]
+        return choreo.build_choreographies(
+            narration["session"],
+            narration["manifest"],
+            rates=choreo.parse_fps_list(options.choreo_fps or choreo.DEFAULT_OUTPUT_FPS),
+            workers=choreo.DEFAULT_WORKERS if options.choreo_workers is None else options.choreo_workers,
+            force=options.choreo_force or options.force,
+            timings=inputs.get("tts"),
+            workspace=options.workspace,
+        )
+
+    return run
+
+
+def _publish(options: PipelineOptions) -> Callable[[Dict[str, Any]], None]:
+    def run(inputs: Dict[str, Any]) -> None:
+        from backend.scripts.publish_assets import publish
+
+        narration = inputs.get("narration") or {}
+        publish(narration.get("manifest"), inputs.get("tts"), force=options.force, workspace=options.workspace)
+
+    return run
+
+
+def build_stages(options: Optional[PipelineOptions] = None) -> List[Stage]:
+    """The five pipeline stages, in dependency order."""
+    options = options or PipelineOptions()
+    workspace = options.workspace
+    return [
+        Stage(
+            "convert",
+            "Convert authored JSON → session",
+            "backend.scripts.convert_input_to_session",
+            partial(_convert, workspace),
+            load=partial(_load_convert, workspace),
+            fingerprint=partial(_convert_fingerprint, workspace),
+            outputs=partial(_convert_outputs, workspace),
+        ),
+        Stage(
+            "narration",
+            "Build narration manifest",
+            "backend.scripts.build_narration",
+            partial(_narration, workspace),
+            deps=("convert",),
+            load=partial(_load_narration, workspace),
+            fingerprint=partial(_narration_fingerprint, workspace),
+            outputs=partial(_narration_outputs, workspace),
+        ),
+        Stage(
+            "tts",
+            "Synthesize TTS + timings",
+            "backend.scripts.generate_tts_and_timings",
+            _tts(options),
+            deps=("narration",),
+        ),
+        Stage(
+            "choreo",
+            "Calculate choreography",
+            "backend.scripts.calculate_choreography",
+            _choreo(options),
+            deps=("narration", "tts"),
+        ),
+        Stage(
+            "publish",
+            "Publish to frontend",
+            "backend.scripts.publish_assets",
+            _publish(options),
+            deps=("narration", "tts", "choreo"),
+        ),
+    ]
+
+
+def _topological(stages: Sequence[Stage]) -> List[Stage]:
+    by_name = {stage.name: stage for stage in stages}
+    ordered: List[Stage] = []
+    state: Dict[str, str] = {}
+
+    def visit(name: str) -> None:
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            raise ValueError(f"Pipeline stages form a cycle through '{name}'")
+        state[name] = "visiting"
+        for dep in by_name[name].deps:
+            if dep not in by_name:
+                raise ValueError(f"Stage '{name}' depends on unknown stage '{dep}'")
+            visit(dep)
+        state[name] = "done"
+        ordered.append(by_name[name])
+
+    for stage in stages:
+        visit(stage.name)
+    return ordered
+
+
+def measure_startup(module: str) -> float:
+    """Wall time of a fresh interpreter that only imports module (the per-step subprocess cost)."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", f"import {module}"],
+        check=False,
+        cwd=PROJECT_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - start
+
+
+def run_stages(
+    stages: Sequence[Stage],
+    skip: Iterable[str] = (),
+    measure_startup_cost: bool = False,
+    force: bool = False,
+    workspace: Optional[SessionWorkspace] = None,
+) -> List[StageResult]:
+    """
+    Run stages in dependency order, stopping at the first failure. Skipped
+    and up-to-date stages contribute their load() result (or nothing) to
+    their dependents. Stage fingerprints are recorded in the workspace the
+    stages were built for.
+    """
+    fingerprints_path = (workspace or SessionWorkspace.default()).build_dir / PIPELINE_FINGERPRINTS_NAME
+    skip = set(skip)
+    outputs: Dict[str, Any] = {}
+    reuse: set = set()
+    by_name = {stage.name: stage for stage in stages}
+    results: List[StageResult] = []
+    failed = False
+    stored = build_state.load_fingerprints(fingerprints_path)
+    # force only ignores the stored fingerprints when deciding what to rebuild; stages that
+    # are skipped (run_pipeline.py always skips convert) keep theirs for the next normal run.
+    previous = {} if force else stored
+    fingerprints = dict(stored)
+
+    def output_of(name: str) -> Any:
+        stage = by_name[name]
+        if name in reuse:
+            reuse.discard(name)
+            outputs[name] = stage.load() if stage.load else None
+        return outputs.get(name)
+
+    for stage in _topological(stages):
+        if failed:
+            results.append(StageResult(stage.name, stage.label, STATUS_BLOCKED))
+            continue
+        if stage.name in skip:
+            print(f"⏭️  Skipping: {stage.label}")
+            results.append(StageResult(stage.name, stage.label, STATUS_SKIPPED))
+            reuse.add(stage.name)
+            continue
+        reason = ""
+        if stage.fingerprint is not None:
+            # A rebuilt upstream stage may have rewritten this stage's inputs, so check only now.
+            reason = "forced" if force else build_state.rebuild_reason(
+                stage.name, stage.fingerprint(), previous, STAGE_REASONS, stage.outputs()
+            )
+            if reason is None:
+                print(f"⏭️  Up to date: {stage.label}")
+                results.append(StageResult(stage.name, stage.label, STATUS_CURRENT))
+                reuse.add(stage.name)
+                continue
+
+        print("\n" + "=" * 70)
+        print(f"STEP: {stage.label}" + (f" ({reason})" if reason else ""))
+        print("=" * 70 + "\n")
+        start = time.perf_counter()
+        try:
+            inputs = {dep: output_of(dep) for dep in stage.deps}
+            outputs[stage.name] = stage.run(inputs)
+        except Exception as exc:
+            elapsed = time.perf_counter() - start
+            print(f"\n❌ {stage.label} failed: {exc}")
+            results.append(StageResult(stage.name, stage.label, STATUS_FAILED, elapsed, str(exc), reason=reason))
+            fingerprints.pop(stage.name, None)
+            failed = True
+            continue
+        elapsed = time.perf_counter() - start
+        print(f"\n✅ {stage.label} completed in {elapsed:.2f}s")
+        results.append(StageResult(stage.name, stage.label, STATUS_RAN, elapsed, reason=reason))
+        if stage.fingerprint is not None:
+            # Taken after the run: the stage may rewrite its own inputs (narration refreshes the session).
+            fingerprints[stage.name] = stage.fingerprint()
+    build_state.save_fingerprints(fingerprints_path, fingerprints)
+
+    if measure_startup_cost:
+        for result in results:
+            if result.status == STATUS_RAN:
+                result.startup_sec = measure_startup(by_name[result.name].module)
+    return results
+
+
+def print_report(results: Sequence[StageResult]) -> None:
+    print("\n" + "=" * 70)
+    print("PIPELINE TIMINGS")
+    print("=" * 70)
+    total = 0.0
+    saved = 0.0
+    measured = any(result.startup_sec is not None for result in results)
+    for result in results:
+        line = f"  {result.label:<36} {result.status:<10}"
+        if result.status in (STATUS_RAN, STATUS_FAILED):
+            line += f" {result.seconds:8.2f}s"
+            total += result.seconds
+        if result.startup_sec is not None:
+            line += f"   (+{result.startup_sec:.2f}s as a subprocess)"
+            saved += result.startup_sec
+        if result.reason:
+            line += f"   [{result.reason}]"
+        print(line)
+    print(f"  {'Total':<47} {total:8.2f}s")
+    if measured:
+        print(f"  Interpreter startup + imports saved by running in-process: {saved:.2f}s")
+    print("=" * 70)
+
+
+def add_pipeline_arguments(parser: argparse.ArgumentParser) -> None:
+    """Stage options shared by orchestrate.py and run_pipeline.py."""
+    parser.add_argument(
+        "--tts-args",
+        default="",
+        help="Extra generate_tts_and_timings.py flags, quoted, e.g. --tts-args=\"--workers 8 --batch\"",
+    )
+    parser.add_argument("--choreo-workers", type=int, default=None, help="Choreography worker processes")
+    parser.add_argument("--choreo-fps", default=None, help="Choreography output frame rates, e.g. 24,30,60")
+    parser.add_argument("--force-choreo", action="store_true", help="Rebuild every slide's choreography")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore all build fingerprints: rerun every stage, clip, slide and file copy",
+    )
+    parser.add_argument(
+        "--measure-startup",
+        action="store_true",
+        help="Also time each stage's module import in a fresh interpreter to report the startup saved",
+    )
+    add_workspace_arguments(parser)
+
+
+def options_from_args(args: argparse.Namespace) -> PipelineOptions:
+    return PipelineOptions(
+        tts_argv=shlex.split(args.tts_args),
+        choreo_workers=args.choreo_workers,
+        choreo_force=args.force_choreo,
+        choreo_fps=args.choreo_fps,
+        force=args.force,
+        workspace=workspace_from_args(args),
+    )
@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+"""
+pipeline_worker.py
+------------------
+Long-running pipeline worker fed by the local job queue (job_queue.py):
+
+  python backend/scripts/pipeline_worker.py enqueue payloads/            # or sessions.jsonl, or one payload
+  python backend/scripts/pipeline_worker.py enqueue cand-42.json --session cand-42 --force
+  python backend/scripts/pipeline_worker.py work --render --prewarm 4    # runs until stopped
+  python backend/scripts/pipeline_worker.py work --drain                 # exits once the queue is empty
+  python backend/scripts/pipeline_worker.py status
+
+A one-shot run pays interpreter startup, stage imports (Azure SDK included),
+synthesizer connects and a full Remotion bundle for every video. The
+worker pays them once: stage modules are imported at start, the TTS backend
+instance (and its pool of connected synthesizers, see --prewarm) is shared
+by every job, and the renderer module is loaded in-process. Each session's
+bundle is only rebuilt when its sources changed; Remotion's webpack cache
+(under the shared node_modules) keeps the rebuilds incremental.
+
+Each job runs the whole pipeline in its session workspace
+(backend/workspaces/<session>/) and logs to <workspace>/output/worker.log.
+After every job the worker prints queue depth, the job's queue wait and
+latency, and its throughput; `status` shows the same for the queue as a
+whole. Several workers can share one queue; they never build the same
+session at once. A job left running by a worker that died is requeued when
+a worker starts or goes idle, up to PIPELINE_MAX_ATTEMPTS (default 3)
+attempts; see job_queue.py for workers on other hosts. SIGINT/SIGTERM stop
+the worker after the current job.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib
+import importlib.util
+import os
+import shlex
+import signal
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.scripts.job_queue import DEFAULT_QUEUE_PATH, Job, JobQueue, worker_id  # noqa: E402
+from backend.scripts.pipeline import STATUS_FAILED, PipelineOptions, build_stages, run_stages  # noqa: E402
+from backend.scripts.run_batch import RENDERER, BatchJob, BatchSettings, discover_jobs  # noqa: E402
+from backend.scripts.workspace import SessionWorkspace  # noqa: E402
+
+DEFAULT_POLL_SEC = float(os.environ.get("PIPELINE_WORKER_POLL_SEC", "1.0"))
+
+
+class PipelineWorker:
+    """Claims jobs from the queue one at a time and runs them with warm, shared state."""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        settings: Optional[BatchSettings] = None,
+        choreo_workers: Optional[int] = None,
+        render_concurrency: Optional[int] = None,
+        render_extra_args: Optional[str] = None,
+    ):
+        self.queue = queue
+        self.settings = settings or BatchSettings()
+        self.choreo_workers = choreo_workers
+        self.render_concurrency = render_concurrency or max((os.cpu_count() or 2) - 1, 1)
+        self.render_extra_args = render_extra_args
+        self.name = worker_id()
+        self.started_at = time.time()
+        self.done = 0
+        self.failed = 0
+        self.busy_sec = 0.0
+        self.stopping = False
+        self._renderer: Optional[ModuleType] = None
+        self._npx: Optional[str] = None
+
+    # -- warm-up ------------------------------------------------------------
+
+    def warm(self, prewarm: int = 0) -> None:
+        """Import every stage, create the TTS backend (pre-connecting prewarm synthesizers) and load the renderer."""
+        start = time.perf_counter()
+        for stage in build_stages():
+            importlib.import_module(stage.module)
+        from backend.scripts.generate_tts_and_timings import build_parser
+        from backend.tts.backends import get_backend
+
+        tts_args = build_parser().parse_args(self.settings.tts_argv)
+        backend = get_backend(tts_args.backend)
+        if prewarm:
+            print(f"🔌 Pre-connected {backend.warm(prewarm)} synthesizers")
+        if self.settings.render:
+            spec = importlib.util.spec_from_file_location("render_video_multi_quality", RENDERER)
+            self._renderer = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(self._renderer)
+            self._npx = self._renderer.find_npx()
+        print(f"🔥 Worker {self.name} warm in {time.perf_counter() - start:.2f}s (TTS backend: {backend.name})")
+
+    # -- jobs ---------------------------------------------------------------
+
+    def process(self, job: Job) -> Tuple[bool, str]:
+        """Run the pipeline (and the render) for one job; returns (ok, error)."""
+        try:
+            workspace = SessionWorkspace.for_session(job.session_id, input_path=job.input_path).ensure()
+        except (OSError, ValueError) as exc:
+            return False, f"workspace: {exc}"
+        log_path = workspace.output_dir / "worker.log"
+        with log_path.open("a", encoding="utf-8") as log, contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+            print(f"\n##### job {job.id} on {self.name} ({time.strftime('%Y-%m-%d %H:%M:%S')}) #####")
+            try:
+                force = self.settings.force or job.force
+                options = PipelineOptions(
+                    tts_argv=list(self.settings.tts_argv),
+                    choreo_workers=self.choreo_workers,
+                    choreo_fps=self.settings.choreo_fps,
+                    force=force,
+                    workspace=workspace,
+                )
+                results = run_stages(build_stages(options), force=force, workspace=workspace)
+                failed = next((result for result in results if result.status == STATUS_FAILED), None)
+                if failed:
+                    return False, f"{failed.name}: {failed.error}"
+                if self._renderer is not None:
+                    self._renderer.render_project(
+                        self._npx,
+                        workspace.frontend_dir,
+                        workspace.renders_dir,
+                        self._renderer.DEFAULT_COMPOSITION,
+                        self.render_concurrency,
+                        extra_args=self.render_extra_args,
+                    )
+            except Exception as exc:  # one bad job must not stop the worker
+                print(f"❌ Job {job.id} failed: {exc}")
+                return False, str(exc)
+        return True, ""
+
+    def run(self, poll_sec: float = DEFAULT_POLL_SEC, drain: bool = False, max_jobs: Optional[int] = None) -> int:
+        """Process jobs until stopped, the queue is empty (drain) or max_jobs ran; returns the failure count."""
+        self.recover()
+        print(f"👷 Waiting for jobs in {self.queue.path}")
+        while not self.stopping and (max_jobs is None or self.done + self.failed < max_jobs):
+            job = self.queue.claim(self.name)
+            if job is None:
+                if drain:
+                    break
+                # Idle: a dead worker's job may be what keeps its session's queued jobs waiting.
+                self.recover()
+                time.sleep(poll_sec)
+                continue
+            start = time.perf_counter()
+            ok, error = self.process(job)
+            self.busy_sec += time.perf_counter() - start
+            self.queue.finish(job.id, ok, error)
+            if ok:
+                self.done += 1
+            else:
+                self.failed += 1
+            self.report(job, ok, error, time.perf_counter() - start)
+        return self.failed
+
+    def recover(self) -> None:
+        requeued, abandoned = self.queue.recover()
+        if requeued:
+            print(f"♻️  Requeued {requeued} job(s) left running by a stopped worker")
+        if abandoned:
+            print(f"⚠️  Failed {abandoned} job(s) whose worker died on every attempt ({self.queue.max_attempts})")
+
+    def report(self, job: Job, ok: bool, error: str, seconds: float) -> None:
+        depth = self.queue.depth()
+        finished = time.time()
+        uptime = finished - self.started_at
+        mark = "✅" if ok else "❌"
+        print(
+            f"{mark} job {job.id} {job.session_id}: {seconds:.2f}s"
+            f" (waited {job.started_at - job.enqueued_at:.2f}s, latency {finished - job.enqueued_at:.2f}s)"
+            + (f" — {error}" if error else "")
+        )
+        print(
+            f"   📊 queue {depth['queued']} queued, {depth['running']} running"
+            f" | worker {self.done} done, {self.failed} failed,"
+            f" {(self.done + self.failed) / uptime * 60:.1f} jobs/min, {self.busy_sec / uptime:.0%} busy"
+        )
+
+
+def _enqueue(args: argparse.Namespace) -> int:
+    source: Path = args.source
+    if not source.exists():
+        raise SystemExit(f"{source} not found")
+    if source.is_file() and source.suffix != ".jsonl":
+        jobs = [BatchJob(args.session or source.stem, source.resolve())]
+        SessionWorkspace.for_session(jobs[0].session_id)  # validates the id
+    else:
+        if args.session:
+            raise SystemExit("--session only applies to a single payload file")
+        jobs = discover_jobs(source)
+    queue = JobQueue(args.queue)
+    for job in jobs:
+        job_id = queue.enqueue(job.session_id, job.input_path, force=args.force)
+        print(f"➕ job {job_id}: {job.session_id} ({job.input_path})")
+    depth = queue.depth()
+    print(f"📥 {len(jobs)} job(s) enqueued; {depth['queued']} queued, {depth['running']} running")
+    return 0
+
+
+def _work(args: argparse.Namespace) -> int:
+    settings = BatchSettings(
+        tts_argv=shlex.split(args.tts_args),
+        choreo_fps=args.choreo_fps,
+        force=args.force,
+        render=args.render,
+    )
+    worker = PipelineWorker(
+        JobQueue(args.queue),
+        settings,
+        choreo_workers=args.choreo_workers,
+        render_concurrency=args.render_concurrency,
+        render_extra_args=args.render_args or None,
+    )
+
+    def stop(signum: int, frame: object) -> None:
+        print(f"\n🛑 Signal {signum}: stopping after the current job")
+        worker.stopping = True
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    worker.warm(args.prewarm)
+    failed = worker.run(poll_sec=args.poll_sec, drain=args.drain, max_jobs=args.max_jobs)
+    print(f"👋 Worker {worker.name} stopped: {worker.done} done, {failed} failed")
+    return 1 if failed else 0
+
+
+def _status(args: argparse.Namespace) -> int:
+    queue = JobQueue(args.queue)
+    stats = queue.stats(window_sec=args.window_min * 60)
+    print(f"Queue {queue.path}")
+    print(f"  queued {stats['queued']}, running {stats['running']}, done {stats['done']}, failed {stats['failed']}")
+    if stats["finished_in_window"]:
+        print(
+            f"  last {args.window_min:g} min: {stats['finished_in_window']} finished,"
+            f" {stats['throughput_per_min']:.1f} jobs/min"
+        )
+        print(f"  queue wait  p50 {stats['wait_p50_sec']:.2f}s  p95 {stats['wait_p95_sec']:.2f}s")
+        print(f"  latency     p50 {stats['latency_p50_sec']:.2f}s  p95 {stats['latency_p95_sec']:.2f}s")
+    rows = queue.jobs(args.limit)
+    if rows:
+        print(f"\n  {'id':>5} {'session':<24} {'status':<8} {'seconds':>8}  error")
+        for row in rows:
+            seconds = f"{row['finished_at'] - row['started_at']:.2f}" if row["finished_at"] and row["started_at"] else "-"
+            print(f"  {row['id']:>5} {row['session_id']:<24} {row['status']:<8} {seconds:>8}  {row['error']}")
+    return 0
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Queue-fed, long-running pipeline worker")
+    parser.add_argument("--queue", type=Path, default=DEFAULT_QUEUE_PATH, help="Queue database (default: PIPELINE_QUEUE_PATH)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    enqueue = commands.add_parser("enqueue", help="Queue sessions: a payload file, a directory of them, or a JSONL file")
+    enqueue.add_argument("source", type=Path)
+    enqueue.add_argument("--session", default=None, help="Session id for a single payload file (default: file stem)")
+    enqueue.add_argument("--force", action="store_true", help="Ignore build fingerprints for these jobs")
+    enqueue.set_defaults(handler=_enqueue)
+
+    work = commands.add_parser("work", help="Process queued jobs")
+    work.add_argument("--poll-sec", type=float, default=DEFAULT_POLL_SEC, help="Idle wait between queue polls")
+    work.add_argument("--drain", action="store_true", help="Exit once the queue is empty")
+    work.add_argument("--max-jobs", type=int, default=None, help="Exit after this many jobs")
+    work.add_argument("--prewarm", type=int, default=0, help="Synthesizers to pre-connect at start")
+    work.add_argument("--tts-args", default="", help="Extra generate_tts_and_timings.py flags, quoted")
+    work.add_argument("--choreo-workers", type=int, default=None, help="Choreography worker processes per job")
+    work.add_argument("--choreo-fps", default=None, help="Choreography output frame rates, e.g. 24,30,60")
+    work.add_argument("--force", action="store_true", help="Ignore build fingerprints for every job")
+    work.add_argument("--render", action="store_true", help="Also render each session's video")
+    work.add_argument("--render-args", default="", help="Extra remotion render flags, quoted")
+    work.add_argument("--render-concurrency", type=int, default=None)
+    work.set_defaults(handler=_work)
+
+    status = commands.add_parser("status", help="Queue depth, latency and throughput")
+    status.add_argument("--window-min", type=float, default=60, help="Window for latency/throughput (minutes)")
+    status.add_argument("--limit", type=int, default=20, help="Recent jobs to list")
+    status.set_defaults(handler=_status)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
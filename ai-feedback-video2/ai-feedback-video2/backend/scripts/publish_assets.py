@@ -2,139 +2,228 @@
 """
 publish_assets.py
 -----------------
-Publishes generated assets to the frontend video-app:
+Publishes a session workspace's generated assets to its Remotion project
+(video-app/ for the shared workspace, the workspace's app/ copy with --session):
 - Audio files → public/audio/
-- Choreography manifests → src/data/choreography/
-- Word timings → src/data/timings/
+- Choreography manifests → src/data/choreography/ (extra frame rates in <fps>fps/)
+- Shared word tables referenced by choreography → src/data/word_tables/
+- Clip summaries → src/data/timings/ (audio_file + duration_sec only; the
+  words reach the bundle once, through the word tables)
 - Updates narration_manifest.json with actual durations
+
+Files whose published copy already has the same content are left alone, so
+an incremental run only touches what changed (--force rewrites everything).
 """
 
 from __future__ import annotations
 
-import shutil
+import argparse
+import copy
+import filecmp
+import sys
 from pathlib import Path
 import json
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
-BACKEND_DIR = PROJECT_ROOT / "backend"
-DATA_DIR = BACKEND_DIR / "data"
-BACKEND_OUTPUT = BACKEND_DIR / "output"
-FRONTEND_DIR = PROJECT_ROOT / "video-app"
-FRONTEND_DATA = FRONTEND_DIR / "src" / "data"
-FRONTEND_AUDIO = FRONTEND_DIR / "public" / "audio"
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.scripts.timing_format import (  # noqa: E402
+    decode_timing,
+    timing_paths,
+    timing_summary,
+)
+from backend.scripts.workspace import (  # noqa: E402
+    SessionWorkspace,
+    add_workspace_arguments,
+    atomic_copy,
+    atomic_write_bytes,
+    workspace_from_args,
+)
+
+
+def publish_file(src: Path, dest: Path, data: Optional[bytes] = None, force: bool = False) -> Optional[str]:
+    """
+    Copy src to dest (or write data there) unless dest already holds the same
+    content. Returns why the file was written ("new"/"changed"/"forced"), or None.
+    """
+    if not dest.exists():
+        reason = "new"
+    elif force:
+        reason = "forced"
+    elif data is None and filecmp.cmp(src, dest, shallow=False):
+        return None
+    elif data is not None and dest.read_bytes() == data:
+        return None
+    else:
+        reason = "changed"
+    if data is None:
+        atomic_copy(src, dest)
+    else:
+        atomic_write_bytes(dest, data)
+    return reason
 
-# Session data paths
-SESSION_SOURCE = DATA_DIR / "session_questions.json"
-SESSION_DEST = FRONTEND_DATA / "session_questions.json"
 
-# Source directories
-AUDIO_SRC = BACKEND_OUTPUT / "audio"
-CHOREOGRAPHY_SRC = BACKEND_OUTPUT / "choreography"
-TIMINGS_SRC = BACKEND_OUTPUT / "timings"
+def _report(name: str, reason: Optional[str], note: str = "") -> bool:
+    """Log a written file with its reason; True if it was unchanged (for counting)."""
+    if reason:
+        print(f"  ✅ {name}{note} ({reason})")
+    return reason is None
 
-# Destination directories
-CHOREOGRAPHY_DEST = FRONTEND_DATA / "choreography"
-TIMINGS_DEST = FRONTEND_DATA / "timings"
-MANIFEST_DEST = FRONTEND_DATA / "narration_manifest.json"
 
+def _report_unchanged(unchanged: int) -> None:
+    if unchanged:
+        print(f"  ⏭️  {unchanged} unchanged")
 
-def copy_session_data() -> bool:
+
+def copy_session_data(workspace: SessionWorkspace, force: bool = False) -> bool:
     """Copy session_questions.json so visual text matches backend source."""
     print("📄 Publishing session data...")
-    if not SESSION_SOURCE.exists():
-        print(f"  ⚠️  Session data not found at {SESSION_SOURCE}")
+    session_source = workspace.session_path
+    session_dest = workspace.frontend_data_dir / "session_questions.json"
+    if not session_source.exists():
+        print(f"  ⚠️  Session data not found at {session_source}")
         return False
-    SESSION_DEST.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(SESSION_SOURCE, SESSION_DEST)
-    print(f"  ✅ session_questions.json → {SESSION_DEST}")
+    reason = publish_file(session_source, session_dest, force=force)
+    if _report(f"session_questions.json → {session_dest}", reason):
+        print("  ⏭️  session_questions.json unchanged")
     return True
 
 
-def copy_audio_files():
+def copy_audio_files(workspace: SessionWorkspace, force: bool = False):
     """Copy audio files to frontend public directory"""
     print("🎵 Publishing audio files...")
     
-    FRONTEND_AUDIO.mkdir(parents=True, exist_ok=True)
+    workspace.frontend_audio_dir.mkdir(parents=True, exist_ok=True)
     
-    audio_files = list(AUDIO_SRC.glob("*.mp3"))
+    audio_files = list(workspace.audio_dir.glob("*.mp3"))
     
+    unchanged = 0
     for audio_file in audio_files:
-        dest_file = FRONTEND_AUDIO / audio_file.name
-        shutil.copy2(audio_file, dest_file)
-        print(f"  ✅ {audio_file.name}")
+        dest_file = workspace.frontend_audio_dir / audio_file.name
+        unchanged += _report(audio_file.name, publish_file(audio_file, dest_file, force=force))
+    _report_unchanged(unchanged)
     
     return len(audio_files)
 
 
-def copy_choreography_files():
+def copy_choreography_files(workspace: SessionWorkspace, force: bool = False):
     """Copy choreography manifests to frontend data directory"""
     print("\n📋 Publishing choreography manifests...")
     
-    CHOREOGRAPHY_DEST.mkdir(parents=True, exist_ok=True)
+    choreography_src = workspace.choreography_dir
+    choreography_dest = workspace.frontend_data_dir / "choreography"
+    choreography_dest.mkdir(parents=True, exist_ok=True)
     
-    if not CHOREOGRAPHY_SRC.exists():
+    if not choreography_src.exists():
         print("  ⚠️  No choreography directory found")
         return 0
     
-    choreo_files = list(CHOREOGRAPHY_SRC.glob("*.json"))
+    choreo_files = sorted(choreography_src.rglob("*.json"))
     
+    unchanged = 0
     for choreo_file in choreo_files:
-        dest_file = CHOREOGRAPHY_DEST / choreo_file.name
-        shutil.copy2(choreo_file, dest_file)
-        print(f"  ✅ {choreo_file.name}")
+        relative = choreo_file.relative_to(choreography_src)
+        dest_file = choreography_dest / relative
+        unchanged += _report(relative.as_posix(), publish_file(choreo_file, dest_file, force=force))
+    _report_unchanged(unchanged)
     
     return len(choreo_files)
 
 
-def copy_timing_files():
-    """Copy word timing files to frontend data directory"""
-    print("\n⏱️  Publishing word timing files...")
+def copy_word_tables(workspace: SessionWorkspace, force: bool = False):
+    """Copy the columnar word tables that choreography files reference by id"""
+    print("\n🔤 Publishing word tables...")
+    
+    word_tables_src = workspace.word_tables_dir
+    word_tables_dest = workspace.frontend_data_dir / "word_tables"
+    word_tables_dest.mkdir(parents=True, exist_ok=True)
+    
+    if not word_tables_src.exists():
+        print("  ⚠️  No word tables directory found")
+        return 0
+    
+    table_files = sorted(word_tables_src.rglob("*.json"))
+    
+    unchanged = 0
+    for table_file in table_files:
+        relative = table_file.relative_to(word_tables_src)
+        dest_file = word_tables_dest / relative
+        unchanged += _report(relative.as_posix(), publish_file(table_file, dest_file, force=force))
+    _report_unchanged(unchanged)
+    
+    return len(table_files)
+
+
+def copy_timing_files(workspace: SessionWorkspace, force: bool = False):
+    """
+    Publish one summary per timing file (audio_file and duration_sec, which
+    is all the frontend reads from timings/). Per-word timings are published
+    once, as the word tables the choreography references.
+    """
+    print("\n⏱️  Publishing clip timing summaries...")
     
-    TIMINGS_DEST.mkdir(parents=True, exist_ok=True)
+    timings_dest = workspace.frontend_data_dir / "timings"
+    timings_dest.mkdir(parents=True, exist_ok=True)
     
-    if not TIMINGS_SRC.exists():
+    if not workspace.timings_dir.exists():
         print("  ⚠️  No timings directory found")
         return 0
     
-    timing_files = list(TIMINGS_SRC.glob("*.json"))
+    timing_files = timing_paths(workspace.timings_dir)
     
+    unchanged = 0
     for timing_file in timing_files:
-        dest_file = TIMINGS_DEST / timing_file.name
-        shutil.copy2(timing_file, dest_file)
-        print(f"  ✅ {timing_file.name}")
+        dest_file = timings_dest / f"{timing_file.stem}.json"
+        summary = json.dumps(timing_summary(decode_timing(timing_file)), indent=2).encode("utf-8")
+        unchanged += _report(f"{timing_file.name} → {dest_file.name}", publish_file(timing_file, dest_file, summary, force))
+    _report_unchanged(unchanged)
     
     # Create index
-    index_file = TIMINGS_DEST / "index.json"
-    index = {f.stem: f"./{f.name}" for f in timing_files}
-    index_file.write_text(json.dumps(index, indent=2), encoding="utf-8")
+    index_file = timings_dest / "index.json"
+    index = {f.stem: f"./{f.stem}.json" for f in timing_files}
+    publish_file(index_file, index_file, json.dumps(index, indent=2).encode("utf-8"), force)
     
     return len(timing_files)
 
 
-def update_narration_manifest():
-    """Update narration_manifest.json with actual durations from audio timing"""
+def update_narration_manifest(
+    workspace: SessionWorkspace,
+    manifest: Optional[List[Dict[str, Any]]] = None,
+    timings: Optional[Dict[str, Dict[str, Any]]] = None,
+    force: bool = False,
+):
+    """
+    Update narration_manifest.json with actual durations from audio timing.
+    manifest and timings ({stem: payload}) are used instead of the backend
+    output files when the caller already holds them in memory.
+    """
     print("\n📝 Updating narration manifest with actual audio durations...")
     
     # Load manifest from backend output
-    manifest_source = BACKEND_OUTPUT / "narration_manifest.json"
-    if not manifest_source.exists():
-        print("  ⚠️  No manifest in backend output")
-        return 0
-    
-    current_manifest = json.loads(manifest_source.read_text(encoding="utf-8"))
+    manifest_source = workspace.manifest_path
+    if manifest is None:
+        if not manifest_source.exists():
+            print("  ⚠️  No manifest in backend output")
+            return 0
+        manifest = json.loads(manifest_source.read_text(encoding="utf-8"))
+    # Durations are patched on a copy; the caller's manifest stays as built.
+    current_manifest = copy.deepcopy(manifest)
     
     # Load timing data for actual audio durations
-    if not TIMINGS_SRC.exists():
-        print("  ⚠️  No timing data, skipping duration updates")
-        return 0
+    if timings is None:
+        if not workspace.timings_dir.exists():
+            print("  ⚠️  No timing data, skipping duration updates")
+            return 0
+        timings = {timing_file.stem: decode_timing(timing_file) for timing_file in timing_paths(workspace.timings_dir)}
     
     # Create mapping from audio files to durations
     audio_durations: Dict[str, float] = {}
-    for timing_file in TIMINGS_SRC.glob("*.json"):
-        timing_data = json.loads(timing_file.read_text(encoding="utf-8"))
-        audio_file = timing_data.get("audio_file", "")
-        duration_sec = timing_data.get("duration_sec", 0)
+    for timing_data in timings.values():
+        summary = timing_summary(timing_data)
+        audio_file = summary["audio_file"]
+        duration_sec = summary["duration_sec"]
         if audio_file:
             audio_durations[audio_file] = duration_sec
     
@@ -152,26 +241,35 @@ def update_narration_manifest():
                 print(f"  🔄 {audio_file}: {old_duration:.1f}s → {new_duration:.1f}s")
     
     # Save updated manifest to frontend
-    MANIFEST_DEST.parent.mkdir(parents=True, exist_ok=True)
-    MANIFEST_DEST.write_text(
-        json.dumps(current_manifest, indent=4, ensure_ascii=False),
-        encoding="utf-8"
+    manifest_dest = workspace.frontend_data_dir / "narration_manifest.json"
+    publish_file(
+        manifest_dest,
+        manifest_dest,
+        json.dumps(current_manifest, indent=4, ensure_ascii=False).encode("utf-8"),
+        force,
     )
     
     print(f"  ✅ Updated {updated_count} durations in manifest")
     return updated_count
 
 
-def publish() -> None:
-    """Main publishing function"""
+def publish(
+    manifest: Optional[List[Dict[str, Any]]] = None,
+    timings: Optional[Dict[str, Dict[str, Any]]] = None,
+    force: bool = False,
+    workspace: Optional[SessionWorkspace] = None,
+) -> None:
+    """Main publishing function; manifest/timings are optional in-memory inputs (see update_narration_manifest)"""
+    workspace = workspace or SessionWorkspace.default()
     print("📦 Publishing backend assets to frontend...\n")
     
-    session_copied = copy_session_data()
+    session_copied = copy_session_data(workspace, force)
     # Copy all assets
-    audio_count = copy_audio_files()
-    choreo_count = copy_choreography_files()
-    timing_count = copy_timing_files()
-    update_count = update_narration_manifest()
+    audio_count = copy_audio_files(workspace, force)
+    choreo_count = copy_choreography_files(workspace, force)
+    table_count = copy_word_tables(workspace, force)
+    timing_count = copy_timing_files(workspace, force)
+    update_count = update_narration_manifest(workspace, manifest, timings, force)
     
     # Summary
     print("\n" + "="*60)
@@ -180,13 +278,21 @@ def publish() -> None:
     print(f"  Session data copied:  {'yes' if session_copied else 'no'}")
     print(f"  Audio files:         {audio_count}")
     print(f"  Choreography files:  {choreo_count}")
+    print(f"  Word tables:         {table_count}")
     print(f"  Timing files:        {timing_count}")
     print(f"  Manifest updates:    {update_count}")
     print("="*60)
     print("\n🎬 Frontend ready! Preview your video:")
-    print(f"   cd video-app")
-    print("   npm run dev")
+    if workspace.isolated:
+        print(f"   python video-app/render_video_multi_quality.py --session {workspace.name}")
+    else:
+        print(f"   cd video-app")
+        print("   npm run dev")
 
 
 if __name__ == "__main__":
-    publish()
+    parser = argparse.ArgumentParser(description="Publish backend assets to the video-app")
+    parser.add_argument("--force", action="store_true", help="Rewrite every published file, even unchanged ones")
+    add_workspace_arguments(parser)
+    args = parser.parse_args()
+    publish(force=args.force, workspace=workspace_from_args(args))
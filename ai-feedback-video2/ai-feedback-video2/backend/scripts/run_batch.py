@@ -0,0 +1,470 @@
+#!/usr/bin/env python
+"""
+run_batch.py
+------------
+Runs the pipeline for many sessions at once, each in its own workspace
+(backend/workspaces/<session>/, see workspace.py):
+
+  python backend/scripts/run_batch.py payloads/            # one slides payload per *.json / *.txt
+  python backend/scripts/run_batch.py sessions.jsonl       # one payload per line
+  python backend/scripts/run_batch.py payloads/ --render   # also render each session's video
+
+A directory entry's session id is its file stem; a JSONL line is a slides
+payload ({"slides": {...}}) with an optional "session_id" (default
+<file stem>-<line number>).
+
+Sessions move through three phases, each with its own pool sized for what
+the phase spends its time on:
+
+  prepare  convert → narration → tts   waits on the TTS service: many sessions at once (--tts-sessions)
+  choreo   choreo → publish            CPU-bound: one process per core (--choreo-sessions)
+  render   render_video_multi_quality  very heavy: a small pool (--render-sessions)
+
+A session enters the next phase's pool as soon as its previous phase is
+done, so one session's choreography overlaps other sessions' TTS. Each
+session logs to <workspace>/output/batch.log; the per-session status and
+timing report is printed at the end and written to --report.
+
+Pipeline flags (--tts-args, --choreo-fps, --force) apply to every session.
+The TTS rate limits (--rps and --max-connections in --tts-args, or their
+TTS_MAX_RPS / TTS_MAX_CONNECTIONS defaults) are totals for the whole batch:
+each session's scheduler gets an equal share of them, since up to
+--tts-sessions sessions synthesize at once. Every session keeps at least one
+connection, so keep --tts-sessions at or below --max-connections. The TTS
+cache is shared, so sessions with the same narration reuse each other's
+clips.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import shlex
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.scripts.pipeline import (  # noqa: E402
+    STATUS_FAILED,
+    PipelineOptions,
+    StageResult,
+    build_stages,
+    run_stages,
+)
+from backend.scripts.workspace import (  # noqa: E402
+    FRONTEND_DIR,
+    WORKSPACES_DIR,
+    SessionWorkspace,
+    atomic_write_text,
+)
+from backend.tts.scheduler import DEFAULT_MAX_CONNECTIONS, DEFAULT_RPS  # noqa: E402
+
+RENDERER = FRONTEND_DIR / "render_video_multi_quality.py"
+DEFAULT_TTS_SESSIONS = int(os.environ.get("BATCH_TTS_SESSIONS", "8"))
+DEFAULT_CHOREO_SESSIONS = int(os.environ.get("BATCH_CHOREO_SESSIONS", str(os.cpu_count() or 1)))
+DEFAULT_RENDER_SESSIONS = int(os.environ.get("BATCH_RENDER_SESSIONS", "1"))
+DEFAULT_REPORT_PATH = WORKSPACES_DIR / "batch_report.json"
+PAYLOAD_SUFFIXES = (".json", ".txt")
+
+PHASE_PREPARE = "prepare"
+PHASE_CHOREO = "choreo"
+PHASE_RENDER = "render"
+# Pipeline stages each phase runs; the render phase runs the renderer instead.
+PHASE_STAGES: Dict[str, Tuple[str, ...]] = {
+    PHASE_PREPARE: ("convert", "narration", "tts"),
+    PHASE_CHOREO: ("choreo", "publish"),
+    PHASE_RENDER: (),
+}
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    session_id: str
+    input_path: Path
+
+
+@dataclass
+class BatchSettings:
+    """Per-session pipeline settings, shared by every job in the batch."""
+
+    tts_argv: List[str] = field(default_factory=list)
+    choreo_fps: Optional[str] = None
+    force: bool = False
+    render: bool = False
+    render_argv: List[str] = field(default_factory=list)
+
+
+@dataclass
+class PhaseOutcome:
+    phase: str
+    ok: bool
+    queued_at: float
+    started_at: float = 0.0
+    finished_at: float = 0.0
+    stages: List[StageResult] = field(default_factory=list)
+    error: str = ""
+
+    @property
+    def seconds(self) -> float:
+        return self.finished_at - self.started_at
+
+    @property
+    def waited(self) -> float:
+        return max(self.started_at - self.queued_at, 0.0)
+
+
+@dataclass
+class SessionReport:
+    session_id: str
+    log_path: Path
+    phases: Dict[str, PhaseOutcome] = field(default_factory=dict)
+
+    @property
+    def status(self) -> str:
+        for outcome in self.phases.values():
+            if not outcome.ok:
+                failed = next((stage.name for stage in outcome.stages if stage.status == STATUS_FAILED), None)
+                return f"failed in {failed or outcome.phase}"
+        return "done"
+
+    @property
+    def seconds(self) -> float:
+        return sum(outcome.seconds for outcome in self.phases.values())
+
+    @property
+    def waited(self) -> float:
+        return sum(outcome.waited for outcome in self.phases.values())
+
+
+# ---------------------------------------------------------------------------
+# Job discovery
+# ---------------------------------------------------------------------------
+
+def discover_jobs(source: Path, root: Optional[Path] = None) -> List[BatchJob]:
+    """
+    One job per slides payload in source: a directory of payload files or a
+    JSONL file. JSONL lines are written to <workspace>/input.txt up front,
+    since the pool workers only get paths.
+    """
+    if source.is_dir():
+        paths = sorted(path for path in source.iterdir() if path.suffix in PAYLOAD_SUFFIXES and path.is_file())
+        jobs = [BatchJob(path.stem, path.resolve()) for path in paths]
+    else:
+        jobs = []
+        with source.open(encoding="utf-8") as lines:
+            for number, line in enumerate(lines, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    payload = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    raise ValueError(f"{source}:{number} is not valid JSON: {exc}") from exc
+                session_id = str(payload.pop("session_id", None) or f"{source.stem}-{number}")
+                workspace = SessionWorkspace.for_session(session_id, root=root)
+                atomic_write_text(workspace.input_path, json.dumps(payload, indent=2, ensure_ascii=False))
+                jobs.append(BatchJob(session_id, workspace.input_path))
+    seen = set()
+    for job in jobs:
+        SessionWorkspace.for_session(job.session_id, root=root)  # validates the id
+        if job.session_id in seen:
+            raise ValueError(f"Duplicate session id '{job.session_id}' in {source}")
+        seen.add(job.session_id)
+    return jobs
+
+
+# ---------------------------------------------------------------------------
+# TTS rate limits
+# ---------------------------------------------------------------------------
+
+def split_tts_limits(tts_argv: Sequence[str], sessions: int) -> List[str]:
+    """
+    tts_argv with --rps and --max-connections divided across sessions that
+    synthesize concurrently, so their schedulers together stay within the
+    given (or default) limits. The shares are appended; the last flag wins.
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--rps", type=float, default=DEFAULT_RPS)
+    parser.add_argument("--max-connections", type=int, default=DEFAULT_MAX_CONNECTIONS)
+    limits, _ = parser.parse_known_args(list(tts_argv))
+    sessions = max(sessions, 1)
+    argv = list(tts_argv)
+    if limits.rps > 0:  # <=0 means unlimited, which stays unlimited
+        argv += ["--rps", f"{limits.rps / sessions:g}"]
+    argv += ["--max-connections", str(max(limits.max_connections // sessions, 1))]
+    return argv
+
+
+# ---------------------------------------------------------------------------
+# Phase workers (run in pool processes)
+# ---------------------------------------------------------------------------
+
+def _run_pipeline_phase(
+    job: BatchJob,
+    phase: str,
+    settings: BatchSettings,
+    root: Optional[Path],
+    queued_at: float,
+) -> PhaseOutcome:
+    outcome = PhaseOutcome(phase, ok=False, queued_at=queued_at, started_at=time.time())
+    workspace = SessionWorkspace.for_session(job.session_id, input_path=job.input_path, root=root)
+    if phase == PHASE_PREPARE:
+        workspace = workspace.ensure()
+    log_path = workspace.output_dir / "batch.log"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with log_path.open("a", encoding="utf-8") as log, contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+        print(f"\n##### {phase} ({time.strftime('%Y-%m-%d %H:%M:%S')}) #####")
+        try:
+            options = PipelineOptions(
+                tts_argv=list(settings.tts_argv),
+                # Sessions already run one per process; nested pools would oversubscribe the cores.
+                choreo_workers=1,
+                choreo_fps=settings.choreo_fps,
+                force=settings.force,
+                workspace=workspace,
+            )
+            stages = build_stages(options)
+            skip = [stage.name for stage in stages if stage.name not in PHASE_STAGES[phase]]
+            results = run_stages(stages, skip=skip, force=settings.force, workspace=workspace)
+            outcome.stages = [result for result in results if result.name in PHASE_STAGES[phase]]
+            outcome.ok = not any(result.status == STATUS_FAILED for result in outcome.stages)
+            outcome.error = next((result.error for result in outcome.stages if result.error), "")
+        except Exception as exc:  # a broken workspace must not take the pool down
+            print(f"❌ {phase} failed: {exc}")
+            outcome.error = str(exc)
+    outcome.finished_at = time.time()
+    return outcome
+
+
+def _run_render_phase(
+    job: BatchJob,
+    settings: BatchSettings,
+    root: Optional[Path],
+    queued_at: float,
+) -> PhaseOutcome:
+    outcome = PhaseOutcome(PHASE_RENDER, ok=False, queued_at=queued_at, started_at=time.time())
+    workspace = SessionWorkspace.for_session(job.session_id, root=root)
+    env = dict(os.environ)
+    if root is not None:
+        env["PIPELINE_WORKSPACES_DIR"] = str(root)
+    with (workspace.output_dir / "batch.log").open("a", encoding="utf-8") as log:
+        log.write(f"\n##### {PHASE_RENDER} ({time.strftime('%Y-%m-%d %H:%M:%S')}) #####\n")
+        log.flush()
+        completed = subprocess.run(
+            [sys.executable, str(RENDERER), "--session", job.session_id, *settings.render_argv],
+            cwd=PROJECT_ROOT,
+            env=env,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            check=False,
+        )
+    outcome.ok = completed.returncode == 0
+    if not outcome.ok:
+        outcome.error = f"renderer exited with {completed.returncode}"
+    outcome.finished_at = time.time()
+    return outcome
+
+
+# ---------------------------------------------------------------------------
+# Scheduler
+# ---------------------------------------------------------------------------
+
+def run_batch(
+    jobs: Sequence[BatchJob],
+    settings: Optional[BatchSettings] = None,
+    tts_sessions: int = DEFAULT_TTS_SESSIONS,
+    choreo_sessions: int = DEFAULT_CHOREO_SESSIONS,
+    render_sessions: int = DEFAULT_RENDER_SESSIONS,
+    root: Optional[Path] = None,
+) -> List[SessionReport]:
+    """
+    Run every job through prepare → choreo (→ render), each phase on its own
+    pool, handing a session to the next pool as soon as it clears the
+    previous one. Returns one report per job, in input order.
+    """
+    settings = settings or BatchSettings()
+    tts_sessions = max(min(tts_sessions, len(jobs)), 1)
+    settings = replace(settings, tts_argv=split_tts_limits(settings.tts_argv, tts_sessions))
+    phases = [PHASE_PREPARE, PHASE_CHOREO] + ([PHASE_RENDER] if settings.render else [])
+    reports = {
+        job.session_id: SessionReport(
+            job.session_id, SessionWorkspace.for_session(job.session_id, root=root).output_dir / "batch.log"
+        )
+        for job in jobs
+    }
+    pools: Dict[str, Executor] = {
+        PHASE_PREPARE: ProcessPoolExecutor(max_workers=tts_sessions),
+        PHASE_CHOREO: ProcessPoolExecutor(max_workers=max(min(choreo_sessions, len(jobs)), 1)),
+    }
+    if settings.render:
+        # Each render is its own node process; the pool only bounds how many run at once.
+        pools[PHASE_RENDER] = ThreadPoolExecutor(max_workers=max(render_sessions, 1))
+    pending: Dict[Future, Tuple[BatchJob, str]] = {}
+
+    def submit(job: BatchJob, phase: str) -> None:
+        queued_at = time.time()
+        if phase == PHASE_RENDER:
+            future = pools[phase].submit(_run_render_phase, job, settings, root, queued_at)
+        else:
+            future = pools[phase].submit(_run_pipeline_phase, job, phase, settings, root, queued_at)
+        pending[future] = (job, phase)
+
+    try:
+        for job in jobs:
+            submit(job, PHASE_PREPARE)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                job, phase = pending.pop(future)
+                try:
+                    outcome = future.result()
+                except Exception as exc:  # worker process died
+                    outcome = PhaseOutcome(phase, ok=False, queued_at=0.0, error=str(exc))
+                reports[job.session_id].phases[phase] = outcome
+                mark = "✅" if outcome.ok else "❌"
+                print(f"{mark} {job.session_id}: {phase} {outcome.seconds:.2f}s" + (f" ({outcome.error})" if outcome.error else ""))
+                next_index = phases.index(phase) + 1
+                if outcome.ok and next_index < len(phases):
+                    submit(job, phases[next_index])
+    finally:
+        for pool in pools.values():
+            pool.shutdown(wait=True, cancel_futures=True)
+    return [reports[job.session_id] for job in jobs]
+
+
+# ---------------------------------------------------------------------------
+# Report
+# ---------------------------------------------------------------------------
+
+def print_batch_report(reports: Sequence[SessionReport], wall_sec: float, phases: Sequence[str]) -> None:
+    print("\n" + "=" * 78)
+    print("BATCH REPORT")
+    print("=" * 78)
+    header = f"  {'Session':<24} {'Status':<20}" + "".join(f" {phase:>9}" for phase in phases) + f" {'waited':>9}"
+    print(header)
+    for report in reports:
+        line = f"  {report.session_id:<24} {report.status:<20}"
+        for phase in phases:
+            outcome = report.phases.get(phase)
+            line += f" {outcome.seconds:8.2f}s" if outcome else f" {'-':>9}"
+        line += f" {report.waited:8.2f}s"
+        print(line)
+    done = sum(1 for report in reports if report.status == "done")
+    print("-" * 78)
+    print(f"  {done}/{len(reports)} sessions done in {wall_sec:.2f}s", end="")
+    if wall_sec > 0:
+        print(f"  ({done / wall_sec * 60:.1f} sessions/min)", end="")
+    print()
+    for phase in phases:
+        busy = sum(report.phases[phase].seconds for report in reports if phase in report.phases)
+        print(f"  {phase:<8} {busy:8.2f}s of work")
+    failed = [report for report in reports if report.status != "done"]
+    for report in failed:
+        print(f"  ⚠️  {report.session_id}: see {report.log_path}")
+    print("=" * 78)
+
+
+def report_payload(reports: Sequence[SessionReport], wall_sec: float) -> Dict:
+    return {
+        "wall_sec": round(wall_sec, 3),
+        "sessions": [
+            {
+                "session_id": report.session_id,
+                "status": report.status,
+                "seconds": round(report.seconds, 3),
+                "waited_sec": round(report.waited, 3),
+                "log": str(report.log_path),
+                "phases": {
+                    phase: {
+                        "ok": outcome.ok,
+                        "seconds": round(outcome.seconds, 3),
+                        "waited_sec": round(outcome.waited, 3),
+                        "error": outcome.error,
+                        "stages": [asdict(stage) for stage in outcome.stages],
+                    }
+                    for phase, outcome in report.phases.items()
+                },
+            }
+            for report in reports
+        ],
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the pipeline for many sessions over stage-aware process pools")
+    parser.add_argument("source", type=Path, help="Directory of slides payloads, or a JSONL file with one per line")
+    parser.add_argument(
+        "--tts-sessions",
+        type=int,
+        default=DEFAULT_TTS_SESSIONS,
+        help="Sessions in convert/narration/TTS at once, sharing the TTS rate limits (default: BATCH_TTS_SESSIONS or 8)",
+    )
+    parser.add_argument(
+        "--choreo-sessions",
+        type=int,
+        default=DEFAULT_CHOREO_SESSIONS,
+        help="Sessions in choreography/publish at once (default: BATCH_CHOREO_SESSIONS or one per core)",
+    )
+    parser.add_argument(
+        "--render-sessions",
+        type=int,
+        default=DEFAULT_RENDER_SESSIONS,
+        help="Sessions rendering at once (default: BATCH_RENDER_SESSIONS or 1)",
+    )
+    parser.add_argument("--render", action="store_true", help="Also render each session's video")
+    parser.add_argument("--render-args", default="", help="Extra render_video_multi_quality.py flags, quoted")
+    parser.add_argument(
+        "--tts-args",
+        default="",
+        help="Extra generate_tts_and_timings.py flags for every session, quoted; --rps/--max-connections are batch totals",
+    )
+    parser.add_argument("--choreo-fps", default=None, help="Choreography output frame rates, e.g. 24,30,60")
+    parser.add_argument("--force", action="store_true", help="Ignore build fingerprints in every session")
+    parser.add_argument("--report", type=Path, default=DEFAULT_REPORT_PATH, help="Where to write the JSON report")
+    args = parser.parse_args(argv)
+
+    if not args.source.exists():
+        parser.error(f"{args.source} not found")
+    jobs = discover_jobs(args.source)
+    if not jobs:
+        parser.error(f"No slides payloads found in {args.source}")
+    settings = BatchSettings(
+        tts_argv=shlex.split(args.tts_args),
+        choreo_fps=args.choreo_fps,
+        force=args.force,
+        render=args.render,
+        render_argv=shlex.split(args.render_args),
+    )
+
+    print(
+        f"🗂️  {len(jobs)} session(s): {args.tts_sessions} in TTS, {args.choreo_sessions} in choreography"
+        + (f", {args.render_sessions} rendering" if args.render else "")
+        + " at once"
+    )
+    start = time.perf_counter()
+    reports = run_batch(
+        jobs,
+        settings,
+        tts_sessions=args.tts_sessions,
+        choreo_sessions=args.choreo_sessions,
+        render_sessions=args.render_sessions,
+    )
+    wall_sec = time.perf_counter() - start
+    phases = [PHASE_PREPARE, PHASE_CHOREO] + ([PHASE_RENDER] if args.render else [])
+    print_batch_report(reports, wall_sec, phases)
+    atomic_write_text(args.report, json.dumps(report_payload(reports, wall_sec), indent=2))
+    print(f"📄 {args.report}")
+    return 0 if all(report.status == "done" for report in reports) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
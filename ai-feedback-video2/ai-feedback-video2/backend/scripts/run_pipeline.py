@@ -8,6 +8,9 @@ Master script to run the complete narration generation pipeline:
 3. calculate_choreography.py - Convert timings to frame-accurate choreography
 4. publish_assets.py - Copy everything to frontend
 
+The steps run in this process (see pipeline.py), handing the manifest and
+timings to each other in memory.
+
 Usage:
     python scripts/run_pipeline.py                  # Run full pipeline
     python scripts/run_pipeline.py --skip-narration # Skip step 1 (use existing manifest)
@@ -18,42 +21,22 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import subprocess
 import sys
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
-SCRIPTS_DIR = PROJECT_ROOT / "backend" / "scripts"
-
-# Script paths
-NARRATION_SCRIPT = SCRIPTS_DIR / "build_narration.py"
-TTS_SCRIPT = SCRIPTS_DIR / "generate_tts_and_timings.py"
-CHOREOGRAPHY_SCRIPT = SCRIPTS_DIR / "calculate_choreography.py"
-PUBLISH_SCRIPT = SCRIPTS_DIR / "publish_assets.py"
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
-
-def run_script(script_path: Path, step_name: str) -> bool:
-    """Run a Python script and return success status"""
-    print("\n" + "=" * 70)
-    print(f"STEP: {step_name}")
-    print("=" * 70 + "\n")
-    
-    try:
-        result = subprocess.run(
-            [sys.executable, str(script_path)],
-            check=True,
-            cwd=PROJECT_ROOT,
-            capture_output=False,
-            text=True
-        )
-        print(f"\n✅ {step_name} completed successfully")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"\n❌ {step_name} failed with exit code {e.returncode}")
-        return False
-    except Exception as e:
-        print(f"\n❌ {step_name} failed: {e}")
-        return False
+from backend.scripts.pipeline import (  # noqa: E402
+    STATUS_FAILED,
+    STATUS_RAN,
+    add_pipeline_arguments,
+    build_stages,
+    options_from_args,
+    print_report,
+    run_stages,
+)
 
 
 def main() -> int:
@@ -62,77 +45,53 @@ def main() -> int:
     parser.add_argument("--skip-tts", action="store_true", help="Skip TTS synthesis")
     parser.add_argument("--skip-choreography", action="store_true", help="Skip choreography calculation")
     parser.add_argument("--publish-only", action="store_true", help="Only run publish step")
+    add_pipeline_arguments(parser)
     args = parser.parse_args()
     
     print("\n" + "🎬" * 35)
     print("NARRATION PIPELINE - Complete Video Generation")
     print("🎬" * 35)
     
-    steps_run = 0
-    steps_failed = 0
-    
+    # This runner never converted the authored JSON; narration refreshes the session itself.
+    skip = {"convert"}
     if args.publish_only:
-        # Only run publishing
-        if not run_script(PUBLISH_SCRIPT, "4️⃣ Publish Assets"):
-            return 1
-        print("\n" + "🎉" * 35)
-        print("PIPELINE COMPLETE - Assets Published!")
-        print("🎉" * 35 + "\n")
-        return 0
-    
-    # Step 1: Generate narration text
-    if not args.skip_narration:
-        steps_run += 1
-        if not run_script(NARRATION_SCRIPT, "1️⃣ Generate Narration Text"):
-            steps_failed += 1
-            print("\n⚠️  Pipeline halted due to narration generation failure")
-            return 1
+        skip |= {"narration", "tts", "choreo"}
     else:
-        print("\n⏭️  Skipping narration generation (using existing manifest)")
+        if args.skip_narration:
+            skip.add("narration")
+        if args.skip_tts:
+            skip.add("tts")
+        if args.skip_choreography:
+            skip.add("choreo")
     
-    # Step 2: Synthesize audio with TTS
-    if not args.skip_tts:
-        steps_run += 1
-        if not run_script(TTS_SCRIPT, "2️⃣ Synthesize Audio & Word Timings"):
-            steps_failed += 1
-            print("\n⚠️  Pipeline halted due to TTS synthesis failure")
-            return 1
-    else:
-        print("\n⏭️  Skipping TTS synthesis (using existing audio)")
+    options = options_from_args(args)
+    results = run_stages(
+        build_stages(options),
+        skip=skip,
+        measure_startup_cost=args.measure_startup,
+        force=args.force,
+        workspace=options.workspace,
+    )
+    print_report(results)
     
-    # Step 3: Calculate choreography
-    if not args.skip_choreography:
-        steps_run += 1
-        if not run_script(CHOREOGRAPHY_SCRIPT, "3️⃣ Calculate Frame-Accurate Choreography"):
-            steps_failed += 1
-            print("\n⚠️  Pipeline halted due to choreography calculation failure")
-            return 1
-    else:
-        print("\n⏭️  Skipping choreography calculation (using existing files)")
+    steps_run = sum(1 for result in results if result.status in (STATUS_RAN, STATUS_FAILED))
+    steps_failed = sum(1 for result in results if result.status == STATUS_FAILED)
     
-    # Step 4: Publish to frontend
-    steps_run += 1
-    if not run_script(PUBLISH_SCRIPT, "4️⃣ Publish Assets to Frontend"):
-        steps_failed += 1
-        print("\n⚠️  Publishing failed")
+    # Summary
+    if steps_failed:
+        print(f"\n⚠️  Pipeline halted: {steps_failed} step(s) failed")
         return 1
     
-    # Summary
     print("\n" + "🎉" * 35)
     print("PIPELINE COMPLETE!")
     print("🎉" * 35)
-    print(f"\nSteps completed: {steps_run - steps_failed}/{steps_run}")
-    
-    if steps_failed == 0:
-        print("\n✨ All assets generated and published successfully!")
-        print("\n📺 Next steps:")
-        print("   cd video-app")
-        print("   npm run dev")
-        print("\n   Then enable narration in your slides by setting enabled=true")
-        return 0
-    else:
-        print(f"\n⚠️  {steps_failed} step(s) failed")
-        return 1
+    print(f"\nSteps completed: {steps_run}/{steps_run}")
+    print("\n✨ All assets generated and published successfully!")
+    print("\n📺 Next steps:")
+    print("   cd video-app")
+    print("   npm run dev")
+    print("\n   Then enable narration in your slides by setting enabled=true")
+    return 0
 
 
 if __name__ == "__main__":
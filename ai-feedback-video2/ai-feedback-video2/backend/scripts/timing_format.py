@@ -0,0 +1,157 @@
+"""
+timing_format.py
+----------------
+Reading and writing narration timing files in either layout.
+
+Legacy (what the TTS backends return, pretty-printed):
+
+    {"audio_file": "audio/q1_summary.mp3", "duration_sec": 12.3,
+     "words": [{"text": "Hi", "start_sec": 0.05, "end_sec": 0.3, "duration_sec": 0.25}, ...]}
+
+Compact (parallel arrays of integers, per-word durations dropped):
+
+    {"format": "columnar", "version": 1, "audio_file": "...", "unit": "ticks",
+     "rate": 10000000, "duration": 123000000,
+     "text": [...], "start": [...], "end": [...]}
+
+"ticks" are the 100-ns units Azure reports word boundaries in, so that
+layout is lossless; "frames" stores frame numbers at the given rate. The
+compact layout is written as .json, or as .msgpack when the optional msgpack
+package is installed.
+
+The choreography engine reads compact payloads column by column (see
+frame_math.WordFrames.from_columns), so they get there through decode_timing()
+without being expanded; load_timing() returns the legacy shape for the simple
+readers that want word dicts. timing_paths() lists timing files of either
+encoding.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+from backend.scripts.workspace import atomic_write_bytes
+
+try:  # optional binary encoding
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack is not a hard dependency
+    msgpack = None
+
+COMPACT_FORMAT = "columnar"
+TIMING_FORMAT_VERSION = 1
+TICKS_PER_SEC = 10_000_000
+
+FORMAT_LEGACY = "legacy"
+FORMAT_COMPACT = "compact"
+FORMAT_MSGPACK = "msgpack"
+TIMING_FORMATS = (FORMAT_LEGACY, FORMAT_COMPACT, FORMAT_MSGPACK)
+TIMING_SUFFIXES = (".json", ".msgpack")
+
+UNIT_TICKS = "ticks"
+UNIT_FRAMES = "frames"
+
+
+def is_compact(timing: Dict[str, Any]) -> bool:
+    return timing.get("format") == COMPACT_FORMAT
+
+
+def to_compact(timing: Dict[str, Any], unit: str = UNIT_TICKS, fps: int = 30) -> Dict[str, Any]:
+    """Compact columnar form of a legacy timing payload."""
+    if is_compact(timing):
+        return timing
+    if unit not in (UNIT_TICKS, UNIT_FRAMES):
+        raise ValueError(f"Unknown timing unit '{unit}'")
+    rate = TICKS_PER_SEC if unit == UNIT_TICKS else fps
+    words = timing.get("words", [])
+    return {
+        "format": COMPACT_FORMAT,
+        "version": TIMING_FORMAT_VERSION,
+        "audio_file": timing.get("audio_file", ""),
+        "unit": unit,
+        "rate": rate,
+        "duration": round(timing.get("duration_sec", 0.0) * rate),
+        "text": [w["text"] for w in words],
+        "start": [round(w["start_sec"] * rate) for w in words],
+        "end": [round(w["end_sec"] * rate) for w in words],
+    }
+
+
+def to_legacy(timing: Dict[str, Any]) -> Dict[str, Any]:
+    """Legacy per-word form of a compact payload; legacy payloads are returned as is."""
+    if not is_compact(timing):
+        return timing
+    rate = timing["rate"]
+    words: List[Dict[str, Any]] = []
+    for text, start, end in zip(timing["text"], timing["start"], timing["end"]):
+        start_sec = start / rate
+        end_sec = end / rate
+        words.append(
+            {
+                "text": text,
+                "start_sec": start_sec,
+                "end_sec": end_sec,
+                # Rounded to tick precision so the subtraction adds no float noise.
+                "duration_sec": round(end_sec - start_sec, 7),
+            }
+        )
+    return {"audio_file": timing["audio_file"], "duration_sec": timing["duration"] / rate, "words": words}
+
+
+def timing_summary(timing: Dict[str, Any]) -> Dict[str, Any]:
+    """audio_file and duration_sec of a payload in either layout, without expanding its words."""
+    if is_compact(timing):
+        return {"audio_file": timing["audio_file"], "duration_sec": timing["duration"] / timing["rate"]}
+    return {"audio_file": timing.get("audio_file", ""), "duration_sec": timing.get("duration_sec", 0.0)}
+
+
+def decode_timing(path: Path) -> Dict[str, Any]:
+    """The payload exactly as stored (legacy or compact)."""
+    if path.suffix == ".msgpack":
+        if msgpack is None:
+            raise RuntimeError(f"{path.name} is msgpack-encoded; install msgpack to read it")
+        return msgpack.unpackb(path.read_bytes(), raw=False)
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def load_timing(path: Path) -> Dict[str, Any]:
+    """Timing payload in the legacy shape, whatever layout the file uses."""
+    return to_legacy(decode_timing(path))
+
+
+def encode_timing(timing: Dict[str, Any], timing_format: str = FORMAT_LEGACY) -> bytes:
+    if timing_format == FORMAT_LEGACY:
+        return json.dumps(to_legacy(timing), indent=2).encode("utf-8")
+    if timing_format == FORMAT_COMPACT:
+        return json.dumps(to_compact(timing), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if timing_format == FORMAT_MSGPACK:
+        if msgpack is None:
+            raise RuntimeError("The msgpack timing format needs the msgpack package (pip install msgpack)")
+        return msgpack.packb(to_compact(timing), use_bin_type=True)
+    raise ValueError(f"Unknown timing format '{timing_format}' (choose from {', '.join(TIMING_FORMATS)})")
+
+
+def timing_path_for(path: Path, timing_format: str) -> Path:
+    return path.with_suffix(".msgpack" if timing_format == FORMAT_MSGPACK else ".json")
+
+
+def write_timing(path: Path, timing: Dict[str, Any], timing_format: str = FORMAT_LEGACY) -> Path:
+    """
+    Write timing in the given format and return the path written; the suffix
+    follows the encoding. The file is replaced atomically, and a file for the
+    same clip in the other encoding is removed so readers never see two
+    versions of one clip.
+    """
+    target = timing_path_for(path, timing_format)
+    atomic_write_bytes(target, encode_timing(timing, timing_format))
+    for suffix in TIMING_SUFFIXES:
+        sibling = target.with_suffix(suffix)
+        if sibling != target and sibling.exists():
+            sibling.unlink()
+    return target
+
+
+def timing_paths(directory: Path) -> List[Path]:
+    """Timing files in directory, of either encoding, sorted by name."""
+    return sorted(path for suffix in TIMING_SUFFIXES for path in directory.glob(f"*{suffix}"))
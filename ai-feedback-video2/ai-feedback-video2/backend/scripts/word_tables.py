@@ -0,0 +1,75 @@
+"""
+word_tables.py
+--------------
+Shared, columnar word-timing tables for choreography output.
+
+Instead of every choreography file embedding a list of per-word dicts, the
+narration carries a "wordTable" id and the words live once in
+word_tables/<id>.json as parallel arrays:
+
+    {"version": 2, "id": "q1_summary", "fps": 30,
+     "word": [...], "startFrame": [...], "endFrame": [...], "durationFrames": [...]}
+
+durationFrames is stored, not derived: the engine rounds each word's
+duration_sec on its own, which is not always endFrame - startFrame. Version 1
+tables had no such column and fall back to the difference.
+
+resolve_choreography() (and resolveChoreography in the frontend's
+useChoreography.ts) turns a reference back into the wordTimings list the
+slide code reads.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+WORD_TABLE_VERSION = 2
+
+
+def build_word_table(table_id: str, word_timings: List[Dict[str, Any]], fps: int) -> Dict[str, Any]:
+    return {
+        "version": WORD_TABLE_VERSION,
+        "id": table_id,
+        "fps": fps,
+        "word": [w["word"] for w in word_timings],
+        "startFrame": [w["startFrame"] for w in word_timings],
+        "endFrame": [w["endFrame"] for w in word_timings],
+        "durationFrames": [w["durationFrames"] for w in word_timings],
+    }
+
+
+def expand_word_table(table: Dict[str, Any]) -> List[Dict[str, Any]]:
+    durations = table.get("durationFrames") or [end - start for start, end in zip(table["startFrame"], table["endFrame"])]
+    return [
+        {"word": word, "startFrame": start, "endFrame": end, "durationFrames": duration}
+        for word, start, end, duration in zip(table["word"], table["startFrame"], table["endFrame"], durations)
+    ]
+
+
+def split_word_table(
+    choreography: Dict[str, Any],
+    table_id: str,
+    fps: int,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Choreography with its embedded wordTimings replaced by a reference, and the table."""
+    narration = dict(choreography.get("narration") or {})
+    table = build_word_table(table_id, narration.pop("wordTimings", []), fps)
+    narration["wordTable"] = table_id
+    return {**choreography, "narration": narration}, table
+
+
+def dumps_word_table(table: Dict[str, Any]) -> str:
+    # Tables are read by code, not people: no indentation keeps them small.
+    return json.dumps(table, ensure_ascii=False, separators=(",", ":"))
+
+
+def resolve_choreography(choreography: Dict[str, Any], tables_dir: Path) -> Dict[str, Any]:
+    """Inline the referenced word table; choreography that still embeds wordTimings is returned as is."""
+    narration = choreography.get("narration") or {}
+    table_id = narration.get("wordTable")
+    if not table_id or "wordTimings" in narration:
+        return choreography
+    table = json.loads((tables_dir / f"{table_id}.json").read_text(encoding="utf-8"))
+    return {**choreography, "narration": {**narration, "wordTimings": expand_word_table(table)}}
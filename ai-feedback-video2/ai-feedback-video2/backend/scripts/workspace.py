@@ -0,0 +1,268 @@
+"""
+workspace.py
+------------
+Where one session's pipeline files live, and how they are written.
+
+SessionWorkspace.default() is the historical single-session layout:
+
+    backend/output/               audio, timings, choreography, manifest, .build
+    backend/data/                 session_questions.json
+    video-app/src/data, public/   published assets the renderer bundles
+
+SessionWorkspace.for_session("cand-42") lays out the same tree under
+backend/workspaces/cand-42/ (output/, data/, app/, input.txt), so several
+sessions can be processed on one machine at once without touching each
+other's files. app/ is a private copy of the Remotion project (see
+stage_frontend) that publish_assets fills and the renderer bundles, since
+the bundle compiles src/data in.
+
+Writers go through atomic_write_bytes()/atomic_write_text()/atomic_copy():
+content goes to a temporary file in the target directory and is renamed
+over the target, so a concurrent reader or a crash never sees a
+half-written file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import shutil
+import threading
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+BACKEND_DIR = PROJECT_ROOT / "backend"
+FRONTEND_DIR = PROJECT_ROOT / "video-app"
+WORKSPACES_DIR = Path(os.environ.get("PIPELINE_WORKSPACES_DIR", BACKEND_DIR / "workspaces"))
+
+DEFAULT_SLIDES_PATHS = [
+    PROJECT_ROOT / "input.txt",
+    PROJECT_ROOT / "input.json",
+    BACKEND_DIR / "data" / "slides_payload.json",
+    BACKEND_DIR / "data" / "slides_payload.txt",
+]
+
+_SESSION_ID = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+
+# Not copied into a session's app/: dependencies are linked, build outputs
+# are per-workspace, and generated data is published by the session itself.
+_FRONTEND_SKIP = {"node_modules", "build", "out", "renders", "__pycache__", "render_video_multi_quality.py"}
+_FRONTEND_GENERATED = {
+    Path("public") / "audio",
+    Path("src") / "data" / "choreography",
+    Path("src") / "data" / "word_tables",
+    Path("src") / "data" / "timings",
+    Path("src") / "data" / "narration_manifest.json",
+    Path("src") / "data" / "session_questions.json",
+}
+
+
+def _tmp_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = _tmp_path(path)
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return path
+
+
+def atomic_write_text(path: Path, text: str, encoding: str = "utf-8") -> Path:
+    return atomic_write_bytes(path, text.encode(encoding))
+
+
+def atomic_copy(src: Path, dest: Path) -> Path:
+    """shutil.copy2 that replaces dest in one step."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = _tmp_path(dest)
+    try:
+        shutil.copy2(src, tmp_path)
+        os.replace(tmp_path, dest)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return dest
+
+
+def _default_input_path() -> Optional[Path]:
+    env_value = os.environ.get("SLIDES_PAYLOAD_PATH")
+    if env_value:
+        return Path(env_value)
+    for candidate in DEFAULT_SLIDES_PATHS:
+        if candidate.exists():
+            return candidate
+    return None
+
+
+@dataclass(frozen=True)
+class SessionWorkspace:
+    name: str
+    output_dir: Path
+    data_dir: Path
+    # Remotion project the session publishes into and renders from.
+    frontend_dir: Path
+    # Authored slides payload (input.txt); None if there is none.
+    input_path: Optional[Path]
+    manifest_path: Path
+    session_path: Path
+
+    @classmethod
+    def default(cls) -> "SessionWorkspace":
+        """The shared single-session layout (honours SLIDES_PAYLOAD_PATH, NARRATION_MANIFEST_PATH, SESSION_JSON_PATH)."""
+        output_dir = BACKEND_DIR / "output"
+        data_dir = BACKEND_DIR / "data"
+        return cls(
+            name="default",
+            output_dir=output_dir,
+            data_dir=data_dir,
+            frontend_dir=FRONTEND_DIR,
+            input_path=_default_input_path(),
+            manifest_path=Path(os.environ.get("NARRATION_MANIFEST_PATH", output_dir / "narration_manifest.json")),
+            session_path=Path(os.environ.get("SESSION_JSON_PATH", data_dir / "session_questions.json")),
+        )
+
+    @classmethod
+    def for_session(
+        cls,
+        session_id: str,
+        input_path: Optional[Path] = None,
+        root: Optional[Path] = None,
+    ) -> "SessionWorkspace":
+        """
+        An isolated workspace under root (default backend/workspaces). Its
+        input is <workspace>/input.txt; an input_path elsewhere is copied
+        there by ensure(), so later runs only need the session id.
+        """
+        if not _SESSION_ID.match(session_id):
+            raise ValueError(f"Invalid session id '{session_id}' (letters, digits, '.', '_' and '-' only)")
+        base = (root or WORKSPACES_DIR) / session_id
+        return cls(
+            name=session_id,
+            output_dir=base / "output",
+            data_dir=base / "data",
+            frontend_dir=base / "app",
+            input_path=Path(input_path) if input_path else base / "input.txt",
+            manifest_path=base / "output" / "narration_manifest.json",
+            session_path=base / "data" / "session_questions.json",
+        )
+
+    @property
+    def isolated(self) -> bool:
+        return self.frontend_dir != FRONTEND_DIR
+
+    @property
+    def audio_dir(self) -> Path:
+        return self.output_dir / "audio"
+
+    @property
+    def timings_dir(self) -> Path:
+        return self.output_dir / "timings"
+
+    @property
+    def choreography_dir(self) -> Path:
+        return self.output_dir / "choreography"
+
+    @property
+    def word_tables_dir(self) -> Path:
+        return self.output_dir / "word_tables"
+
+    @property
+    def build_dir(self) -> Path:
+        """Build bookkeeping (fingerprints); never published."""
+        return self.output_dir / ".build"
+
+    @property
+    def frontend_data_dir(self) -> Path:
+        return self.frontend_dir / "src" / "data"
+
+    @property
+    def frontend_audio_dir(self) -> Path:
+        return self.frontend_dir / "public" / "audio"
+
+    @property
+    def renders_dir(self) -> Path:
+        return self.frontend_dir / "renders"
+
+    def ensure(self) -> "SessionWorkspace":
+        """
+        Create the workspace directories; for an isolated workspace also stage
+        the private app copy and import the input. Returns the workspace as
+        it should be used from then on.
+        """
+        for directory in (self.output_dir, self.data_dir, self.frontend_data_dir, self.frontend_audio_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+        if not self.isolated:
+            return self
+        stage_frontend(self)
+        local_input = self.output_dir.parent / "input.txt"
+        if self.input_path and self.input_path.exists() and self.input_path.resolve() != local_input.resolve():
+            if not local_input.exists() or local_input.read_bytes() != self.input_path.read_bytes():
+                atomic_copy(self.input_path, local_input)
+            return replace(self, input_path=local_input)
+        return self
+
+
+def stage_frontend(workspace: SessionWorkspace, source: Path = FRONTEND_DIR) -> Path:
+    """
+    Mirror the Remotion project into workspace.frontend_dir, minus build
+    outputs and generated data; node_modules is linked, not copied. Files
+    already up to date (same size and mtime) are left alone, so re-staging
+    is cheap.
+    """
+    target = workspace.frontend_dir
+
+    def ignore(directory: str, names: list) -> set:
+        relative = Path(directory).relative_to(source)
+        skipped = set()
+        for name in names:
+            if relative / name in _FRONTEND_GENERATED or (relative == Path(".") and name in _FRONTEND_SKIP):
+                skipped.add(name)
+        return skipped
+
+    def copy_if_changed(src: str, dest: str) -> str:
+        src_stat = os.stat(src)
+        try:
+            dest_stat = os.stat(dest)
+            if dest_stat.st_size == src_stat.st_size and int(dest_stat.st_mtime) == int(src_stat.st_mtime):
+                return dest
+        except FileNotFoundError:
+            pass
+        return str(atomic_copy(Path(src), Path(dest)))
+
+    shutil.copytree(source, target, ignore=ignore, copy_function=copy_if_changed, dirs_exist_ok=True)
+    node_modules = source / "node_modules"
+    link = target / "node_modules"
+    if node_modules.exists() and not link.exists():
+        link.symlink_to(node_modules, target_is_directory=True)
+    return target
+
+
+def add_workspace_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--session",
+        default=None,
+        help="Work in the isolated workspace backend/workspaces/<session> instead of the shared paths",
+    )
+    parser.add_argument(
+        "--input",
+        type=Path,
+        default=None,
+        help="Authored slides payload for --session (default: <workspace>/input.txt)",
+    )
+
+
+def workspace_from_args(args: argparse.Namespace) -> SessionWorkspace:
+    if args.session:
+        return SessionWorkspace.for_session(args.session, input_path=args.input).ensure()
+    if args.input:
+        raise SystemExit("--input needs --session (the shared workspace reads SLIDES_PAYLOAD_PATH / input.txt)")
+    return SessionWorkspace.default()
@@ -4,18 +4,46 @@ backend.tts.azure_tts
 Wrapper around the existing azure_synthesize_audio helpers to:
  - Keep canonical voice + prosody settings
  - Provide synthesize_with_timings() returning duration + per-word timings
+ - Wait for the final word boundary via an event barrier (no fixed sleep)
+ - Reuse warm, pre-connected synthesizers from a process-wide pool
+ - Batch a whole session into one request split on SSML bookmarks
+ - Optionally stream audio to disk through a push stream as the SDK produces it
+ - Expose all of the above as AzureTTSBackend (see backend.tts.backends)
 """
 
 from __future__ import annotations
 
+import io
 import os
+import re
 import sys
+import threading
+import time
+import wave
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from dotenv import load_dotenv
 import azure.cognitiveservices.speech as speechsdk
 
+from backend.tts.base import (
+    DEFAULT_STYLE,
+    TTSBackend,
+    TTSError,
+    TTSThrottledError,
+    TTSTransientError,
+)
+from backend.tts.batch_tts import (
+    BatchItem,
+    build_batch_ssml,
+    clip_mark,
+    clip_windows,
+    export_pcm_clips,
+    group_batch_items,
+    split_word_timings,
+)
+from backend.tts.synthesizer_pool import SynthesizerPool
+
 load_dotenv()
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -36,28 +64,47 @@ if str(VIDEO_APP_DIR) not in sys.path:
 load_dotenv(PROJECT_ROOT / ".env", override=True)
 
 VOICE_NAME = "en-IN-ArjunNeural"
-DEFAULT_STYLE = {
-    "style": "friendly",
-    "rate": "+0%",
-    "pitch": "+0%",
-    "role_type": "mentor",
-}
+OUTPUT_FORMAT = "Audio24Khz160KBitRateMonoMp3"
+
+# Upper bound on how long we wait for completion/word-boundary callbacks after .get()
+DRAIN_TIMEOUT_SEC = float(os.environ.get("AZURE_TTS_DRAIN_TIMEOUT_SEC", "5"))
+
+# Write audio to disk chunk-by-chunk during synthesis instead of from result.audio_data
+STREAM_AUDIO = os.environ.get("AZURE_TTS_STREAM", "0").lower() in ("1", "true", "yes")
 
+# Batch mode requests raw PCM so clips can be cut sample-exactly, then re-encodes to MP3
+BATCH_OUTPUT_FORMAT = "Riff24Khz16BitMonoPcm"
+BATCH_GAP_MS = int(os.environ.get("AZURE_TTS_BATCH_GAP_MS", "400"))
+BATCH_MAX_CHARS = int(os.environ.get("AZURE_TTS_BATCH_MAX_CHARS", "6000"))
 
-def _speech_config() -> speechsdk.SpeechConfig:
+
+def _speech_config(voice: str = VOICE_NAME, output_format: str = OUTPUT_FORMAT) -> speechsdk.SpeechConfig:
     key = os.environ.get("AZURE_SPEECH_KEY")
     region = os.environ.get("AZURE_SPEECH_REGION", "eastus")
     if not key:
         raise ValueError("AZURE_SPEECH_KEY missing in environment/.env")
 
     config = speechsdk.SpeechConfig(subscription=key, region=region)
-    config.speech_synthesis_voice_name = VOICE_NAME
+    config.speech_synthesis_voice_name = voice
     config.set_speech_synthesis_output_format(
-        speechsdk.SpeechSynthesisOutputFormat.Audio24Khz160KBitRateMonoMp3
+        getattr(speechsdk.SpeechSynthesisOutputFormat, output_format)
     )
     return config
 
 
+_POOL = SynthesizerPool(_speech_config)
+
+
+def get_synthesizer_pool() -> SynthesizerPool:
+    """Process-wide pool; long-running workers keep it warm across sessions."""
+    return _POOL
+
+
+def warm_synthesizers(count: int, stream: bool | None = None) -> int:
+    """Pre-connect `count` synthesizers for the canonical voice/format (streaming ones with `stream`)."""
+    return _POOL.warm(count, VOICE_NAME, OUTPUT_FORMAT, streaming=STREAM_AUDIO if stream is None else stream)
+
+
 def _prepare_ssml(text: str, voice_style: Dict[str, str]) -> str:
     """
     Prepare SIMPLIFIED SSML for better word boundary capture.
@@ -84,30 +131,149 @@ def _prepare_ssml(text: str, voice_style: Dict[str, str]) -> str:
     return ssml
 
 
-def synthesize_with_timings(text: str, output_path: Path, voice_style: Dict[str, str] | None = None) -> Dict:
+# Markup that is never spoken; masked out (offsets kept) when locating the last spoken word
+_SSML_MARKUP = re.compile(r"<[^>]*>|&#?\w+;")
+_LAST_WORD_CHAR = re.compile(r"\w\W*$")
+
+
+def _spoken_text_end(text: str, ssml: bool = False) -> int:
+    """
+    Offset just past the last word character of `text` (tags and entities
+    skipped for SSML), i.e. where the final word boundary's
+    text_offset + word_length lands. 0 if there is nothing to speak.
+    """
+    if ssml:
+        text = _SSML_MARKUP.sub(lambda match: " " * len(match.group()), text)
+    match = _LAST_WORD_CHAR.search(text)
+    return match.start() + 1 if match else 0
+
+
+class _SynthesisBarrier:
+    """
+    Releases once the synthesizer has signalled completed/canceled, no tracked
+    callback is still running and, for a completed synthesis, a word boundary
+    has reached `text_end` (the end of the last spoken word). Completion can be
+    dispatched while boundary events are still queued, so the coverage check
+    is what makes the final boundary part of the result; the caller's timeout
+    still bounds the wait if the service never reports that word.
+    """
+
+    def __init__(self, text_end: int = 0) -> None:
+        self._cond = threading.Condition()
+        self._text_end = text_end
+        self._covered = 0
+        self._finished = False
+        self._canceled = False
+        self._in_flight = 0
+
+    def boundary_started(self) -> None:
+        with self._cond:
+            self._in_flight += 1
+
+    def boundary_finished(self) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def boundary_seen(self, text_offset: int, word_length: int) -> None:
+        if text_offset < 0:
+            return
+        with self._cond:
+            self._covered = max(self._covered, text_offset + word_length)
+            self._cond.notify_all()
+
+    def finish(self, evt=None) -> None:
+        result = getattr(evt, "result", None)
+        with self._cond:
+            self._finished = True
+            self._canceled = result is not None and result.reason == speechsdk.ResultReason.Canceled
+            self._cond.notify_all()
+
+    def _released(self) -> bool:
+        if not self._finished or self._in_flight:
+            return False
+        return self._canceled or self._covered >= self._text_end
+
+    def wait(self, timeout: float) -> bool:
+        with self._cond:
+            return self._cond.wait_for(self._released, timeout)
+
+
+def synthesize_with_timings(
+    text: str,
+    output_path: Path,
+    voice_style: Dict[str, str] | None = None,
+    stream: bool | None = None,
+) -> Dict:
     """
     Synthesize narration text and capture per-word timings.
 
+    With `stream` (default: AZURE_TTS_STREAM) the synthesizer writes to a push
+    audio stream and each chunk is appended to output_path as it arrives, so the
+    file can be consumed while the clip is still being produced and neither the
+    SDK result nor Python ever holds the whole clip. The timing payload is only returned once the file
+    is complete; a failed clip leaves no partial file behind.
+
     Returns:
         {
             "audio_file": "<absolute path>",
             "duration_sec": float,
-            "words": [{"text": str, "start_sec": float, "end_sec": float, "duration_sec": float}, ...]
+            "words": [{"text": str, "start_sec": float, "end_sec": float, "duration_sec": float}, ...],
+            "metrics": {"connect_sec": float, "synthesis_sec": float, "callback_drain_sec": float}
         }
+
+    `metrics` is diagnostic only; callers strip it before persisting timings.
     """
     if voice_style is None:
         voice_style = DEFAULT_STYLE
 
+    if stream is None:
+        stream = STREAM_AUDIO
+
     ssml = _prepare_ssml(text, voice_style)
-    speech_config = _speech_config()
-    
-    # CRITICAL: Use audio_config=None to capture word boundaries
-    # Word boundary events don't fire when audio is saved to file!
-    synthesizer = speechsdk.SpeechSynthesizer(speech_config, audio_config=None)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if stream:
+        result, word_boundaries, metrics = _speak_streaming(text, output_path)
+    else:
+        # Use plain TEXT instead of SSML - word boundaries work better
+        result, word_boundaries, metrics = _speak(
+            lambda synthesizer: synthesizer.speak_text_async(text).get(),
+            OUTPUT_FORMAT,
+            text_end=_spoken_text_end(text),
+        )
+
+        # Save audio data to file manually
+        with open(output_path, 'wb') as audio_file:
+            audio_file.write(result.audio_data)
 
+    return {
+        "audio_file": str(output_path),
+        "duration_sec": result.audio_duration.total_seconds(),
+        "words": word_boundaries,
+        "metrics": metrics,
+    }
+
+
+def _speak(
+    speak: Callable[[speechsdk.SpeechSynthesizer], Any],
+    output_format: str,
+    on_bookmark: Callable[[Any], None] | None = None,
+    on_audio: Callable[[bytes], None] | None = None,
+    text_end: int = 0,
+) -> Tuple[Any, List[Dict[str, float]], Dict[str, float]]:
+    """
+    Run one request on a pooled synthesizer; returns (result, word boundaries,
+    metrics). `text_end` is where the final word boundary ends in the request
+    text (see _spoken_text_end); the drain waits until it has been seen. With
+    `on_audio` a push-stream synthesizer is leased and the audio is delivered
+    to it chunk by chunk instead of in result.audio_data.
+    """
     word_boundaries: List[Dict[str, float]] = []
+    barrier = _SynthesisBarrier(text_end)
 
     def _collect(evt: speechsdk.SpeechSynthesisWordBoundaryEventArgs):
+        barrier.boundary_started()
         try:
             start = evt.audio_offset / 10_000_000  # convert 100ns to seconds
             # duration is a timedelta, convert to seconds
@@ -119,39 +285,189 @@ def synthesize_with_timings(text: str, output_path: Path, voice_style: Dict[str,
                 "end_sec": end,
                 "duration_sec": duration_sec
             })
+            barrier.boundary_seen(getattr(evt, "text_offset", -1), getattr(evt, "word_length", 0))
         except Exception as e:
             print(f"❌ ERROR in callback: {e}")  # DEBUG
+        finally:
+            barrier.boundary_finished()
 
-    # Connect BEFORE synthesis
-    synthesizer.synthesis_word_boundary.connect(_collect)
+    def _tracked(handler: Callable[[Any], None] | None) -> Callable[[Any], None] | None:
+        # Count extra callbacks against the barrier too, so they finish before we return
+        if handler is None:
+            return None
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Use plain TEXT instead of SSML - word boundaries work better
-    result = synthesizer.speak_text_async(text).get()
-    
-    # CRITICAL: Wait a moment for word boundary events to finish processing
-    # Events fire asynchronously even after .get() returns!
-    import time
-    time.sleep(0.5)
-    
-    # Save audio data to file manually
-    if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-        with open(output_path, 'wb') as audio_file:
-            audio_file.write(result.audio_data)
+        def _run(evt) -> None:
+            barrier.boundary_started()
+            try:
+                handler(evt)
+            finally:
+                barrier.boundary_finished()
+
+        return _run
+
+    # CRITICAL: pooled synthesizers use audio_config=None (or a push stream) to capture
+    # word boundaries. Word boundary events don't fire when audio is saved to file!
+    with _POOL.acquire(VOICE_NAME, output_format, streaming=on_audio is not None) as lease:
+        # Bind BEFORE synthesis
+        lease.synth.bind(
+            on_word_boundary=_collect,
+            on_done=barrier.finish,
+            on_bookmark=_tracked(on_bookmark),
+            on_audio=_tracked(on_audio),
+        )
+
+        synth_start = time.perf_counter()
+        result = speak(lease.synth.synthesizer)
+        synthesis_sec = time.perf_counter() - synth_start
+
+        # CRITICAL: word boundary events fire asynchronously even after .get() returns,
+        # so block until the completed/canceled signal, every callback has run and the
+        # boundary for the last word of the text has arrived.
+        drain_start = time.perf_counter()
+        if not barrier.wait(DRAIN_TIMEOUT_SEC):
+            print(f"  ⚠️  Word-boundary callbacks did not drain within {DRAIN_TIMEOUT_SEC}s; timings may be partial")
+        drain_sec = time.perf_counter() - drain_start
+
+        if result.reason != speechsdk.ResultReason.SynthesizingAudioCompleted:
+            # Don't hand a possibly broken connection to the next clip
+            lease.healthy = False
 
     if result.reason != speechsdk.ResultReason.SynthesizingAudioCompleted:
-        details = ""
-        if result.reason == speechsdk.ResultReason.Canceled:
-            details = f" ({result.cancellation_details.reason}: {result.cancellation_details.error_details})"
-        raise RuntimeError(f"Azure TTS failed{details}")
+        raise _failure_for(result)
 
-    duration_sec = result.audio_duration.total_seconds()
-    print(f"  → {len(word_boundaries)} words captured")
-    
-    return {
-        "audio_file": str(output_path),
-        "duration_sec": duration_sec,
-        "words": word_boundaries,
+    metrics = {
+        "connect_sec": lease.connect_sec,
+        "synthesis_sec": synthesis_sec,
+        "callback_drain_sec": drain_sec,
     }
+    return result, word_boundaries, metrics
+
+
+# CancellationErrorCode names worth retrying; anything else (auth, bad request) is fatal
+_THROTTLE_CODES = {"TooManyRequests"}
+_TRANSIENT_CODES = {"ConnectionFailure", "ServiceTimeout", "ServiceUnavailable", "ServiceError"}
+
+
+def _failure_for(result) -> TTSError:
+    """Map an unsuccessful result to the TTSError subtype the scheduler retries on."""
+    if result.reason != speechsdk.ResultReason.Canceled:
+        return TTSError(f"Azure TTS failed ({result.reason})")
+    cancellation = result.cancellation_details
+    code = getattr(getattr(cancellation, "error_code", None), "name", "")
+    message = f"Azure TTS failed ({cancellation.reason}: {cancellation.error_details})"
+    if code in _THROTTLE_CODES or "429" in (cancellation.error_details or ""):
+        return TTSThrottledError(message)
+    if code in _TRANSIENT_CODES:
+        return TTSTransientError(message)
+    return TTSError(message)
+
+
+def _speak_streaming(text: str, output_path: Path) -> Tuple[Any, List[Dict[str, float]], Dict[str, float]]:
+    written = 0
+
+    with open(output_path, "wb") as audio_file:
+        def _on_audio(chunk: bytes) -> None:
+            nonlocal written
+            if chunk:
+                audio_file.write(chunk)
+                audio_file.flush()
+                written += len(chunk)
+
+        try:
+            result, word_boundaries, metrics = _speak(
+                lambda synthesizer: synthesizer.speak_text_async(text).get(),
+                OUTPUT_FORMAT,
+                on_audio=_on_audio,
+                text_end=_spoken_text_end(text),
+            )
+        except BaseException:
+            audio_file.close()
+            output_path.unlink(missing_ok=True)
+            raise
+
+    if not written:
+        # Some SDK builds only deliver audio on the final result
+        output_path.write_bytes(result.audio_data)
+    return result, word_boundaries, metrics
+
+
+def _synthesize_batch_group(items: Sequence[BatchItem]) -> List[Dict]:
+    ssml = build_batch_ssml([text for text, _, _ in items], VOICE_NAME, BATCH_GAP_MS)
+    marks: Dict[str, float] = {}
+
+    def _on_bookmark(evt) -> None:
+        marks[evt.text] = evt.audio_offset / 10_000_000
+
+    result, words, metrics = _speak(
+        lambda synthesizer: synthesizer.speak_ssml_async(ssml).get(),
+        BATCH_OUTPUT_FORMAT,
+        on_bookmark=_on_bookmark,
+        text_end=_spoken_text_end(ssml, ssml=True),
+    )
+
+    missing = [clip_mark(i) for i in range(len(items)) if clip_mark(i) not in marks]
+    if missing:
+        raise TTSError(f"Azure TTS batch is missing clip bookmarks: {', '.join(missing)}")
+
+    with wave.open(io.BytesIO(result.audio_data), "rb") as wav:
+        frame_rate = wav.getframerate()
+        sample_width = wav.getsampwidth()
+        channels = wav.getnchannels()
+        pcm = wav.readframes(wav.getnframes())
+    total_sec = len(pcm) / (frame_rate * sample_width * channels)
+
+    windows = clip_windows([marks[clip_mark(i)] for i in range(len(items))], total_sec)
+    per_clip_words = split_word_timings(words, windows)
+    output_paths = [path for _, path, _ in items]
+    durations = export_pcm_clips(pcm, frame_rate, sample_width, channels, windows, output_paths)
+
+    # Request-level costs are shared by every clip in the batch
+    shared = {key: value / len(items) for key, value in metrics.items()}
+    return [
+        {
+            "audio_file": str(path),
+            "duration_sec": duration,
+            "words": clip_words,
+            "metrics": shared,
+        }
+        for path, duration, clip_words in zip(output_paths, durations, per_clip_words)
+    ]
+
+
+def synthesize_batch_with_timings(items: Sequence[BatchItem]) -> List[Dict]:
+    """
+    Synthesize many clips in as few requests as possible (bookmark-delimited
+    SSML, capped at BATCH_MAX_CHARS per request). Returns one payload per item,
+    in order, shaped exactly like synthesize_with_timings().
+    """
+    results: List[Dict] = []
+    for group in group_batch_items(items, BATCH_MAX_CHARS):
+        results.extend(_synthesize_batch_group(group))
+    return results
+
+
+class AzureTTSBackend(TTSBackend):
+    name = "azure"
+    voice = VOICE_NAME
+    output_format = OUTPUT_FORMAT
+
+    def __init__(self, stream: bool | None = None) -> None:
+        self.stream = STREAM_AUDIO if stream is None else stream
+
+    def synthesize(self, text: str, output_path: Path, voice_style: Dict[str, str] | None = None) -> Dict:
+        return synthesize_with_timings(text, output_path, voice_style, stream=self.stream)
+
+    def synthesize_batch(self, items: Sequence[BatchItem]) -> List[Dict]:
+        return synthesize_batch_with_timings(items)
+
+    def warm(self, count: int) -> int:
+        return warm_synthesizers(count, stream=self.stream)
 
+    def stats_summary(self) -> Optional[str]:
+        stats = _POOL.stats
+        if not stats.created:
+            return None
+        return (
+            f"Synthesizer pool: {stats.created} connected ({stats.connect_sec_total:.2f}s total), "
+            f"{stats.reused} reused, {stats.reconnected} reconnected"
+        )
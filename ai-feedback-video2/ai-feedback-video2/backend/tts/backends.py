@@ -0,0 +1,65 @@
+"""
+backend.tts.backends
+--------------------
+Backend registry and the backend-neutral synthesize_with_timings() entry point.
+Select with TTS_BACKEND=azure|fake (default azure); the Azure SDK is only
+imported when the Azure backend is actually requested.
+
+Fake backend knobs: FAKE_TTS_LATENCY_MS, FAKE_TTS_JITTER_MS,
+FAKE_TTS_PER_CHAR_MS, FAKE_TTS_ERROR_RATE, FAKE_TTS_THROTTLE_RATE, FAKE_TTS_SEED.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict
+
+from backend.tts.base import TTSBackend
+
+DEFAULT_BACKEND = "azure"
+
+
+def _azure_backend() -> TTSBackend:
+    from backend.tts.azure_tts import AzureTTSBackend
+
+    return AzureTTSBackend()
+
+
+def _fake_backend() -> TTSBackend:
+    from backend.tts.fake_tts import FakeTTSBackend
+
+    return FakeTTSBackend(
+        latency_sec=float(os.environ.get("FAKE_TTS_LATENCY_MS", "0")) / 1000,
+        jitter_sec=float(os.environ.get("FAKE_TTS_JITTER_MS", "0")) / 1000,
+        per_char_sec=float(os.environ.get("FAKE_TTS_PER_CHAR_MS", "0")) / 1000,
+        error_rate=float(os.environ.get("FAKE_TTS_ERROR_RATE", "0")),
+        throttle_rate=float(os.environ.get("FAKE_TTS_THROTTLE_RATE", "0")),
+        seed=int(os.environ.get("FAKE_TTS_SEED", "0")),
+    )
+
+
+BACKEND_FACTORIES: Dict[str, Callable[[], TTSBackend]] = {
+    "azure": _azure_backend,
+    "fake": _fake_backend,
+}
+
+_instances: Dict[str, TTSBackend] = {}
+_lock = threading.Lock()
+
+
+def get_backend(name: str | None = None) -> TTSBackend:
+    """Shared backend instance by name (defaults to TTS_BACKEND, then azure)."""
+    name = (name or os.environ.get("TTS_BACKEND") or DEFAULT_BACKEND).lower()
+    if name not in BACKEND_FACTORIES:
+        raise ValueError(f"Unknown TTS backend '{name}' (expected one of: {', '.join(BACKEND_FACTORIES)})")
+    with _lock:
+        if name not in _instances:
+            _instances[name] = BACKEND_FACTORIES[name]()
+        return _instances[name]
+
+
+def synthesize_with_timings(text: str, output_path: Path, voice_style: Dict[str, str] | None = None) -> Dict:
+    """Synthesize via the configured backend; see TTSBackend for the return shape."""
+    return get_backend().synthesize(text, output_path, voice_style)
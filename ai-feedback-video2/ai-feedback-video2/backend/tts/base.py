@@ -0,0 +1,68 @@
+"""
+backend.tts.base
+----------------
+Backend-neutral pieces of the TTS stage:
+ - TTSBackend: the interface behind synthesize_with_timings()
+ - Error types that let callers tell retryable failures from fatal ones
+ - Canonical default prosody shared by every backend
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_STYLE = {
+    "style": "friendly",
+    "rate": "+0%",
+    "pitch": "+0%",
+    "role_type": "mentor",
+}
+
+
+class TTSError(RuntimeError):
+    """Synthesis failed and retrying the same request will not help."""
+
+
+class TTSTransientError(TTSError):
+    """Synthesis failed for a reason that may clear up on retry (timeouts, dropped connections)."""
+
+
+class TTSThrottledError(TTSTransientError):
+    """The service rejected the request for rate-limit reasons (HTTP 429)."""
+
+
+class TTSBackend(ABC):
+    """
+    A speech synthesizer that writes audio to `output_path` and returns:
+        {
+            "audio_file": "<absolute path>",
+            "duration_sec": float,
+            "words": [{"text", "start_sec", "end_sec", "duration_sec"}, ...],
+            "metrics": {...}   # optional, diagnostic only
+        }
+    """
+
+    name: str = "base"
+    voice: str = ""
+    output_format: str = ""
+
+    @abstractmethod
+    def synthesize(self, text: str, output_path: Path, voice_style: Dict[str, str] | None = None) -> Dict:
+        ...
+
+    def synthesize_batch(self, items: Sequence[Tuple[str, Path, Dict[str, str]]]) -> List[Dict]:
+        """
+        Synthesize (text, output_path, voice_style) items, returning one payload
+        per item in order. Backends that can share a request override this.
+        """
+        return [self.synthesize(text, path, style) for text, path, style in items]
+
+    def warm(self, count: int) -> int:
+        """Pre-open up to `count` connections; backends without connections do nothing."""
+        return 0
+
+    def stats_summary(self) -> Optional[str]:
+        """One-line backend-specific stats for the end-of-run report, if any."""
+        return None
@@ -0,0 +1,108 @@
+"""
+backend.tts.batch_tts
+---------------------
+Helpers for whole-session batch synthesis: one TTS request covers every clip,
+with an SSML <bookmark/> at the start of each clip. The returned audio and word
+timings are then split back into the per-clip MP3 + timing payloads that
+calculate_choreography.py and publish_assets.py already expect.
+"""
+
+from __future__ import annotations
+
+from html import escape
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+# (text, output_path, voice_style)
+BatchItem = Tuple[str, Path, Dict[str, str]]
+
+CLIP_MARK_PREFIX = "clip_"
+
+
+def clip_mark(index: int) -> str:
+    return f"{CLIP_MARK_PREFIX}{index}"
+
+
+def group_batch_items(items: Sequence[BatchItem], max_chars: int) -> List[List[BatchItem]]:
+    """Pack clips, in order, into requests of at most max_chars of text (one clip minimum)."""
+    groups: List[List[BatchItem]] = []
+    current: List[BatchItem] = []
+    size = 0
+    for item in items:
+        if current and size + len(item[0]) > max_chars:
+            groups.append(current)
+            current, size = [], 0
+        current.append(item)
+        size += len(item[0])
+    if current:
+        groups.append(current)
+    return groups
+
+
+def build_batch_ssml(texts: Sequence[str], voice: str, gap_ms: int) -> str:
+    """
+    Single-voice SSML with a bookmark at the start of each clip and a pause
+    between clips (the pause becomes the previous clip's tail). Prosody is left
+    at the voice default to match the per-clip plain-text requests.
+    """
+    parts: List[str] = []
+    for index, text in enumerate(texts):
+        if index:
+            parts.append(f"<break time='{gap_ms}ms'/>")
+        parts.append(f"<bookmark mark='{clip_mark(index)}'/>{escape(text, quote=False)}")
+    body = " ".join(parts)
+    return (
+        "<speak version='1.0' xmlns='http://www.w3.org/2001/10/synthesis' "
+        "xmlns:mstts='https://www.w3.org/2001/mstts' xml:lang='en-IN'>"
+        f"<voice name='{voice}'>{body}</voice></speak>"
+    )
+
+
+def clip_windows(clip_starts: Sequence[float], total_duration: float) -> List[Tuple[float, float]]:
+    """[start, end) of each clip in the batch audio, in seconds."""
+    ends = list(clip_starts[1:]) + [total_duration]
+    return [(start, max(end, start)) for start, end in zip(clip_starts, ends)]
+
+
+def split_word_timings(
+    words: Sequence[Dict[str, float]],
+    windows: Sequence[Tuple[float, float]],
+) -> List[List[Dict[str, float]]]:
+    """Assign each word to the clip window it starts in and rebase it to that clip's t=0."""
+    per_clip: List[List[Dict[str, float]]] = [[] for _ in windows]
+    clip = 0
+    for word in sorted(words, key=lambda w: w["start_sec"]):
+        while clip + 1 < len(windows) and word["start_sec"] >= windows[clip + 1][0]:
+            clip += 1
+        offset = windows[clip][0]
+        per_clip[clip].append({
+            **word,
+            "start_sec": max(word["start_sec"] - offset, 0.0),
+            "end_sec": max(word["end_sec"] - offset, 0.0),
+        })
+    return per_clip
+
+
+def export_pcm_clips(
+    pcm: bytes,
+    frame_rate: int,
+    sample_width: int,
+    channels: int,
+    windows: Sequence[Tuple[float, float]],
+    output_paths: Sequence[Path],
+    bitrate: str = "160k",
+) -> List[float]:
+    """Cut raw PCM at sample-exact offsets and encode each clip to MP3. Returns clip durations."""
+    from pydub import AudioSegment  # needs ffmpeg on PATH; only batch mode requires it
+
+    audio = AudioSegment(data=pcm, sample_width=sample_width, frame_rate=frame_rate, channels=channels)
+    bytes_per_frame = sample_width * channels
+    durations: List[float] = []
+    for (start, end), path in zip(windows, output_paths):
+        first = int(round(start * frame_rate))
+        last = int(round(end * frame_rate))
+        clip = audio._spawn(pcm[first * bytes_per_frame:last * bytes_per_frame])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        clip.export(path, format="mp3", bitrate=bitrate)
+        durations.append((last - first) / frame_rate)
+    return durations
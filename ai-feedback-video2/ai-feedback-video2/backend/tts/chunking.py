@@ -0,0 +1,124 @@
+"""
+backend.tts.chunking
+--------------------
+Sentence-level chunking for long narrations:
+ - Split narration text at sentence boundaries
+ - Synthesize the chunks concurrently (each one is an ordinary synthesize call,
+   so the TTS cache and scheduler apply per sentence)
+ - Concatenate the MP3 frames and offset-stitch the word timings, producing the
+   same payload shape as a single-request clip
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from pathlib import Path
+from typing import Callable, Dict, List
+
+SynthesizeFn = Callable[[str, Path, Dict[str, str]], Dict]
+
+SENTENCE_END = re.compile(r"(?<=[.!?…])[\"'”’)\]]*\s+(?=\S)")
+DEFAULT_THRESHOLD_CHARS = int(os.environ.get("TTS_CHUNK_THRESHOLD_CHARS", "600"))
+DEFAULT_MIN_CHARS = int(os.environ.get("TTS_CHUNK_MIN_CHARS", "40"))
+DEFAULT_CHUNK_WORKERS = int(os.environ.get("TTS_CHUNK_WORKERS", "4"))
+
+
+def split_sentences(text: str, min_chars: int = DEFAULT_MIN_CHARS) -> List[str]:
+    """
+    One chunk per sentence, except that sentences shorter than min_chars are
+    merged into the following one. Merging is local, so editing one sentence
+    only changes its own chunk (and the cache key of nothing else).
+    """
+    sentences = [s.strip() for s in SENTENCE_END.split(text.strip()) if s.strip()]
+    chunks: List[str] = []
+    pending = ""
+    for sentence in sentences:
+        pending = f"{pending} {sentence}".strip()
+        if len(pending) >= min_chars:
+            chunks.append(pending)
+            pending = ""
+    if pending:
+        if chunks:
+            chunks[-1] = f"{chunks[-1]} {pending}"
+        else:
+            chunks.append(pending)
+    return chunks
+
+
+def stitch_payloads(parts: List[Dict], output_path: Path) -> Dict:
+    """Shift each chunk's words by the running audio duration and merge metrics."""
+    words: List[Dict[str, float]] = []
+    metrics: Dict[str, float] = {}
+    offset = 0.0
+    for part in parts:
+        for word in part.get("words", []):
+            words.append({
+                **word,
+                "start_sec": word["start_sec"] + offset,
+                "end_sec": word["end_sec"] + offset,
+            })
+        offset += part["duration_sec"]
+        for key, value in (part.get("metrics") or {}).items():
+            metrics[key] = metrics.get(key, 0.0) + value
+    payload = {"audio_file": str(output_path), "duration_sec": offset, "words": words}
+    if metrics:
+        payload["metrics"] = metrics
+    return payload
+
+
+class ChunkedSynthesizer:
+    """
+    synthesize()-compatible wrapper. Texts at or under threshold_chars go
+    straight through; longer ones are split, synthesized in parallel on a
+    dedicated pool (so it nests safely under the manifest worker pool) and
+    joined. MP3 frames concatenate cleanly; each chunk keeps its own encoder
+    priming, so boundaries may drift by a few ms per sentence.
+    """
+
+    def __init__(
+        self,
+        synthesize: SynthesizeFn,
+        workers: int = DEFAULT_CHUNK_WORKERS,
+        threshold_chars: int = DEFAULT_THRESHOLD_CHARS,
+        min_chars: int = DEFAULT_MIN_CHARS,
+    ) -> None:
+        self._synthesize = synthesize
+        self.threshold_chars = threshold_chars
+        self.min_chars = min_chars
+        self._pool = ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix="tts-chunk")
+
+    def synthesize(self, text: str, output_path: Path, voice_style: Dict[str, str] | None = None) -> Dict:
+        chunks = split_sentences(text, self.min_chars) if len(text) > self.threshold_chars else [text]
+        if len(chunks) <= 1:
+            return self._synthesize(text, output_path, voice_style)
+
+        part_paths = [output_path.with_name(f"{output_path.stem}.part{i:03d}{output_path.suffix}") for i in range(len(chunks))]
+        futures: List[Future] = []
+        try:
+            futures = [
+                self._pool.submit(self._synthesize, chunk, path, voice_style)
+                for chunk, path in zip(chunks, part_paths)
+            ]
+            for future in as_completed(futures):
+                future.result()  # surface the first failure, whichever chunk it is
+            parts = [future.result() for future in futures]
+
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, "wb") as joined:
+                for path in part_paths:
+                    joined.write(path.read_bytes())
+        finally:
+            # On failure, drop chunks that have not started and let running ones finish,
+            # so no part file is (re)created after the cleanup below
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            for path in part_paths:
+                path.unlink(missing_ok=True)
+
+        return stitch_payloads(parts, output_path)
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
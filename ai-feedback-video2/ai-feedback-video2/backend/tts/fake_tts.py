@@ -0,0 +1,164 @@
+"""
+backend.tts.fake_tts
+--------------------
+Deterministic offline stand-in for Azure TTS, for CI and load tests:
+ - Writes valid (silent) MPEG-1 Layer III audio covering the narration
+ - Synthesizes per-word timings from token length and the voice_style rate
+ - Optional latency and error/throttle injection, reproducible from a seed
+ - Batch requests pay the round-trip latency once, like a bookmark-split batch
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from backend.tts.batch_tts import BatchItem
+from backend.tts.base import (
+    DEFAULT_STYLE,
+    TTSBackend,
+    TTSThrottledError,
+    TTSTransientError,
+)
+
+# MPEG-1 Layer III, 32 kbps, 32 kHz, mono, no CRC. All-zero side info and main
+# data decode as silence, so a run of these frames is a valid silent MP3.
+_MP3_FRAME_HEADER = bytes([0xFF, 0xFB, 0x18, 0xC0])
+_MP3_FRAME_BYTES = 144  # 144 * 32000 / 32000
+MP3_FRAME_SEC = 1152 / 32000
+_SILENT_FRAME = _MP3_FRAME_HEADER + bytes(_MP3_FRAME_BYTES - len(_MP3_FRAME_HEADER))
+
+TOKEN_PATTERN = re.compile(r"[\w'’-]+|[^\w\s]")
+CHARS_PER_SEC = 14.0
+MIN_WORD_SEC = 0.12
+PUNCT_PAUSE_SEC = 0.2
+LEAD_IN_SEC = 0.05
+TAIL_SEC = 0.3
+
+
+def silent_mp3(duration_sec: float) -> bytes:
+    frames = max(1, int(-(-duration_sec // MP3_FRAME_SEC)))  # ceil
+    return _SILENT_FRAME * frames
+
+
+def _rate_factor(voice_style: Dict[str, str]) -> float:
+    match = re.fullmatch(r"\s*([+-]?\d+(?:\.\d+)?)%\s*", str(voice_style.get("rate", "+0%")))
+    return max(0.25, 1.0 + float(match.group(1)) / 100) if match else 1.0
+
+
+def synthetic_word_timings(text: str, voice_style: Dict[str, str] | None = None) -> List[Dict[str, float]]:
+    """Word boundaries shaped like Azure's: punctuation arrives as its own short token."""
+    speed = CHARS_PER_SEC * _rate_factor({**DEFAULT_STYLE, **(voice_style or {})})
+    cursor = LEAD_IN_SEC
+    words: List[Dict[str, float]] = []
+    for token in TOKEN_PATTERN.findall(text):
+        if token[0].isalnum() or token[0] in "_'’":
+            duration = max(MIN_WORD_SEC, len(token) / speed)
+        else:
+            duration = PUNCT_PAUSE_SEC
+        words.append({
+            "text": token,
+            "start_sec": round(cursor, 4),
+            "end_sec": round(cursor + duration, 4),
+            "duration_sec": round(duration, 4),
+        })
+        cursor += duration
+    return words
+
+
+class FakeTTSBackend(TTSBackend):
+    """
+    latency_sec/jitter_sec simulate the service round trip and per_char_sec
+    the text-proportional generation time. error_rate and
+    throttle_rate inject TTSTransientError/TTSThrottledError; the decision for
+    a request depends only on (seed, text, attempt number), so runs replay
+    identically and retries can eventually succeed.
+    """
+
+    name = "fake"
+    voice = "fake-voice"
+    output_format = "Mpeg1Layer3-32Khz-32KBitRate-Mono-Silent"
+
+    def __init__(
+        self,
+        latency_sec: float = 0.0,
+        jitter_sec: float = 0.0,
+        per_char_sec: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.latency_sec = latency_sec
+        self.jitter_sec = jitter_sec
+        self.per_char_sec = per_char_sec
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.seed = seed
+        self.calls = 0
+        self.failures = 0
+        self._attempts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def _rng_for(self, text: str) -> random.Random:
+        with self._lock:
+            self.calls += 1
+            attempt = self._attempts[text]
+            self._attempts[text] += 1
+        digest = hashlib.sha256(f"{self.seed}:{attempt}:{text}".encode("utf-8")).digest()
+        return random.Random(int.from_bytes(digest[:8], "big"))
+
+    def _simulate_request(self, text: str) -> None:
+        """Sleep like a service round trip, then maybe raise an injected failure."""
+        rng = self._rng_for(text)
+        delay = self.latency_sec + self.per_char_sec * len(text)
+        if self.jitter_sec:
+            delay += rng.uniform(0, self.jitter_sec)
+        if delay:
+            time.sleep(delay)
+
+        roll = rng.random()
+        if roll < self.throttle_rate:
+            with self._lock:
+                self.failures += 1
+            raise TTSThrottledError("Fake TTS throttled (429 Too Many Requests)")
+        if roll < self.throttle_rate + self.error_rate:
+            with self._lock:
+                self.failures += 1
+            raise TTSTransientError("Fake TTS transient failure (connection reset)")
+
+    def _render(self, text: str, output_path: Path, voice_style: Dict[str, str] | None) -> Dict:
+        words = synthetic_word_timings(text, voice_style)
+        speech_end = words[-1]["end_sec"] if words else 0.0
+        audio = silent_mp3(speech_end + TAIL_SEC)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(audio)
+        return {
+            "audio_file": str(output_path),
+            "duration_sec": round(len(audio) // _MP3_FRAME_BYTES * MP3_FRAME_SEC, 4),
+            "words": words,
+        }
+
+    def synthesize(self, text: str, output_path: Path, voice_style: Dict[str, str] | None = None) -> Dict:
+        start = time.perf_counter()
+        self._simulate_request(text)
+        payload = self._render(text, output_path, voice_style)
+        payload["metrics"] = {"synthesis_sec": time.perf_counter() - start}
+        return payload
+
+    def synthesize_batch(self, items: Sequence[BatchItem]) -> List[Dict]:
+        start = time.perf_counter()
+        self._simulate_request("\n".join(text for text, _, _ in items))
+        payloads = [self._render(text, path, style) for text, path, style in items]
+        shared = {"synthesis_sec": (time.perf_counter() - start) / max(len(items), 1)}
+        for payload in payloads:
+            payload["metrics"] = dict(shared)
+        return payloads
+
+    def stats_summary(self) -> str:
+        return f"Fake TTS: {self.calls} calls, {self.failures} injected failures"
@@ -0,0 +1,170 @@
+"""
+backend.tts.scheduler
+---------------------
+Rate-limit-aware front door for a TTS backend:
+ - Token bucket caps requests per second across every thread using it
+ - Semaphore caps concurrent connections
+ - Jittered exponential backoff retries throttling (429) and transient errors
+ - Records queue wait (time spent waiting for a token/connection slot) and
+   backoff per request; retries are reported in the stats rather than printed
+   so concurrent workers don't scramble the ordered per-clip log
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple, TypeVar
+
+from backend.tts.base import TTSBackend, TTSThrottledError, TTSTransientError
+
+DEFAULT_RPS = float(os.environ.get("TTS_MAX_RPS", "10"))
+DEFAULT_MAX_CONNECTIONS = int(os.environ.get("TTS_MAX_CONNECTIONS", "8"))
+DEFAULT_MAX_RETRIES = int(os.environ.get("TTS_MAX_RETRIES", "5"))
+DEFAULT_BASE_DELAY_SEC = float(os.environ.get("TTS_RETRY_BASE_SEC", "0.5"))
+DEFAULT_MAX_DELAY_SEC = float(os.environ.get("TTS_RETRY_MAX_SEC", "20"))
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """Classic token bucket; `rate <= 0` disables limiting."""
+
+    def __init__(self, rate: float, burst: float | None = None) -> None:
+        self.rate = rate
+        self.capacity = max(burst if burst is not None else rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, blocking until available. Returns seconds waited."""
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                shortfall = (1 - self._tokens) / self.rate
+            time.sleep(shortfall)
+            waited += shortfall
+
+
+@dataclass
+class SchedulerStats:
+    requests: int = 0
+    attempts: int = 0
+    retries: int = 0
+    throttled: int = 0
+    transient_errors: int = 0
+    failures: int = 0
+    queue_wait_sec_total: float = 0.0
+    queue_wait_sec_max: float = 0.0
+    backoff_sec_total: float = 0.0
+
+    def summary(self) -> str:
+        avg_wait = self.queue_wait_sec_total / self.attempts if self.attempts else 0.0
+        return (
+            f"{self.requests} requests, {self.attempts} attempts, {self.retries} retries "
+            f"({self.throttled} throttled, {self.transient_errors} transient), {self.failures} failed; "
+            f"queue wait avg {avg_wait * 1000:.1f} ms, max {self.queue_wait_sec_max * 1000:.1f} ms; "
+            f"backoff {self.backoff_sec_total:.2f}s"
+        )
+
+
+class TTSScheduler:
+    """
+    Wraps a backend with the same synthesize()/synthesize_batch() signatures.
+    Share one instance between everything that draws on the same quota.
+    """
+
+    def __init__(
+        self,
+        backend: TTSBackend,
+        requests_per_sec: float = DEFAULT_RPS,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_delay_sec: float = DEFAULT_BASE_DELAY_SEC,
+        max_delay_sec: float = DEFAULT_MAX_DELAY_SEC,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.backend = backend
+        self.bucket = TokenBucket(requests_per_sec)
+        self.max_retries = max_retries
+        self.base_delay_sec = base_delay_sec
+        self.max_delay_sec = max_delay_sec
+        self.stats = SchedulerStats()
+        self._slots = threading.BoundedSemaphore(max(max_connections, 1))
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+
+    def _backoff(self, attempt: int, throttled: bool) -> float:
+        # Full jitter; throttling backs off from a doubled base so we actually shed load
+        base = self.base_delay_sec * (2 if throttled else 1)
+        with self._lock:
+            return self._rng.uniform(0, min(self.max_delay_sec, base * (2 ** attempt)))
+
+    def run(self, request: Callable[[], T]) -> Tuple[T, Dict[str, float]]:
+        """Run `request` under the budget with retries. Returns (result, queue wait/backoff seconds)."""
+        with self._lock:
+            self.stats.requests += 1
+        queue_wait = 0.0
+        backoff = 0.0
+        attempt = 0
+        while True:
+            wait_start = time.perf_counter()
+            with self._slots:
+                self.bucket.acquire()
+                waited = time.perf_counter() - wait_start
+                queue_wait += waited
+                with self._lock:
+                    self.stats.attempts += 1
+                    self.stats.queue_wait_sec_total += waited
+                    self.stats.queue_wait_sec_max = max(self.stats.queue_wait_sec_max, waited)
+                try:
+                    return request(), {"queue_wait_sec": queue_wait, "backoff_sec": backoff}
+                except TTSTransientError as exc:
+                    error = exc
+                except Exception:
+                    with self._lock:
+                        self.stats.failures += 1
+                    raise
+
+            # Back off without holding a connection slot
+            throttled = isinstance(error, TTSThrottledError)
+            with self._lock:
+                if throttled:
+                    self.stats.throttled += 1
+                else:
+                    self.stats.transient_errors += 1
+                if attempt >= self.max_retries:
+                    self.stats.failures += 1
+                    raise error
+                self.stats.retries += 1
+            delay = self._backoff(attempt, throttled)
+            with self._lock:
+                self.stats.backoff_sec_total += delay
+            backoff += delay
+            time.sleep(delay)
+            attempt += 1
+
+    def synthesize(self, text: str, output_path: Path, voice_style: Dict[str, str] | None = None) -> Dict:
+        payload, waits = self.run(lambda: self.backend.synthesize(text, output_path, voice_style))
+        payload.setdefault("metrics", {}).update(waits)
+        return payload
+
+    def synthesize_batch(self, items: Sequence[Tuple[str, Path, Dict[str, str]]]) -> List[Dict]:
+        payloads, waits = self.run(lambda: self.backend.synthesize_batch(items))
+        shared = {key: value / max(len(payloads), 1) for key, value in waits.items()}
+        for payload in payloads:
+            payload.setdefault("metrics", {}).update(shared)
+        return payloads
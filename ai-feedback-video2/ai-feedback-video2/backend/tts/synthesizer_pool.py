@@ -0,0 +1,267 @@
+"""
+backend.tts.synthesizer_pool
+----------------------------
+Keeps warm Azure SpeechSynthesizer instances around so clips stop paying a
+fresh SpeechConfig + connection/TLS handshake each:
+ - Pool keyed by (voice, output format, streaming)
+ - Streaming synthesizers write to a PushAudioOutputStream, so the SDK hands
+   audio to a callback instead of accumulating the clip in result.audio_data
+ - Pre-connects via the SDK's Connection.open() and waits for `connected`
+ - Leases are exclusive; callbacks are routed to whichever call holds the lease
+ - Reports per-lease connect time so it can be compared with synthesis time
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import azure.cognitiveservices.speech as speechsdk
+
+CONNECT_TIMEOUT_SEC = float(os.environ.get("AZURE_TTS_CONNECT_TIMEOUT_SEC", "10"))
+MAX_IDLE_PER_KEY = int(os.environ.get("AZURE_TTS_POOL_SIZE", "4"))
+
+PoolKey = Tuple[str, str, bool]  # (voice, output format, streaming)
+ConfigFactory = Callable[[str, str], speechsdk.SpeechConfig]
+
+
+@dataclass
+class PoolStats:
+    created: int = 0
+    reused: int = 0
+    reconnected: int = 0
+    discarded: int = 0
+    connect_sec_total: float = 0.0
+
+
+class _AudioRouter(speechsdk.audio.PushAudioOutputStreamCallback):
+    """Push-stream sink that hands each audio chunk to the current lease holder."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.handler: Optional[Callable[[bytes], None]] = None
+
+    def write(self, audio_buffer: memoryview) -> int:
+        handler = self.handler
+        if handler:
+            handler(bytes(audio_buffer))
+        return audio_buffer.nbytes
+
+    def close(self) -> None:
+        pass
+
+
+class PooledSynthesizer:
+    """
+    One SpeechSynthesizer + Connection. SDK signals are connected once and
+    forwarded to the handlers bound by the current lease holder. Audio chunks
+    (on_audio) only arrive for synthesizers created with an audio router.
+    """
+
+    def __init__(self, synthesizer: speechsdk.SpeechSynthesizer, audio_router: Optional[_AudioRouter] = None) -> None:
+        self.synthesizer = synthesizer
+        self.audio_router = audio_router
+        self.connection = speechsdk.Connection.from_speech_synthesizer(synthesizer)
+        self._connected = threading.Event()
+        self._on_word_boundary: Optional[Callable] = None
+        self._on_done: Optional[Callable] = None
+        self._on_bookmark: Optional[Callable] = None
+        self._on_audio: Optional[Callable] = None
+
+        self.connection.connected.connect(lambda _evt: self._connected.set())
+        self.connection.disconnected.connect(lambda _evt: self._connected.clear())
+        synthesizer.synthesis_word_boundary.connect(self._route_word_boundary)
+        synthesizer.bookmark_reached.connect(self._route_bookmark)
+        if audio_router is not None:
+            audio_router.handler = self._route_audio
+        synthesizer.synthesis_completed.connect(self._route_done)
+        synthesizer.synthesis_canceled.connect(self._route_done)
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected.is_set()
+
+    def connect(self, timeout: float = CONNECT_TIMEOUT_SEC) -> float:
+        """Open the connection and block until the service acknowledges it."""
+        start = time.perf_counter()
+        self.connection.open(True)
+        if not self._connected.wait(timeout):
+            print(f"  ⚠️  Synthesizer connection not confirmed within {timeout}s; SDK will connect on first use")
+        return time.perf_counter() - start
+
+    def bind(
+        self,
+        on_word_boundary: Callable,
+        on_done: Callable,
+        on_bookmark: Optional[Callable] = None,
+        on_audio: Optional[Callable] = None,
+    ) -> None:
+        self._on_word_boundary = on_word_boundary
+        self._on_done = on_done
+        self._on_bookmark = on_bookmark
+        self._on_audio = on_audio
+
+    def unbind(self) -> None:
+        self._on_word_boundary = None
+        self._on_done = None
+        self._on_bookmark = None
+        self._on_audio = None
+
+    def close(self) -> None:
+        self.unbind()
+        try:
+            self.connection.close()
+        except Exception:  # pragma: no cover - best effort during teardown
+            pass
+
+    def _route_word_boundary(self, evt) -> None:
+        handler = self._on_word_boundary
+        if handler:
+            handler(evt)
+
+    def _route_bookmark(self, evt) -> None:
+        handler = self._on_bookmark
+        if handler:
+            handler(evt)
+
+    def _route_audio(self, chunk: bytes) -> None:
+        handler = self._on_audio
+        if handler:
+            handler(chunk)
+
+    def _route_done(self, evt) -> None:
+        handler = self._on_done
+        if handler:
+            handler(evt)
+
+
+@dataclass
+class Lease:
+    synth: PooledSynthesizer
+    connect_sec: float
+    healthy: bool = True
+
+
+class SynthesizerPool:
+    """Thread-safe pool of warm synthesizers, shared across clips and sessions."""
+
+    def __init__(self, config_factory: ConfigFactory, max_idle_per_key: int = MAX_IDLE_PER_KEY) -> None:
+        self._config_factory = config_factory
+        self.max_idle_per_key = max_idle_per_key
+        self.stats = PoolStats()
+        self._lock = threading.Lock()
+        self._configs: Dict[PoolKey, speechsdk.SpeechConfig] = {}
+        self._idle: Dict[PoolKey, List[PooledSynthesizer]] = {}
+
+    def _config(self, voice: str, output_format: str) -> speechsdk.SpeechConfig:
+        with self._lock:
+            config = self._configs.get((voice, output_format))
+            if config is None:
+                config = self._config_factory(voice, output_format)
+                self._configs[(voice, output_format)] = config
+            return config
+
+    def _create(self, key: PoolKey) -> Tuple[PooledSynthesizer, float]:
+        voice, output_format, streaming = key
+        config = self._config(voice, output_format)
+        if streaming:
+            # Audio goes to the push stream as it is produced; the SDK keeps no clip-sized buffer
+            router = _AudioRouter()
+            audio_config = speechsdk.audio.AudioOutputConfig(stream=speechsdk.audio.PushAudioOutputStream(router))
+            synth = PooledSynthesizer(speechsdk.SpeechSynthesizer(config, audio_config=audio_config), router)
+        else:
+            # audio_config=None keeps audio in memory so word boundary events still fire
+            synth = PooledSynthesizer(speechsdk.SpeechSynthesizer(config, audio_config=None))
+        connect_sec = synth.connect()
+        with self._lock:
+            self.stats.created += 1
+            self.stats.connect_sec_total += connect_sec
+        return synth, connect_sec
+
+    def _checkout(self, key: PoolKey) -> Tuple[PooledSynthesizer, float]:
+        with self._lock:
+            idle = self._idle.get(key, [])
+            synth = idle.pop() if idle else None
+        if synth is None:
+            return self._create(key)
+        connect_sec = 0.0
+        if not synth.is_connected:
+            connect_sec = synth.connect()
+            with self._lock:
+                self.stats.reconnected += 1
+                self.stats.connect_sec_total += connect_sec
+        with self._lock:
+            self.stats.reused += 1
+        return synth, connect_sec
+
+    def _checkin(self, key: PoolKey, synth: PooledSynthesizer, healthy: bool) -> None:
+        synth.unbind()
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if healthy and len(idle) < self.max_idle_per_key:
+                idle.append(synth)
+                return
+            self.stats.discarded += 1
+        synth.close()
+
+    @contextmanager
+    def acquire(self, voice: str, output_format: str, streaming: bool = False) -> Iterator[Lease]:
+        """
+        Lease a synthesizer exclusively (a push-stream one with `streaming`).
+        Set `lease.healthy = False` to drop it instead of returning it (e.g.
+        after a cancellation).
+        """
+        key = (voice, output_format, streaming)
+        synth, connect_sec = self._checkout(key)
+        lease = Lease(synth=synth, connect_sec=connect_sec)
+        try:
+            yield lease
+        except BaseException:
+            lease.healthy = False
+            raise
+        finally:
+            self._checkin(key, synth, lease.healthy)
+
+    def warm(self, count: int, voice: str, output_format: str, streaming: bool = False) -> int:
+        """
+        Pre-connect up to `count` idle synthesizers for a key, in parallel.
+        Synthesizers that did connect are pooled either way; if any thread
+        failed (bad key, region, voice) the first error is re-raised so it
+        surfaces at warm time instead of on the first clip.
+        """
+        key = (voice, output_format, streaming)
+        with self._lock:
+            needed = min(count, self.max_idle_per_key) - len(self._idle.get(key, []))
+        if needed <= 0:
+            return 0
+        created: List[PooledSynthesizer] = []
+        errors: List[BaseException] = []
+
+        def create_one() -> None:
+            try:
+                created.append(self._create(key)[0])
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=create_one, daemon=True) for _ in range(needed)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for synth in created:
+            self._checkin(key, synth, healthy=True)
+        if errors:
+            print(f"  ⚠️  {len(errors)}/{needed} synthesizers failed to warm for {voice}: {errors[0]}")
+            raise errors[0]
+        return len(created)
+
+    def close(self) -> None:
+        with self._lock:
+            idle = [synth for synths in self._idle.values() for synth in synths]
+            self._idle.clear()
+        for synth in idle:
+            synth.close()
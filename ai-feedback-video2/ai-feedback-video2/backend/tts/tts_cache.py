@@ -0,0 +1,213 @@
+"""
+backend.tts.tts_cache
+---------------------
+Content-addressed on-disk cache in front of synthesize_with_timings():
+ - Keyed on (backend, text, voice, voice_style, output format, synthesis mode);
+   clips cut from a bookmark-split batch are re-encoded slices of one request,
+   so they never stand in for per-clip synthesis or vice versa
+ - Stores the MP3 plus the word-boundary JSON per entry
+ - Size-bounded LRU eviction (entry mtime doubles as last-use time)
+ - Hit/miss counters so a warm re-run can be verified to do no synthesis
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from backend.tts.backends import get_backend
+from backend.tts.base import DEFAULT_STYLE, TTSBackend
+from backend.tts.batch_tts import BatchItem
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+CACHE_KEY_VERSION = 3
+
+SynthesizeFn = Callable[[str, Path, Dict[str, str]], Dict]
+BatchSynthesizeFn = Callable[[Sequence[BatchItem]], List[Dict]]
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.hits} hits, {self.misses} misses ({self.hit_rate:.0%} hit rate), "
+            f"{self.stores} stored, {self.evictions} evicted"
+        )
+
+
+def synthesis_mode(backend: TTSBackend, batch: bool) -> str:
+    """'batch' only when the backend really shares a request; the base fallback synthesizes per clip."""
+    if batch and type(backend).synthesize_batch is not TTSBackend.synthesize_batch:
+        return "batch"
+    return "single"
+
+
+def cache_key(text: str, voice_style: Dict[str, str] | None, backend: TTSBackend, mode: str = "single") -> str:
+    """Stable digest of everything that changes the synthesized audio."""
+    effective_style = {**DEFAULT_STYLE, **(voice_style or {})}
+    payload = {
+        "v": CACHE_KEY_VERSION,
+        "backend": backend.name,
+        "text": text,
+        "voice": backend.voice,
+        "voice_style": effective_style,
+        "format": backend.output_format,
+        "mode": mode,
+    }
+    blob = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+
+class TTSCache:
+    """
+    Thread-safe LRU cache of synthesized clips.
+
+    Each entry is `<key>.mp3` + `<key>.json`; the JSON is written last so a
+    half-written entry is never served. `cache.synthesize` has the same
+    signature as the backend's synthesize(). Pass `synthesize` /
+    `synthesize_batch` to put a different callable (e.g. a retrying scheduler)
+    between the cache and the backend.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backend: TTSBackend | None = None,
+        synthesize: SynthesizeFn | None = None,
+        synthesize_batch: BatchSynthesizeFn | None = None,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self.backend = backend or get_backend()
+        self._synthesize = synthesize or self.backend.synthesize
+        self._synthesize_batch = synthesize_batch or self.backend.synthesize_batch
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    # -- index -------------------------------------------------------------
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.cache_dir / f"{key}.mp3", self.cache_dir / f"{key}.json"
+
+    def _entry_size(self, key: str) -> int:
+        audio_path, meta_path = self._paths(key)
+        return audio_path.stat().st_size + meta_path.stat().st_size
+
+    def _load_index(self) -> None:
+        found = []
+        for meta_path in self.cache_dir.glob("*.json"):
+            key = meta_path.stem
+            try:
+                found.append((meta_path.stat().st_mtime, key, self._entry_size(key)))
+            except FileNotFoundError:
+                continue  # orphaned half of an entry; overwritten on next store
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total_bytes += size
+
+    def _evict_locked(self) -> None:
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            for path in self._paths(key):
+                path.unlink(missing_ok=True)
+            self.stats.evictions += 1
+
+    # -- public API ----------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def get(self, key: str, output_path: Path) -> Optional[Dict]:
+        """Copy a cached clip to output_path and return its timing payload."""
+        audio_path, meta_path = self._paths(key)
+        with self._lock:
+            if key not in self._entries:
+                self.stats.misses += 1
+                return None
+            try:
+                timing = json.loads(meta_path.read_text(encoding="utf-8"))
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(audio_path, output_path)
+            except (FileNotFoundError, json.JSONDecodeError):
+                # Entry vanished or was corrupted underneath us: drop and resynthesize
+                self._total_bytes -= self._entries.pop(key)
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            os.utime(meta_path)
+            self.stats.hits += 1
+        timing["audio_file"] = str(output_path)
+        return timing
+
+    def put(self, key: str, timing: Dict, audio_path: Path) -> None:
+        cached_audio, meta_path = self._paths(key)
+        meta = {k: v for k, v in timing.items() if k not in ("audio_file", "metrics")}
+        tmp_suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp_audio = cached_audio.with_name(cached_audio.name + tmp_suffix)
+        tmp_meta = meta_path.with_name(meta_path.name + tmp_suffix)
+        shutil.copyfile(audio_path, tmp_audio)
+        tmp_meta.write_text(json.dumps(meta), encoding="utf-8")
+        with self._lock:
+            os.replace(tmp_audio, cached_audio)
+            os.replace(tmp_meta, meta_path)
+            self._total_bytes -= self._entries.pop(key, 0)
+            size = self._entry_size(key)
+            self._entries[key] = size
+            self._total_bytes += size
+            self.stats.stores += 1
+            self._evict_locked()
+
+    def synthesize(self, text: str, output_path: Path, voice_style: Dict[str, str] | None = None) -> Dict:
+        """Drop-in replacement for synthesize_with_timings() that consults the cache first."""
+        key = cache_key(text, voice_style, self.backend)
+        cached = self.get(key, output_path)
+        if cached is not None:
+            return cached
+        timing = self._synthesize(text, output_path, voice_style)
+        self.put(key, timing, output_path)
+        return timing
+
+    def synthesize_batch(self, items: Sequence[BatchItem]) -> List[Dict]:
+        """Serve hits from disk and send only the misses to the backend as one batch."""
+        mode = synthesis_mode(self.backend, batch=True)
+        results: List[Optional[Dict]] = []
+        misses: List[int] = []
+        for index, (text, path, style) in enumerate(items):
+            cached = self.get(cache_key(text, style, self.backend, mode), path)
+            results.append(cached)
+            if cached is None:
+                misses.append(index)
+        if misses:
+            fresh = self._synthesize_batch([items[i] for i in misses])
+            for index, timing in zip(misses, fresh):
+                text, path, style = items[index]
+                self.put(cache_key(text, style, self.backend, mode), timing, path)
+                results[index] = timing
+        return results  # type: ignore[return-value]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import platform
@@ -21,7 +22,11 @@ DEFAULT_ENTRY = PROJECT_ROOT / "src" / "index.ts"
 DEFAULT_COMPOSITION = "FullVideo"
 DEFAULT_OUTPUT_DIR = PROJECT_ROOT / "renders"
 DEFAULT_BUNDLE_DIR = DEFAULT_OUTPUT_DIR / "bundle"
-RENDER_METRICS_PATH = DEFAULT_OUTPUT_DIR / "render_metrics.json"
+# Written next to the renders, so sessions rendering side by side keep their own.
+RENDER_METRICS_NAME = "render_metrics.json"
+# Digest of the bundled sources, kept inside build/ to tell whether it is stale.
+BUNDLE_FINGERPRINT_NAME = ".bundle_fingerprint"
+BUNDLE_INPUTS = ("src", "public", "package.json", "remotion.config.ts", "tsconfig.json")
 
 DEFAULT_QUALITIES: Dict[str, Dict[str, int]] = {
     "480p": {"width": 854, "height": 480},
@@ -68,13 +73,47 @@ def ffprobe_duration(path: Path) -> Optional[float]:
     except Exception:
         return None
 
+def session_project(session_id: str) -> Path:
+    """
+    The session workspace's private copy of this project (published assets
+    included), staged fresh from this one; see backend/scripts/workspace.py.
+    """
+    repo_root = PROJECT_ROOT.parent
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+    from backend.scripts.workspace import SessionWorkspace
+
+    workspace = SessionWorkspace.for_session(session_id).ensure()
+    return workspace.frontend_dir
+
 # =========================
 # Remotion Operations
 # =========================
 
-def bundle_project(npx_cmd: str, entry: Path, bundle_dir: Path) -> Path:
+def bundle_fingerprint(project_dir: Path, entry: Path) -> str:
+    """Digest of every file the bundle is built from (path, size, mtime)."""
+    digest = hashlib.sha256(str(entry).encode("utf-8"))
+    for name in BUNDLE_INPUTS:
+        root = project_dir / name
+        files = sorted(root.rglob("*")) if root.is_dir() else [root]
+        for path in files:
+            if path.is_file():
+                stat = path.stat()
+                digest.update(f"{path.relative_to(project_dir)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def bundle_project(npx_cmd: str, entry: Path, bundle_dir: Path, project_dir: Path = PROJECT_ROOT) -> Path:
     print("\n=== Bundling Remotion Project ===")
 
+    build_dir = project_dir / "build"
+    fingerprint_path = build_dir / BUNDLE_FINGERPRINT_NAME
+    fingerprint = bundle_fingerprint(project_dir, entry)
+    if (build_dir / "index.html").exists() and fingerprint_path.exists():
+        if fingerprint_path.read_text(encoding="utf-8") == fingerprint:
+            print(f"✅ Bundle up to date at: {build_dir}")
+            return build_dir
+
     cmd = [
         npx_cmd,
         "remotion",
@@ -83,10 +122,9 @@ def bundle_project(npx_cmd: str, entry: Path, bundle_dir: Path) -> Path:
     ]
     print(" ", " ".join(cmd))
 
-    run_command(cmd, cwd=PROJECT_ROOT)
+    run_command(cmd, cwd=project_dir)
 
     # Remotion outputs bundle to ./build
-    build_dir = PROJECT_ROOT / "build"
     index_html = build_dir / "index.html"
 
     if not index_html.exists():
@@ -94,6 +132,7 @@ def bundle_project(npx_cmd: str, entry: Path, bundle_dir: Path) -> Path:
             f"Bundling finished but index.html not found in {build_dir}"
         )
 
+    fingerprint_path.write_text(fingerprint, encoding="utf-8")
     print(f"✅ Bundle ready at: {build_dir}")
     return build_dir
 
@@ -108,6 +147,7 @@ def render_video(
     npx_cmd: str,
     concurrency: int,
     extra_args: Optional[str] = None,
+    project_dir: Path = PROJECT_ROOT,
 ) -> Dict[str, object]:
     output_dir.mkdir(parents=True, exist_ok=True)
     output_file = output_dir / f"output_{quality}.mp4"
@@ -136,7 +176,7 @@ def render_video(
     print(" ", " ".join(cmd))
 
     start = time.perf_counter()
-    run_command(cmd, cwd=PROJECT_ROOT)
+    run_command(cmd, cwd=project_dir)
     end = time.perf_counter()
 
     file_size_mb = output_file.stat().st_size / (1024 * 1024)
@@ -152,43 +192,20 @@ def render_video(
         "render_time_sec": round(end - start, 2),
     }
 
-# =========================
-# Argument Parsing
-# =========================
-
-def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(
-        description="Production-grade Remotion renderer (Windows-safe)"
-    )
-    parser.add_argument("--entry", type=Path, default=DEFAULT_ENTRY)
-    parser.add_argument("--composition", default=DEFAULT_COMPOSITION)
-    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR)
-    parser.add_argument("--extra-args", default=None)
-    parser.add_argument("--render-concurrency", type=int, default=None)
-    return parser.parse_args()
-
-# =========================
-# Main
-# =========================
-
-def main() -> int:
-    print("DEBUG: Entered main()")
-
-    npx_cmd = find_npx()
-    args = parse_args()
-
-    cpu_count = os.cpu_count() or 2
-    render_concurrency = args.render_concurrency or max(cpu_count - 1, 1)
-
-    print("\n=== Render Configuration ===")
-    print(f"CPU cores           : {cpu_count}")
-    print("Parallel renders    : 1  (Windows-safe)")
-    print(f"Render concurrency  : {render_concurrency}")
-    print(f"Composition         : {args.composition}")
-    print(f"Output directory    : {args.output_dir}")
+def render_project(
+    npx_cmd: str,
+    project_dir: Path,
+    output_dir: Path,
+    composition: str,
+    concurrency: int,
+    extra_args: Optional[str] = None,
+    entry: Optional[Path] = None,
+) -> Path:
+    """Bundle project_dir (unless its bundle is current), render every quality, and return the metrics file."""
+    entry = entry or project_dir / "src" / "index.ts"
 
     # ✅ Bundle once
-    bundle_dir = bundle_project(npx_cmd, args.entry, DEFAULT_BUNDLE_DIR)
+    bundle_dir = bundle_project(npx_cmd, entry, DEFAULT_BUNDLE_DIR, project_dir)
 
     render_results = []
     total_render_time = 0.0
@@ -202,11 +219,12 @@ def main() -> int:
             width=dims["width"],
             height=dims["height"],
             bundle_dir=bundle_dir,
-            composition=args.composition,
-            output_dir=args.output_dir,
+            composition=composition,
+            output_dir=output_dir,
             npx_cmd=npx_cmd,
-            concurrency=render_concurrency,
-            extra_args=args.extra_args,
+            concurrency=concurrency,
+            extra_args=extra_args,
+            project_dir=project_dir,
         )
 
         render_results.append(result)
@@ -216,21 +234,77 @@ def main() -> int:
         "run_id": datetime.now(timezone.utc).isoformat(),
         "machine": {
             "os": platform.system(),
-            "cpu_cores": cpu_count,
+            "cpu_cores": os.cpu_count() or 2,
         },
-        "composition": args.composition,
+        "composition": composition,
         "renders": render_results,
         "total_render_time_sec": round(total_render_time, 2),
     }
 
-    args.output_dir.mkdir(parents=True, exist_ok=True)
-    RENDER_METRICS_PATH.write_text(
+    output_dir.mkdir(parents=True, exist_ok=True)
+    metrics_path = output_dir / RENDER_METRICS_NAME
+    metrics_path.write_text(
         json.dumps(metrics, indent=2),
         encoding="utf-8",
     )
+    return metrics_path
+
+# =========================
+# Argument Parsing
+# =========================
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Production-grade Remotion renderer (Windows-safe)"
+    )
+    parser.add_argument(
+        "--session",
+        default=None,
+        help="Render the session workspace backend/workspaces/<session> (its own app copy and renders/)",
+    )
+    parser.add_argument("--entry", type=Path, default=None, help=f"Default: {DEFAULT_ENTRY}")
+    parser.add_argument("--composition", default=DEFAULT_COMPOSITION)
+    parser.add_argument("--output-dir", type=Path, default=None, help=f"Default: {DEFAULT_OUTPUT_DIR}")
+    parser.add_argument("--extra-args", default=None)
+    parser.add_argument("--render-concurrency", type=int, default=None)
+    return parser.parse_args()
+
+# =========================
+# Main
+# =========================
+
+def main() -> int:
+    print("DEBUG: Entered main()")
+
+    npx_cmd = find_npx()
+    args = parse_args()
+
+    project_dir = session_project(args.session) if args.session else PROJECT_ROOT
+    output_dir = args.output_dir or project_dir / "renders"
+
+    cpu_count = os.cpu_count() or 2
+    render_concurrency = args.render_concurrency or max(cpu_count - 1, 1)
+
+    print("\n=== Render Configuration ===")
+    print(f"CPU cores           : {cpu_count}")
+    print("Parallel renders    : 1  (Windows-safe)")
+    print(f"Render concurrency  : {render_concurrency}")
+    print(f"Composition         : {args.composition}")
+    print(f"Project directory   : {project_dir}")
+    print(f"Output directory    : {output_dir}")
+
+    metrics_path = render_project(
+        npx_cmd,
+        project_dir,
+        output_dir,
+        args.composition,
+        render_concurrency,
+        extra_args=args.extra_args,
+        entry=args.entry,
+    )
 
     print("\n=== Render Metrics Written ===")
-    print(f"📄 {RENDER_METRICS_PATH}")
+    print(f"📄 {metrics_path}")
 
     return 0
 if __name__ == "__main__":
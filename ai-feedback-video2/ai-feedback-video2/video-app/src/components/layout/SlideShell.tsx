@@ -3,7 +3,7 @@ import { PALETTE } from '../../lib/config';
 import { BackgroundCanvas } from './BackgroundCanvas';
 import { AnimatedBlock } from '../animations/AnimatedBlock';
 import { useSlideChoreography } from '../../hooks/useChoreography';
-import { AnimationBlock } from '../../types/choreography';
+import { getBlockAnimation } from '../../hooks/useTimeline';
 
 type SlideShellProps = {
   title?: string;
@@ -34,9 +34,7 @@ const headerStyle: CSSProperties = {
 
 export const SlideShell: React.FC<SlideShellProps> = ({ title, children, slideId }) => {
   const choreography = useSlideChoreography(slideId);
-  const titleAnimation = choreography?.animations?.find(
-    (anim: AnimationBlock) => anim.blockId === 'slide_title'
-  );
+  const titleAnimation = getBlockAnimation(choreography, 'slide_title');
   
   return (
     <BackgroundCanvas>
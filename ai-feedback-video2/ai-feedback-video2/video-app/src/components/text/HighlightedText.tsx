@@ -1,66 +1,81 @@
-import { CSSProperties } from 'react';
+import { CSSProperties, useMemo } from 'react';
 import { useCurrentFrame } from 'remotion';
 import { PALETTE } from '../../lib/config';
 import { HighlightStyle } from '../../types/choreography';
 
+type TimingEntry = { word: string; startFrame: number; endFrame: number };
+
 type HighlightedTextProps = {
   text: string;
   keywords?: string[];
-  wordTimings?: Array<{ word: string; startFrame: number; endFrame: number }>;
+  wordTimings?: TimingEntry[];
+  // Index into wordTimings of the word being spoken (useActiveWordIndex); resolved per frame when omitted
+  activeWordIndex?: number;
   style?: CSSProperties;
   highlightStyle?: HighlightStyle;
   color?: string;
 };
 
+// Shared defaults, so props left out do not invalidate the useMemo below on every render.
+const NO_KEYWORDS: string[] = [];
+const NO_TIMINGS: TimingEntry[] = [];
+
+// Normalize text for matching - remove punctuation and lowercase
+const normalizeForMatch = (str: string) =>
+  str.toLowerCase().replace(/[.,!?;:]/g, '').trim();
+
 /**
  * Component that highlights keywords as they're spoken in the narration
  */
 export const HighlightedText: React.FC<HighlightedTextProps> = ({
   text,
-  keywords = [],
-  wordTimings = [],
+  keywords = NO_KEYWORDS,
+  wordTimings = NO_TIMINGS,
+  activeWordIndex,
   style,
   highlightStyle = 'underline',
   color = PALETTE.azure,
 }) => {
   const frame = useCurrentFrame();
 
-  // Normalize text for matching - remove punctuation and lowercase
-  const normalizeForMatch = (str: string) => 
-    str.toLowerCase().replace(/[.,!?;:]/g, '').trim();
+  // Keyword flags and timing matches only change with the inputs, not per frame.
+  const words = useMemo(() => {
+    // Create a set of normalized keywords
+    const normalizedKeywords = new Set(keywords.map((k) => normalizeForMatch(k)));
 
-  // Create a set of normalized keywords
-  const normalizedKeywords = new Set(
-    keywords.map((k) => normalizeForMatch(k))
-  );
+    // Split text into words while preserving spaces and punctuation
+    return text.split(/(\s+)/).map((word) => {
+      const cleanWord = normalizeForMatch(word);
 
-  // Split text into words while preserving spaces and punctuation
-  const words = text.split(/(\s+)/);
+      // Check if this word is a keyword or part of a keyword phrase
+      const isKeyword = normalizedKeywords.has(cleanWord) ||
+        Array.from(normalizedKeywords).some(kw =>
+          kw.includes(cleanWord) || cleanWord.includes(kw)
+        );
+
+      // Find timing for this word (match without punctuation)
+      const timingIndex = word.trim()
+        ? wordTimings.findIndex((t) => normalizeForMatch(t.word) === cleanWord)
+        : -1;
+
+      return { word, isKeyword, timingIndex };
+    });
+  }, [text, keywords, wordTimings]);
 
   return (
     <span style={style}>
-      {words.map((word, index) => {
+      {words.map(({ word, isKeyword, timingIndex }, index) => {
         if (!word.trim()) {
           // Preserve whitespace
           return <span key={index}>{word}</span>;
         }
 
-        const cleanWord = normalizeForMatch(word);
-        
-        // Check if this word is a keyword or part of a keyword phrase
-        const isKeyword = normalizedKeywords.has(cleanWord) || 
-          Array.from(normalizedKeywords).some(kw => 
-            kw.includes(cleanWord) || cleanWord.includes(kw)
-          );
-        
-        // Find timing for this word (match without punctuation)
-        const timing = wordTimings.find(
-          (t) => normalizeForMatch(t.word) === cleanWord
-        );
-        
-        const isActive = timing 
-          ? frame >= timing.startFrame && frame <= timing.endFrame
-          : false;
+        const timing = timingIndex >= 0 ? wordTimings[timingIndex] : undefined;
+        const isActive = activeWordIndex !== undefined
+          ? timingIndex >= 0 && timingIndex === activeWordIndex
+          : timing
+            ? frame >= timing.startFrame && frame <= timing.endFrame
+            : false;
 
         // Highlight style when word is being spoken AND is a keyword
         const highlightStyleObj: CSSProperties = isActive && isKeyword
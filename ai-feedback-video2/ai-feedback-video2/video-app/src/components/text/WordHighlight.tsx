@@ -1,6 +1,7 @@
 import React, { CSSProperties } from 'react';
 import { useCurrentFrame } from 'remotion';
-import { WordTiming, HighlightStyle } from '../../types/choreography';
+import { WordTiming, HighlightStyle, TimelineRuns } from '../../types/choreography';
+import { lookupRun } from '../../hooks/useTimeline';
 
 interface WordHighlightProps {
   text: string;
@@ -9,6 +10,7 @@ interface WordHighlightProps {
   style?: HighlightStyle;
   color?: string;
   baseStyle?: CSSProperties;
+  activeWords?: TimelineRuns;  // the slide's timeline.word runs; one lookup per frame instead of a scan
 }
 
 /**
@@ -22,6 +24,7 @@ export const WordHighlight: React.FC<WordHighlightProps> = ({
   style = 'background',
   color = '#FFD700',
   baseStyle = {},
+  activeWords,
 }) => {
   const frame = useCurrentFrame();
   
@@ -34,9 +37,11 @@ export const WordHighlight: React.FC<WordHighlightProps> = ({
   const currentFrame = frame - audioStartFrame;
 
   // Find currently active word
-  const activeWordIndex = wordTimings.findIndex(
-    (word) => currentFrame >= word.startFrame && currentFrame <= word.endFrame
-  );
+  const activeWordIndex = activeWords
+    ? lookupRun(activeWords, currentFrame)
+    : wordTimings.findIndex(
+        (word) => currentFrame >= word.startFrame && currentFrame <= word.endFrame
+      );
 
   // Split text into words (simple approach for POC)
   const words = text.split(/(\s+)/);
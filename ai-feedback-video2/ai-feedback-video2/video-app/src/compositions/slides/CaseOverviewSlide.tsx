@@ -6,7 +6,8 @@ import { PALETTE } from '../../lib/config';
 import { AnimatedBlock } from '../../components/animations/AnimatedBlock';
 import { NarrationAudio } from '../../components/audio/NarrationAudio';
 import { useSlideChoreography } from '../../hooks/useChoreography';
-import { AnimationBlock, BlockHighlight, SlideChoreography } from '../../types/choreography';
+import { getBlockAnimation, getBlockHighlight } from '../../hooks/useTimeline';
+import { AnimationBlock, BlockHighlight } from '../../types/choreography';
 
 type CaseOverviewSlideProps = {
   caseTitle: string;
@@ -50,19 +51,11 @@ export const CaseOverviewSlide: React.FC<CaseOverviewSlideProps> = ({
   const dataFontSize = BASE_LIST_SIZE;
   const constraintsFontSize = BASE_LIST_SIZE;
   
-  const getAnimation = (blockId: string): AnimationBlock | undefined => {
-    if (!choreography) return undefined;
-    return (choreography as SlideChoreography).animations?.find(
-      (anim: AnimationBlock) => anim.blockId === blockId,
-    );
-  };
+  const getAnimation = (blockId: string): AnimationBlock | undefined =>
+    getBlockAnimation(choreography, blockId);
 
-  const getHighlight = (blockId: string): BlockHighlight | undefined => {
-    if (!choreography?.highlights) return undefined;
-    return (choreography as SlideChoreography).highlights?.find(
-      (h: BlockHighlight) => h.blockId === blockId,
-    );
-  };
+  const getHighlight = (blockId: string): BlockHighlight | undefined =>
+    getBlockHighlight(choreography, blockId);
   
   const focusValue = (highlight?: BlockHighlight) => {
     if (!highlight) return 0;
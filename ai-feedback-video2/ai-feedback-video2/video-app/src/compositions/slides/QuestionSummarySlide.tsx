@@ -1,4 +1,4 @@
-import { CSSProperties } from 'react';
+import { CSSProperties, useMemo } from 'react';
 import { useCurrentFrame, interpolate } from 'remotion';
 import { SlideShell } from '../../components/layout/SlideShell';
 import { QuestionData } from '../../types/content';
@@ -6,7 +6,8 @@ import { PALETTE } from '../../lib/config';
 import { AnimatedBlock } from '../../components/animations/AnimatedBlock';
 import { NarrationAudio } from '../../components/audio/NarrationAudio';
 import { useSlideChoreography } from '../../hooks/useChoreography';
-import { AnimationBlock, SlideChoreography } from '../../types/choreography';
+import { getBlockAnimation, getBlockHighlight, useActiveWordIndex } from '../../hooks/useTimeline';
+import { AnimationBlock } from '../../types/choreography';
 import { HighlightedText } from '../../components/text/HighlightedText';
 import { getManifestEvents } from '../../lib/loadData';
 
@@ -75,9 +76,10 @@ export const QuestionSummarySlide: React.FC<QuestionSummarySlideProps> = ({
   const choreography = useSlideChoreography('q1_summary');
   
   // Get keywords from manifest for highlighting
-  const manifestEvents = getManifestEvents();
-  const summaryEvent = manifestEvents.find(e => e.slide_type === 'q_summary');
-  const keywords = (summaryEvent?.narration?.keywords || []).map(k => typeof k === 'string' ? k : k.text);
+  const keywords = useMemo(() => {
+    const summaryEvent = getManifestEvents().find(e => e.slide_type === 'q_summary');
+    return (summaryEvent?.narration?.keywords || []).map(k => typeof k === 'string' ? k : k.text);
+  }, []);
   
   // Simple font sizing
   const scenarioSize = BASE_BODY_SIZE;
@@ -87,17 +89,10 @@ export const QuestionSummarySlide: React.FC<QuestionSummarySlideProps> = ({
   const questionSize = BASE_BODY_SIZE;
   const feedbackSize = BASE_BODY_SIZE;
 
-  const getHighlight = (blockId: string) => {
-    if (!choreography?.highlights) return undefined;
-    return (choreography as SlideChoreography).highlights?.find((h) => h.blockId === blockId);
-  };
+  const getHighlight = (blockId: string) => getBlockHighlight(choreography, blockId);
   
-  const getAnimation = (blockId: string): AnimationBlock | undefined => {
-    if (!choreography) return undefined;
-    return (choreography as SlideChoreography).animations?.find(
-      (anim: AnimationBlock) => anim.blockId === blockId,
-    );
-  };
+  const getAnimation = (blockId: string): AnimationBlock | undefined =>
+    getBlockAnimation(choreography, blockId);
   
   // Counter animation for score - only animate when narration mentions the number
   const scoreNumberAnimation = getAnimation('score_number');
@@ -111,11 +106,15 @@ export const QuestionSummarySlide: React.FC<QuestionSummarySlideProps> = ({
     : question.score; // Show final score if animation hasn't started
 
   const narrationOffset = choreography?.narration?.startFrame ?? 0;
-  const shiftedWordTimings = choreography?.narration?.wordTimings?.map((t) => ({
-    ...t,
-    startFrame: t.startFrame + narrationOffset,
-    endFrame: t.endFrame + narrationOffset,
-  }));
+  const activeWordIndex = useActiveWordIndex(choreography, narrationOffset);
+  const shiftedWordTimings = useMemo(
+    () => choreography?.narration?.wordTimings?.map((t) => ({
+      ...t,
+      startFrame: t.startFrame + narrationOffset,
+      endFrame: t.endFrame + narrationOffset,
+    })),
+    [choreography, narrationOffset],
+  );
 
   return (
     <SlideShell title={caseTitle} slideId="question_summary_slide">
@@ -221,6 +220,7 @@ export const QuestionSummarySlide: React.FC<QuestionSummarySlideProps> = ({
                 text={question.question_prompt}
                 keywords={keywords}
                 wordTimings={shiftedWordTimings}
+                activeWordIndex={activeWordIndex}
                 highlightStyle="none"
               />
             </p>
@@ -249,6 +249,7 @@ export const QuestionSummarySlide: React.FC<QuestionSummarySlideProps> = ({
                   text={question.feedback_summary}
                   keywords={keywords}
                   wordTimings={shiftedWordTimings}
+                  activeWordIndex={activeWordIndex}
                   highlightStyle="none"
                 />
               </p>
@@ -5,7 +5,8 @@ import { QuestionData } from '../../types/content';
 import { PALETTE } from '../../lib/config';
 import { NarrationAudio } from '../../components/audio/NarrationAudio';
 import { useSlideChoreography } from '../../hooks/useChoreography';
-import { BlockHighlight, SlideChoreography } from '../../types/choreography';
+import { getBlockHighlight, useActiveWordIndex } from '../../hooks/useTimeline';
+import { BlockHighlight } from '../../types/choreography';
 import { HighlightedText } from '../../components/text/HighlightedText';
 import { getManifestEvents } from '../../lib/loadData';
 
@@ -62,19 +63,16 @@ export const ThinkingStepsSlide: React.FC<ThinkingStepsSlideProps> = ({
 }) => {
   const choreography = useSlideChoreography('q1_thinking');
   const frame = useCurrentFrame();
-  
-  const manifestEvents = getManifestEvents();
-  const thinkingEvent = manifestEvents.find(e => e.slide_type === 'thinking_steps');
-  const keywords = (thinkingEvent?.narration?.keywords || []).map(k => typeof k === 'string' ? k : k.text);
-  
-  const getHighlight = (blockId: string): BlockHighlight | undefined => {
-    if (!choreography?.highlights) return undefined;
-    return (choreography as SlideChoreography).highlights?.find((h) => h.blockId === blockId);
-  };
+  const activeWordIndex = useActiveWordIndex(choreography);
 
-  const stepsHighlight = getHighlight('col_steps');
-  const thoughtHighlight = getHighlight('col_thought');
-  const adviceHighlight = getHighlight('col_advice');
+  const keywords = useMemo(() => {
+    const thinkingEvent = getManifestEvents().find(e => e.slide_type === 'thinking_steps');
+    return (thinkingEvent?.narration?.keywords || []).map(k => typeof k === 'string' ? k : k.text);
+  }, []);
+
+  const stepsHighlight = getBlockHighlight(choreography, 'col_steps');
+  const thoughtHighlight = getBlockHighlight(choreography, 'col_thought');
+  const adviceHighlight = getBlockHighlight(choreography, 'col_advice');
 
   const isColumnWise = !Array.isArray(question.thinking_steps) && question.thinking_steps && typeof question.thinking_steps === 'object';
   const rowCount = isColumnWise
@@ -127,17 +125,6 @@ export const ThinkingStepsSlide: React.FC<ThinkingStepsSlideProps> = ({
   };
 
   const normalized = (value: string) => value.toLowerCase().replace(/[^a-z0-9]/g, '');
-  const findFirstTokenFrame = (token: string, minFrame: number) => {
-    const norm = normalized(token);
-    const match = choreography?.narration?.wordTimings?.find(
-      (w) => normalized(w.word) === norm && w.startFrame >= minFrame,
-    );
-    return match?.startFrame;
-  };
-  const findAnchorForText = (text: string, minFrame: number) => {
-    const token = (text.split(/\s+/).find((t) => t.length > 4) ?? text).toLowerCase();
-    return findFirstTokenFrame(token, minFrame);
-  };
 
   const bucketSegmentsByLabel = (
     segments: SegmentWindow[],
@@ -156,13 +143,16 @@ export const ThinkingStepsSlide: React.FC<ThinkingStepsSlideProps> = ({
       return fallbackSegment ? [fallbackSegment] : [];
     });
 
-  const stepTitles = isColumnWise
-    ? (typeof question.thinking_steps === 'object' && !Array.isArray(question.thinking_steps) && 'steps' in question.thinking_steps
-        ? (question.thinking_steps as { steps?: string[] }).steps || []
-        : [])
-    : (Array.isArray(question.thinking_steps)
-        ? question.thinking_steps.map((step) => step.step_title)
-        : []);
+  const stepTitles = useMemo(
+    () => isColumnWise
+      ? (typeof question.thinking_steps === 'object' && !Array.isArray(question.thinking_steps) && 'steps' in question.thinking_steps
+          ? (question.thinking_steps as { steps?: string[] }).steps || []
+          : [])
+      : (Array.isArray(question.thinking_steps)
+          ? question.thinking_steps.map((step) => step.step_title)
+          : []),
+    [question, isColumnWise],
+  );
   
   type ThinkingStepsColumnWise = {
     steps?: string[];
@@ -343,6 +333,7 @@ export const ThinkingStepsSlide: React.FC<ThinkingStepsSlideProps> = ({
                     text={stepTitles[index] || ''}
                     keywords={keywords}
                     wordTimings={choreography?.narration?.wordTimings}
+                    activeWordIndex={activeWordIndex}
                     highlightStyle="background"
                   />
                 </div>
@@ -363,6 +354,7 @@ export const ThinkingStepsSlide: React.FC<ThinkingStepsSlideProps> = ({
                     text={yourApproaches[index] || ''}
                     keywords={keywords}
                     wordTimings={choreography?.narration?.wordTimings}
+                    activeWordIndex={activeWordIndex}
                     highlightStyle="none"
                   />
                 </div>
@@ -383,6 +375,7 @@ export const ThinkingStepsSlide: React.FC<ThinkingStepsSlideProps> = ({
                     text={(ideals?.[index] ?? '')}
                     keywords={keywords}
                     wordTimings={choreography?.narration?.wordTimings}
+                    activeWordIndex={activeWordIndex}
                     highlightStyle="none"
                   />
                 </div>
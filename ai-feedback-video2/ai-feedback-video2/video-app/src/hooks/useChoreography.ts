@@ -1,5 +1,5 @@
 import { spring, useCurrentFrame, useVideoConfig } from 'remotion';
-import { AnimationBlock, AnimationType, SlideChoreography } from '../types/choreography';
+import { AnimationBlock, AnimationType, SlideChoreography, WordTable, WordTiming } from '../types/choreography';
 
 export interface AnimationState {
   isVisible: boolean;
@@ -192,18 +192,110 @@ const normalizeAnimationType = (animation?: AnimationBlock): AnimationType => {
   }
 };
 
+const expandWordTable = (table: WordTable): WordTiming[] =>
+  table.word.map((word, index) => ({
+    word,
+    startFrame: table.startFrame[index],
+    endFrame: table.endFrame[index],
+    durationFrames: table.durationFrames?.[index] ?? table.endFrame[index] - table.startFrame[index],
+  }));
+
+const resolvedChoreography = new Map<string, SlideChoreography>();
+
+/** Frame rate choreography/*.json is written at; other rates live in choreography/<fps>fps/. */
+export const BASE_CHOREOGRAPHY_FPS = 30;
+
+const choreographyKey = (slideId: string, fps?: number): string =>
+  !fps || fps === BASE_CHOREOGRAPHY_FPS ? slideId : `${fps}fps/${slideId}`;
+
 /**
- * Hook to get choreography data for a slide
+ * Inline the shared word table a choreography file references by id, so
+ * slides keep reading narration.wordTimings. Resolved once per slide and rate.
  */
-export const useSlideChoreography = (slideId?: string): SlideChoreography | null => {
-  if (!slideId) return null;
+export const resolveChoreography = (
+  slideId: string,
+  raw: SlideChoreography,
+  fps?: number,
+): SlideChoreography => {
+  const key = choreographyKey(slideId, fps);
+  const cached = resolvedChoreography.get(key);
+  if (cached) return cached;
+  let resolved = raw;
+  const tableId = raw.narration?.wordTable;
+  if (raw.narration && tableId && !raw.narration.wordTimings) {
+    // eslint-disable-next-line @typescript-eslint/no-require-imports
+    const table = require(`../data/word_tables/${tableId}.json`) as WordTable;
+    resolved = { ...raw, narration: { ...raw.narration, wordTimings: expandWordTable(table) } };
+  }
+  resolvedChoreography.set(key, resolved);
+  return resolved;
+};
+
+// Every frame-valued field of a choreography file (word tables expand into the same keys).
+const FRAME_KEYS = new Set(['startFrame', 'endFrame', 'durationFrames', 'totalDurationFrames', 'delay', 'stagger']);
+
+const scaleFrameFields = (value: unknown, factor: number): unknown => {
+  if (Array.isArray(value)) return value.map((item) => scaleFrameFields(item, factor));
+  if (value && typeof value === 'object') {
+    return Object.fromEntries(
+      Object.entries(value).map(([field, item]) => [
+        field,
+        typeof item === 'number' && FRAME_KEYS.has(field) ? Math.round(item * factor) : scaleFrameFields(item, factor),
+      ]),
+    );
+  }
+  return value;
+};
+
+/**
+ * A resolved base-rate choreography re-timed for another frame rate. Frames
+ * are rounded once more than in a file generated at that rate, and the
+ * timeline (base-rate runs) is dropped, so the hooks fall back to list scans.
+ */
+export const scaleChoreography = (choreography: SlideChoreography, fps: number): SlideChoreography => {
+  const untimed = { ...choreography, timeline: undefined };
+  return { ...(scaleFrameFields(untimed, fps / BASE_CHOREOGRAPHY_FPS) as SlideChoreography), fps };
+};
+
+const loadChoreography = (key: string): SlideChoreography | null => {
   try {
     // Dynamic import based on slideId
     // eslint-disable-next-line @typescript-eslint/no-require-imports
-    const choreography = require(`../data/choreography/${slideId}.json`);
-    return choreography as SlideChoreography;
+    return require(`../data/choreography/${key}.json`) as SlideChoreography;
   } catch {
-    console.warn(`No choreography found for slide: ${slideId}`);
     return null;
   }
 };
+
+/**
+ * Hook to get choreography data for a slide, at the composition's frame rate
+ * (useVideoConfig) unless fps is given. Rates other than
+ * BASE_CHOREOGRAPHY_FPS are read from choreography/<fps>fps/, which the
+ * backend writes with calculate_choreography.py --fps; when that file is
+ * missing, the base file is scaled to the rate (with a warning) rather than
+ * leaving the slide without highlights.
+ */
+export const useSlideChoreography = (slideId?: string, fps?: number): SlideChoreography | null => {
+  const { fps: compositionFps } = useVideoConfig();
+  if (!slideId) return null;
+  const rate = fps ?? compositionFps;
+  const key = choreographyKey(slideId, rate);
+  const cached = resolvedChoreography.get(key);
+  if (cached) return cached;
+
+  const choreography = loadChoreography(key);
+  if (choreography) return resolveChoreography(slideId, choreography, rate);
+
+  const base = key === slideId ? null : loadChoreography(slideId);
+  if (!base) {
+    console.warn(`No choreography found for slide: ${key}`);
+    return null;
+  }
+  console.warn(
+    `No ${rate}fps choreography for slide ${slideId}; scaling the ${BASE_CHOREOGRAPHY_FPS}fps file ` +
+      `(generate it with calculate_choreography.py --fps ${BASE_CHOREOGRAPHY_FPS},${rate})`,
+  );
+  const scaled = scaleChoreography(resolveChoreography(slideId, base), rate);
+  resolvedChoreography.set(key, scaled);
+  return scaled;
+};
@@ -1,7 +1,8 @@
 ﻿import { useMemo } from 'react';
 import { KeywordSpec } from '../types/manifest';
 import { AudioTiming } from '../types/timings';
-import { useKeywordHighlight } from './useKeywordHighlight';
+import { TimelineRuns } from '../types/choreography';
+import { NO_KEYWORDS, useKeywordHighlight } from './useKeywordHighlight';
 
 type Segment = {
   text: string;
@@ -12,9 +13,10 @@ type Segment = {
 export const useHighlightedParagraph = (
   text: string,
   timing?: AudioTiming,
-  keywords: KeywordSpec[] = [],
+  keywords: KeywordSpec[] = NO_KEYWORDS,
+  activeWords?: TimelineRuns,
 ) => {
-  const wordHighlights = useKeywordHighlight(timing, keywords);
+  const wordHighlights = useKeywordHighlight(timing, keywords, activeWords);
 
   return useMemo<Segment[]>(() => {
     if (!timing || wordHighlights.length === 0) {
@@ -1,34 +1,46 @@
-﻿import { useCurrentFrame, useVideoConfig } from 'remotion';
+﻿import { useMemo } from 'react';
+import { useCurrentFrame, useVideoConfig } from 'remotion';
 import { KeywordSpec } from '../types/manifest';
 import { AudioTiming } from '../types/timings';
+import { TimelineRuns } from '../types/choreography';
 import { secToFrames } from '../lib/time';
+import { lookupRun } from './useTimeline';
 
 const normalize = (value?: string) => (value ?? '').trim().toLowerCase();
 
+// Shared default, so a call without keywords keeps the useMemo below cached.
+export const NO_KEYWORDS: KeywordSpec[] = [];
+
+/**
+ * Pass the slide's precompiled timeline.word runs as activeWords to resolve
+ * the spoken word with one lookup per frame instead of testing every word.
+ */
 export const useKeywordHighlight = (
   timing?: AudioTiming,
-  keywords: KeywordSpec[] = [],
+  keywords: KeywordSpec[] = NO_KEYWORDS,
+  activeWords?: TimelineRuns,
 ) => {
   const frame = useCurrentFrame();
   const { fps } = useVideoConfig();
 
-  if (!timing) {
-    return [];
-  }
+  // Frame windows and keyword flags only change with the inputs, not per frame.
+  const words = useMemo(() => {
+    if (!timing) return [];
+    const keywordSet = new Set(keywords.map((k) => normalize(k.text)).filter(Boolean));
+    return (timing.words ?? []).map((word) => ({
+      text: word.text,
+      startFrame: secToFrames(word.start, fps),
+      endFrame: secToFrames(word.end, fps),
+      isKeyword: keywordSet.has(normalize(word.text)),
+    }));
+  }, [timing, keywords, fps]);
 
-  const keywordSet = new Set(keywords.map((k) => normalize(k.text)).filter(Boolean));
+  const activeIndex = activeWords ? lookupRun(activeWords, frame) : -1;
 
-  return timing.words.map((word) => {
-    const startFrame = secToFrames(word.start, fps);
-    const endFrame = secToFrames(word.end, fps);
-    const isActive = frame >= startFrame && frame <= endFrame;
-    const isKeyword = keywordSet.has(normalize(word.text));
-    return {
-      text: word.text,
-      startFrame,
-      endFrame,
-      isActive,
-      isKeyword,
-    };
-  });
+  return words.map((word, index) => ({
+    ...word,
+    isActive: activeWords
+      ? index === activeIndex
+      : frame >= word.startFrame && frame <= word.endFrame,
+  }));
 };
@@ -0,0 +1,82 @@
+import { useCurrentFrame } from 'remotion';
+import {
+  AnimationBlock,
+  BlockHighlight,
+  SlideChoreography,
+  TimelineRuns,
+  WordTiming,
+} from '../types/choreography';
+
+/**
+ * Value of a run table at a frame: a binary search over the runs, so the
+ * cost per frame does not grow with the number of words or segments.
+ */
+export const lookupRun = (runs: TimelineRuns | undefined, frame: number): number => {
+  if (!runs || runs.frames.length === 0 || frame < runs.frames[0]) return -1;
+  let lo = 0;
+  let hi = runs.frames.length - 1;
+  while (lo < hi) {
+    const mid = (lo + hi + 1) >> 1;
+    if (runs.frames[mid] <= frame) {
+      lo = mid;
+    } else {
+      hi = mid - 1;
+    }
+  }
+  return runs.values[lo];
+};
+
+/**
+ * A block's narrative highlight: an index lookup through the timeline, or a
+ * scan of the list for choreography generated before timelines existed.
+ */
+export const getBlockHighlight = (
+  choreography: SlideChoreography | null | undefined,
+  blockId: string,
+): BlockHighlight | undefined => {
+  if (!choreography) return undefined;
+  if (!choreography.timeline) {
+    return choreography.highlights?.find((h) => h.blockId === blockId);
+  }
+  const block = choreography.timeline.blocks[blockId];
+  return block ? choreography.highlights?.[block.highlight] : undefined;
+};
+
+/** A block's (first) entrance animation, resolved like getBlockHighlight. */
+export const getBlockAnimation = (
+  choreography: SlideChoreography | null | undefined,
+  blockId: string,
+): AnimationBlock | undefined => {
+  if (!choreography) return undefined;
+  if (!choreography.timeline) {
+    return choreography.animations?.find((a) => a.blockId === blockId);
+  }
+  const entry = choreography.timeline.animations[blockId];
+  return entry ? choreography.animations[entry.index] : undefined;
+};
+
+/** Scan fallback for useActiveWordIndex: the latest-starting word whose window holds frame. */
+const findActiveWord = (wordTimings: WordTiming[] | undefined, frame: number): number => {
+  if (!wordTimings) return -1;
+  for (let index = wordTimings.length - 1; index >= 0; index -= 1) {
+    const word = wordTimings[index];
+    if (frame >= word.startFrame && frame <= word.endFrame) return index;
+  }
+  return -1;
+};
+
+/**
+ * Index into narration.wordTimings of the word being spoken, or -1. Word
+ * frames are relative to the narration, so pass the frame the narration
+ * starts at when the slide plays it with an offset.
+ */
+export const useActiveWordIndex = (
+  choreography: SlideChoreography | null | undefined,
+  narrationOffset = 0,
+): number => {
+  const frame = useCurrentFrame() - narrationOffset;
+  if (!choreography?.timeline) {
+    return findActiveWord(choreography?.narration?.wordTimings, frame);
+  }
+  return lookupRun(choreography.timeline.word, frame);
+};
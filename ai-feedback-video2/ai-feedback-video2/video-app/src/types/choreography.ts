@@ -64,7 +64,19 @@ export interface NarrationConfig {
   startFrame: number;
   durationSec: number;
   endFrame?: number;
-  wordTimings: WordTiming[];
+  wordTimings: WordTiming[];  // filled in from wordTable by useSlideChoreography
+  wordTable?: string;         // id of the shared table in data/word_tables
+}
+
+/** Columnar word timings shared between choreography files (word_tables/<id>.json) */
+export interface WordTable {
+  version: number;
+  id: string;
+  fps: number;
+  word: string[];
+  startFrame: number[];
+  endFrame: number[];
+  durationFrames?: number[];  // absent in version 1 tables (endFrame - startFrame)
 }
 
 export interface HighlightConfig {
@@ -86,16 +98,45 @@ export interface HighlightSegment {
   text?: string | null;
   startFrame: number;
   endFrame: number;
+  confidence?: number;  // 0-1 alignment confidence; low values were placed between neighbouring segments
+}
+
+/**
+ * Run-length encoded per-frame table: values[k] holds from frames[k] until
+ * frames[k + 1]; -1 means nothing is active.
+ */
+export interface TimelineRuns {
+  frames: number[];
+  values: number[];
+}
+
+export interface BlockTimeline {
+  highlight: number;       // index into SlideChoreography.highlights
+}
+
+export interface AnimationTimeline {
+  index: number;           // index into SlideChoreography.animations (first one for the block)
+}
+
+/** Precompiled by calculate_choreography.py (choreography_timeline.py) */
+export interface SlideTimeline {
+  version: number;
+  frames: number;
+  word: TimelineRuns;      // index into narration.wordTimings
+  blocks: Record<string, BlockTimeline>;
+  animations: Record<string, AnimationTimeline>;
 }
 
 export interface SlideChoreography {
   slideId: string;
   slideType: string;
+  fps?: number;                   // frame rate every frame number in this file is quantized to
   totalDurationFrames: number;
   narration?: NarrationConfig;
   animations: AnimationBlock[];
   highlighting?: HighlightConfig;
   highlights?: BlockHighlight[];  // Narrative-driven block highlights
+  timeline?: SlideTimeline;
 }
 
 export interface ChoreographyManifest {
@@ -7,6 +7,7 @@ export interface WordTiming {
 export interface AudioTiming {
   audio_file: string;
   durationSec: number;
-  words: WordTiming[];
+  // Published timings/*.json only carry the clip summary; word timings live in word_tables/
+  words?: WordTiming[];
 }
 